@@ -0,0 +1,96 @@
+"""Microbenchmark of the simulator <-> environment handoff: three Queue(maxsize=1)
+(observation, info and action) against the single-slot ExchangeChannel.
+
+The EnergyPlus thread is replaced by a Python thread doing the same handoff
+sequence as the simulator callbacks, so only the communication cost is measured.
+"""
+import argparse
+import resource
+import threading
+import time
+from queue import Queue
+
+from sinergym.simulators.eplus import ExchangeChannel
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--steps', '-s', type=int, default=100000)
+parser.add_argument('--repetitions', '-r', type=int, default=3)
+args = parser.parse_args()
+
+OBS = {'outdoor_temperature': 10.0, 'air_temperature': 21.0}
+INFO = {'month': 1, 'day': 1, 'hour': 0}
+ACTION = [21.0, 25.0]
+
+
+def context_switches() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def run_queues(steps: int):
+    obs_queue, info_queue, act_queue = Queue(
+        maxsize=1), Queue(maxsize=1), Queue(maxsize=1)
+
+    def _simulator():
+        for _ in range(steps):
+            obs_queue.put(OBS)
+            info_queue.put(INFO)
+            act_queue.get()
+        obs_queue.put(None)
+        info_queue.put(None)
+
+    thread = threading.Thread(target=_simulator, daemon=True)
+    switches = context_switches()
+    begin = time.perf_counter()
+    thread.start()
+    obs_queue.get()
+    info_queue.get()
+    while True:
+        act_queue.put(ACTION)
+        obs = obs_queue.get()
+        info_queue.get()
+        if obs is None:
+            break
+    elapsed = time.perf_counter() - begin
+    thread.join()
+    return elapsed, context_switches() - switches
+
+
+def run_channel(steps: int):
+    channel = ExchangeChannel()
+
+    def _simulator():
+        for _ in range(steps):
+            channel.put_observation(OBS, INFO)
+            channel.get_action()
+        channel.close()
+
+    thread = threading.Thread(target=_simulator, daemon=True)
+    switches = context_switches()
+    begin = time.perf_counter()
+    thread.start()
+    channel.get_observation()
+    while True:
+        channel.put_action(ACTION)
+        obs, _ = channel.get_observation()
+        if obs is None:
+            break
+    elapsed = time.perf_counter() - begin
+    thread.join()
+    return elapsed, context_switches() - switches
+
+
+results = {}
+for name, function in [('Queue x3', run_queues),
+                       ('ExchangeChannel', run_channel)]:
+    runs = [function(args.steps) for _ in range(args.repetitions)]
+    best_time, best_switches = min(runs)
+    results[name] = (best_time / args.steps * 1e6, best_switches / args.steps)
+
+print('====================================================')
+print('HANDOFF COST WITH ', args.steps, ' STEPS (BEST OF ',
+      args.repetitions, '):')
+print('====================================================')
+for key, (latency, switches) in results.items():
+    print('{:<20}: {:.2f} us/step, {:.2f} context switches/step'.format(
+        key, latency, switches))
@@ -0,0 +1,78 @@
+"""Benchmark of lean output mode (config_params['lean_output']): wall-clock time and
+bytes written in the episode directory per episode, with and without report objects
+and EnergyPlus output files.
+"""
+import argparse
+import os
+import shutil
+import time
+from glob import glob
+
+import gymnasium as gym
+import numpy as np
+
+import sinergym
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    '--environments',
+    '-envs',
+    default=['Eplus-5zone-hot-continuous-v1',
+             'Eplus-office-hot-continuous-v1'],
+    nargs='+')
+parser.add_argument('--episodes', '-ep', type=int, default=1)
+parser.add_argument(
+    '--runperiod',
+    '-rp',
+    type=int,
+    nargs=6,
+    default=[1, 1, 1991, 31, 1, 1991],
+    help='start_day start_month start_year end_day end_month end_year')
+args = parser.parse_args()
+results = {}
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, filename))
+               for root, _, filenames in os.walk(path) for filename in filenames)
+
+
+for env_id in args.environments:
+    for lean_output in [False, True]:
+        env = gym.make(
+            env_id,
+            config_params={
+                'runperiod': tuple(args.runperiod),
+                'lean_output': lean_output,
+                'sizing_cache': False})
+        durations, sizes = [], []
+        for _ in range(args.episodes):
+            begin = time.perf_counter()
+            env.reset()
+            truncated = terminated = False
+            while not (terminated or truncated):
+                obs, reward, terminated, truncated, info = env.step(
+                    env.action_space.sample())
+            # Stop simulation (output files closed)
+            env.get_wrapper_attr('energyplus_simulator').stop()
+            durations.append(time.perf_counter() - begin)
+            sizes.append(directory_size(env.get_wrapper_attr('episode_path')))
+        env.close()
+        results['{} ({})'.format(env_id, 'lean' if lean_output else 'full')] = (
+            np.mean(durations), np.mean(sizes) / 1e6)
+
+        # Rename directory with name TEST for future remove
+        os.rename(env.get_wrapper_attr('workspace_path'), 'Eplus-env-TEST' +
+                  env.get_wrapper_attr('workspace_path').split('/')[-1])
+
+print('====================================================')
+print('EPISODE TIME AND OUTPUT SIZE (', args.episodes,
+      ' EPISODE(S), RUNPERIOD ', args.runperiod, '):')
+print('====================================================')
+for key, (duration, size) in results.items():
+    print('{:<50}: {:.2f} s/episode, {:.2f} MB/episode'.format(key, duration, size))
+
+# Deleting all temporal directories generated during benchmark
+directories = glob('Eplus-env-TEST*/')
+for directory in directories:
+    shutil.rmtree(directory)
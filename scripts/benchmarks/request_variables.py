@@ -0,0 +1,81 @@
+"""Benchmark of observed variables registration: timestep Output:Variable/Output:Meter
+objects in the building model against variables requested through the EnergyPlus API
+(config_params['request_variables']). Wall-clock time per episode and size of the
+episode EnergyPlus output are compared.
+"""
+import argparse
+import os
+import shutil
+import time
+from glob import glob
+
+import gymnasium as gym
+import numpy as np
+
+import sinergym
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    '--environment',
+    '-env',
+    type=str,
+    default='Eplus-office-hot-continuous-v1')
+parser.add_argument('--episodes', '-ep', type=int, default=1)
+parser.add_argument(
+    '--runperiod',
+    '-rp',
+    type=int,
+    nargs=6,
+    default=[1, 1, 1991, 31, 1, 1991],
+    help='start_day start_month start_year end_day end_month end_year')
+args = parser.parse_args()
+results = {}
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, filename))
+               for root, _, filenames in os.walk(path) for filename in filenames)
+
+
+for request_variables in [False, True]:
+    env = gym.make(
+        args.environment,
+        config_params={
+            'runperiod': tuple(args.runperiod),
+            'request_variables': request_variables,
+            'sizing_cache': False})
+    n_variables = len(env.get_wrapper_attr('variables'))
+    durations, sizes = [], []
+    for _ in range(args.episodes):
+        begin = time.perf_counter()
+        env.reset()
+        truncated = terminated = False
+        while not (terminated or truncated):
+            obs, reward, terminated, truncated, info = env.step(
+                env.action_space.sample())
+        # Stop simulation (output files closed)
+        env.get_wrapper_attr('energyplus_simulator').stop()
+        durations.append(time.perf_counter() - begin)
+        sizes.append(directory_size(
+            env.get_wrapper_attr('episode_path') + '/output'))
+    env.close()
+    mode = 'API request' if request_variables else 'Output:Variable'
+    results['{} variables ({})'.format(n_variables, mode)] = (
+        np.mean(durations), np.mean(sizes) / 1e6)
+
+    # Rename directory with name TEST for future remove
+    os.rename(env.get_wrapper_attr('workspace_path'), 'Eplus-env-TEST' +
+              env.get_wrapper_attr('workspace_path').split('/')[-1])
+
+print('====================================================')
+print(args.environment, ' (', args.episodes, ' EPISODE(S), RUNPERIOD ',
+      args.runperiod, '):')
+print('====================================================')
+for key, (duration, size) in results.items():
+    print('{:<35}: {:.2f} s/episode, {:.2f} MB of output/episode'.format(
+        key, duration, size))
+
+# Deleting all temporal directories generated during benchmark
+directories = glob('Eplus-env-TEST*/')
+for directory in directories:
+    shutil.rmtree(directory)
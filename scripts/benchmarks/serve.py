@@ -0,0 +1,155 @@
+"""Benchmark of the environment server (sinergym.serve): step latency of the environment in the agent process
+against RemoteEnv over TCP and Unix sockets (with and without infos), and environment steps per second of
+batched EnvClient steps of all the environments hosted by the server. Servers run in child processes
+(python -m sinergym.serve).
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from glob import glob
+
+import gymnasium as gym
+import numpy as np
+
+import sinergym
+from sinergym.serve import EnvClient, RemoteEnv
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    '--environment',
+    '-env',
+    type=str,
+    default='Eplus-5zone-hot-continuous-v1')
+parser.add_argument('--episodes', '-ep', type=int, default=1)
+parser.add_argument(
+    '--num_envs',
+    '-n',
+    type=int,
+    default=8,
+    help='Environments hosted by the server in the batched run.')
+parser.add_argument(
+    '--port',
+    '-p',
+    type=int,
+    default=7879)
+parser.add_argument(
+    '--runperiod',
+    '-rp',
+    type=int,
+    nargs=6,
+    default=[1, 1, 1991, 31, 1, 1991],
+    help='start_day start_month start_year end_day end_month end_year')
+args = parser.parse_args()
+results = {}
+env_kwargs = {'config_params': {'runperiod': tuple(args.runperiod)},
+              'progress': 'off'}
+unix_path = os.path.join(tempfile.mkdtemp(), 'sinergym.sock')
+
+
+def start_server(num_envs: int, unix: bool) -> subprocess.Popen:
+    if unix:
+        address = ['--unix_path', unix_path]
+    else:
+        address = ['--port', str(args.port)]
+    return subprocess.Popen([sys.executable, '-m', 'sinergym.serve',
+                             '--environment', args.environment,
+                             '--num_envs', str(num_envs),
+                             '--env_kwargs', json.dumps(env_kwargs)] + address)
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.terminate()
+    server.wait()
+
+
+def run_episodes(env: gym.Env) -> list:
+    latencies = []
+    for _ in range(args.episodes):
+        env.reset()
+        truncated = terminated = False
+        while not (terminated or truncated):
+            action = env.action_space.sample()
+            step_begin = time.perf_counter()
+            obs, reward, terminated, truncated, info = env.step(action)
+            latencies.append(time.perf_counter() - step_begin)
+    return latencies
+
+
+workspaces = []
+
+# Environment in the agent process
+env = gym.make(args.environment, **env_kwargs)
+begin = time.perf_counter()
+latencies = run_episodes(env)
+duration = time.perf_counter() - begin
+env.close()
+results['in-process'] = (latencies, duration, 1)
+workspaces.append(env.get_wrapper_attr('workspace_path'))
+
+# One environment in a server, used by RemoteEnv
+for mode, unix, infos in [('tcp', False, True),
+                          ('tcp-noinfo', False, False),
+                          ('unix', True, True),
+                          ('unix-noinfo', True, False)]:
+    server = start_server(1, unix)
+    env = RemoteEnv(unix_path if unix else ('127.0.0.1', args.port),
+                    infos=infos)
+    begin = time.perf_counter()
+    latencies = run_episodes(env)
+    duration = time.perf_counter() - begin
+    env.close()
+    stop_server(server)
+    results[mode] = (latencies, duration, 1)
+    workspaces.append(env.workspace_path)
+
+# Batched steps of all the environments hosted by a server
+server = start_server(args.num_envs, False)
+client = EnvClient(('127.0.0.1', args.port))
+indices = list(range(args.num_envs))
+latencies = []
+begin = time.perf_counter()
+for _ in range(args.episodes):
+    client.reset(indices, infos=False)
+    truncated = terminated = np.zeros(args.num_envs, dtype=bool)
+    while not (terminated.any() or truncated.any()):
+        actions = [client.action_space.sample() for _ in indices]
+        step_begin = time.perf_counter()
+        obs, rewards, terminated, truncated, _ = client.step(
+            indices, actions, infos=False)
+        latencies.append(time.perf_counter() - step_begin)
+duration = time.perf_counter() - begin
+workspaces.extend([env_spec['workspace_path']
+                  for env_spec in client.spec['envs']])
+client.close()
+stop_server(server)
+results['tcp-batch-' + str(args.num_envs)] = (latencies,
+                                              duration, args.num_envs)
+
+# Rename directories with name TEST for future remove
+for workspace_path in workspaces:
+    os.rename(workspace_path, 'Eplus-env-TEST' +
+              workspace_path.split('/')[-1])
+
+print('====================================================')
+print(args.environment, ' (', args.episodes, ' EPISODE(S), RUNPERIOD ',
+      args.runperiod, '):')
+print('====================================================')
+print('{:<14} {:>12} {:>12} {:>14}'.format(
+    'Mode', 'Mean (ms)', 'p99 (ms)', 'Env steps/s'))
+for mode, (latencies, duration, num_envs) in results.items():
+    print('{:<14} {:>12.3f} {:>12.3f} {:>14.1f}'.format(
+        mode,
+        np.mean(latencies) * 1000,
+        np.percentile(latencies, 99) * 1000,
+        len(latencies) * num_envs / duration))
+
+# Deleting all temporal directories generated during benchmark
+directories = glob('Eplus-env-TEST*/')
+for directory in directories:
+    shutil.rmtree(directory)
+shutil.rmtree(os.path.dirname(unix_path))
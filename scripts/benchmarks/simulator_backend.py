@@ -0,0 +1,96 @@
+"""Benchmark of simulator backends (simulator_backend): EnergyPlus in a thread of the agent process against
+EnergyPlus in a child process (shared memory exchange). Step latency is measured in the agent loop while a
+learner thread runs pure Python work, whose throughput shows the GIL contention with EnergyPlus callbacks.
+"""
+import argparse
+import os
+import shutil
+import threading
+import time
+from glob import glob
+
+import gymnasium as gym
+import numpy as np
+
+import sinergym
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    '--environment',
+    '-env',
+    type=str,
+    default='Eplus-5zone-hot-continuous-v1')
+parser.add_argument('--episodes', '-ep', type=int, default=1)
+parser.add_argument(
+    '--runperiod',
+    '-rp',
+    type=int,
+    nargs=6,
+    default=[1, 1, 1991, 31, 1, 1991],
+    help='start_day start_month start_year end_day end_month end_year')
+parser.add_argument(
+    '--no_learner',
+    action='store_true',
+    help='Do not run the learner thread (step latency without contention).')
+args = parser.parse_args()
+results = {}
+
+
+def learner(stop: threading.Event, counter: list) -> None:
+    # Pure Python work (holds the GIL), as the learner update loop
+    weights = [0.0] * 256
+    while not stop.is_set():
+        for i in range(len(weights)):
+            weights[i] = weights[i] * 0.99 + 0.01 * i
+        counter[0] += 1
+
+
+for backend in ['thread', 'process']:
+    env = gym.make(
+        args.environment,
+        config_params={'runperiod': tuple(args.runperiod)},
+        simulator_backend=backend,
+        progress='off')
+    latencies = []
+    stop, counter = threading.Event(), [0]
+    learner_thread = threading.Thread(target=learner, args=(stop, counter))
+    if not args.no_learner:
+        learner_thread.start()
+    begin = time.perf_counter()
+    for _ in range(args.episodes):
+        env.reset()
+        truncated = terminated = False
+        while not (terminated or truncated):
+            action = env.action_space.sample()
+            step_begin = time.perf_counter()
+            obs, reward, terminated, truncated, info = env.step(action)
+            latencies.append(time.perf_counter() - step_begin)
+    duration = time.perf_counter() - begin
+    stop.set()
+    if not args.no_learner:
+        learner_thread.join()
+    env.close()
+    results[backend] = (
+        np.mean(latencies) * 1000,
+        np.percentile(latencies, 99) * 1000,
+        len(latencies) / duration,
+        counter[0] / duration)
+
+    # Rename directory with name TEST for future remove
+    os.rename(env.get_wrapper_attr('workspace_path'), 'Eplus-env-TEST' +
+              env.get_wrapper_attr('workspace_path').split('/')[-1])
+
+print('====================================================')
+print(args.environment, ' (', args.episodes, ' EPISODE(S), RUNPERIOD ',
+      args.runperiod, '):')
+print('====================================================')
+print('{:<10} {:>12} {:>12} {:>12} {:>16}'.format(
+    'Backend', 'Mean (ms)', 'p99 (ms)', 'Steps/s', 'Learner it/s'))
+for backend, (mean, p99, steps, learner_its) in results.items():
+    print('{:<10} {:>12.3f} {:>12.3f} {:>12.1f} {:>16.1f}'.format(
+        backend, mean, p99, steps, learner_its))
+
+# Deleting all temporal directories generated during benchmark
+directories = glob('Eplus-env-TEST*/')
+for directory in directories:
+    shutil.rmtree(directory)
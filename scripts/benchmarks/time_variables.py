@@ -0,0 +1,83 @@
+"""Benchmark of the observation callback (_collect_obs_and_info) cost depending
+on the number of time variables, comparing precompiled DataExchange accessors
+with the previous eval() based lookup in each timestep.
+"""
+import argparse
+import os
+import shutil
+import time
+from glob import glob
+
+import gymnasium as gym
+import numpy as np
+
+import sinergym
+
+TIME_VARIABLES = {
+    3: ['month', 'day_of_month', 'hour'],
+    6: ['month', 'day_of_month', 'hour', 'minutes', 'day_of_week',
+        'day_of_year']
+}
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    '--environment',
+    '-env',
+    type=str,
+    default='Eplus-5zone-hot-continuous-v1')
+parser.add_argument('--steps', '-s', type=int, default=2000)
+args = parser.parse_args()
+results = {}
+
+
+def eval_accessors(simulator, time_variables):
+    # Previous behaviour: Python source compiled again in each call
+    def accessor(name):
+        return lambda state: eval('simulator.exchange.' + name + '(state)',
+                                  {'simulator': simulator, 'state': state})
+    return [accessor(name) for name in time_variables]
+
+
+for n_variables, time_variables in TIME_VARIABLES.items():
+    for mode in ['eval', 'accessors']:
+        env = gym.make(args.environment, time_variables=time_variables)
+        simulator = env.get_wrapper_attr('energyplus_simulator')
+        if mode == 'eval':
+            simulator._time_accessors = eval_accessors(
+                simulator, time_variables)
+
+        # Measure callback body (callback is registered in reset)
+        durations = []
+        collect = simulator._collect_obs_and_info
+
+        def _timed_collect(state, collect=collect, durations=durations):
+            begin = time.perf_counter()
+            collect(state)
+            durations.append(time.perf_counter() - begin)
+
+        simulator._collect_obs_and_info = _timed_collect
+
+        env.reset()
+        for _ in range(args.steps):
+            env.step(env.action_space.sample())
+        env.close()
+
+        # Skip warmup calls (system not ready yet)
+        durations = durations[-args.steps:]
+        results['{} time variables ({})'.format(n_variables, mode)] = (
+            np.mean(durations) * 1e6, np.percentile(durations, 99) * 1e6)
+
+        # Rename directory with name TEST for future remove
+        os.rename(env.get_wrapper_attr('workspace_path'), 'Eplus-env-TEST' +
+                  env.get_wrapper_attr('workspace_path').split('/')[-1])
+
+print('====================================================')
+print('OBSERVATION CALLBACK TIME (', args.steps, ' STEPS):')
+print('====================================================')
+for key, (mean, p99) in results.items():
+    print('{:<35}: mean {:.2f} us, p99 {:.2f} us'.format(key, mean, p99))
+
+# Deleting all temporal directories generated during benchmark
+directories = glob('Eplus-env-TEST*/')
+for directory in directories:
+    shutil.rmtree(directory)
@@ -0,0 +1,104 @@
+"""Benchmark of vectorized environments: SinergymThreadedVectorEnv (N EnergyPlus states in threads of one process),
+SinergymSubprocVectorEnv (one spawned process per environment, observations in shared memory, with and without infos)
+and Gymnasium AsyncVectorEnv (one subprocess per environment, observations and infos pickled through pipes).
+Environment steps per second (all environments) and creation time are measured for each number of environments.
+"""
+import argparse
+import os
+import shutil
+import time
+from glob import glob
+
+import gymnasium as gym
+
+import sinergym
+from sinergym.envs import SinergymSubprocVectorEnv, SinergymThreadedVectorEnv
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    '--environment',
+    '-env',
+    type=str,
+    default='Eplus-5zone-hot-continuous-v1')
+parser.add_argument(
+    '--num_envs',
+    '-n',
+    type=int,
+    nargs='+',
+    default=[1, 2, 4, 8, 16, 32])
+parser.add_argument(
+    '--steps',
+    '-st',
+    type=int,
+    default=2000,
+    help='Vector steps measured (after reset).')
+parser.add_argument(
+    '--runperiod',
+    '-rp',
+    type=int,
+    nargs=6,
+    default=[1, 1, 1991, 31, 3, 1991],
+    help='start_day start_month start_year end_day end_month end_year')
+args = parser.parse_args()
+results = {}
+
+
+def make_env():
+    return gym.make(
+        args.environment,
+        config_params={'runperiod': tuple(args.runperiod)},
+        progress='off')
+
+
+vectorizations = {
+    'threaded': lambda n: SinergymThreadedVectorEnv([make_env] * n),
+    'shm': lambda n: SinergymSubprocVectorEnv(
+        args.environment, n, env_kwargs={
+            'config_params': {'runperiod': tuple(args.runperiod)},
+            'progress': 'off'}),
+    'shm-noinfo': lambda n: SinergymSubprocVectorEnv(
+        args.environment, n, env_kwargs={
+            'config_params': {'runperiod': tuple(args.runperiod)},
+            'progress': 'off'}, infos=False),
+    'subprocess': lambda n: gym.vector.AsyncVectorEnv([make_env] * n)}
+
+# Sub-environments of SinergymSubprocVectorEnv are spawned processes
+# (which import this module)
+if __name__ == '__main__':
+    for num_envs in args.num_envs:
+        for mode, make_vector_env in vectorizations.items():
+            begin = time.perf_counter()
+            envs = make_vector_env(num_envs)
+            creation_time = time.perf_counter() - begin
+            envs.reset(seed=0)
+            begin = time.perf_counter()
+            for _ in range(args.steps):
+                envs.step(envs.action_space.sample())
+            duration = time.perf_counter() - begin
+            # Sub-environments of SinergymSubprocVectorEnv are in its workspace
+            workspaces = [envs.workspace_path] if isinstance(
+                envs, SinergymSubprocVectorEnv) else envs.get_attr('workspace_path')
+            envs.close()
+            results[(num_envs, mode)] = (
+                args.steps * num_envs / duration, creation_time)
+
+            # Rename directories with name TEST for future remove
+            for workspace_path in workspaces:
+                os.rename(workspace_path, 'Eplus-env-TEST' +
+                          workspace_path.split('/')[-1])
+
+    print('====================================================')
+    print(args.environment, ' (', args.steps, ' VECTOR STEPS, RUNPERIOD ',
+          args.runperiod, '):')
+    print('====================================================')
+    print('{:<8} {:<12} {:>14} {:>12} {:>14}'.format(
+        'N', 'Mode', 'Env steps/s', 'Speedup', 'Creation (s)'))
+    for (num_envs, mode), (throughput, creation_time) in results.items():
+        speedup = throughput / results[(args.num_envs[0], mode)][0]
+        print('{:<8} {:<12} {:>14.1f} {:>12.2f} {:>14.2f}'.format(
+            num_envs, mode, throughput, speedup, creation_time))
+
+    # Deleting all temporal directories generated during benchmark
+    directories = glob('Eplus-env-TEST*/')
+    for directory in directories:
+        shutil.rmtree(directory)
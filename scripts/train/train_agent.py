@@ -7,20 +7,24 @@ from datetime import datetime
 import gymnasium as gym
 import numpy as np
 import wandb
+from gymnasium.vector import AutoresetMode
 from stable_baselines3 import *
 from stable_baselines3.common.callbacks import CallbackList
 from stable_baselines3.common.logger import HumanOutputFormat
 from stable_baselines3.common.logger import Logger as SB3Logger
 from stable_baselines3.common.monitor import Monitor
 from stable_baselines3.common.noise import NormalActionNoise
+from stable_baselines3.common.vec_env import VecMonitor
 
 import sinergym
 import sinergym.utils.gcloud as gcloud
+from sinergym.envs import SinergymSubprocVectorEnv
 from sinergym.utils.callbacks import *
 from sinergym.utils.common import is_wrapped
 from sinergym.utils.constants import *
 from sinergym.utils.logger import WandBOutputFormat
 from sinergym.utils.rewards import *
+from sinergym.utils.vec_env import SinergymVecEnv
 from sinergym.utils.wrappers import *
 
 # ---------------------------------------------------------------------------- #
@@ -129,9 +133,35 @@ try:
     # ---------------------------------------------------------------------------- #
     # For this script, the execution name will be updated
     env_params.update({'env_name': experiment_name})
-    env = gym.make(
-        conf['environment'],
-        ** env_params)
+    num_envs = conf.get('num_envs', 1)
+    if num_envs > 1:
+        # Sub-environments in spawned processes (shared memory observations),
+        # each one in worker-<i> directory of the experiment directory
+        assert not conf.get('evaluation') and 'WandBLogger' not in conf.get(
+            'wrappers', {}), 'Evaluation and WandBLogger require a single environment (num_envs = 1).'
+        # Wrappers are applied in each sub-environment (parsed here, workers
+        # do not run this script)
+        wrappers = []
+        for key, parameters in conf.get('wrappers', {}).items():
+            wrappers.append((eval(key), {
+                name: eval(value) if isinstance(value, str) and '.' in value else value
+                for name, value in parameters.items()}))
+
+        def apply_wrappers(env: gym.Env) -> gym.Env:
+            for wrapper_class, parameters in wrappers:
+                env = wrapper_class(env=env, ** parameters)
+            return env
+
+        env = VecMonitor(SinergymVecEnv(SinergymSubprocVectorEnv(
+            conf['environment'],
+            num_envs,
+            env_kwargs=env_params,
+            wrappers=apply_wrappers,
+            autoreset_mode=AutoresetMode.SAME_STEP)))
+    else:
+        env = gym.make(
+            conf['environment'],
+            ** env_params)
 
     # env for evaluation if enabled
     eval_env = None
@@ -146,7 +176,7 @@ try:
     # ---------------------------------------------------------------------------- #
     #                                   Wrappers                                   #
     # ---------------------------------------------------------------------------- #
-    if conf.get('wrappers'):
+    if conf.get('wrappers') and num_envs == 1:
         for key, parameters in conf['wrappers'].items():
             wrapper_class = eval(key)
             for name, value in parameters.items():
@@ -309,7 +339,7 @@ try:
     # If the environment is not closed, this script will do it in
     # order to correctly log all the simulation data (Energyplus + Sinergym
     # logs)
-    if env.get_wrapper_attr('is_running'):
+    if num_envs > 1 or env.get_wrapper_attr('is_running'):
         env.close()
 
     # ---------------------------------------------------------------------------- #
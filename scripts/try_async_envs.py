@@ -0,0 +1,64 @@
+import asyncio
+import logging
+import threading
+
+import gymnasium as gym
+import numpy as np
+
+import sinergym
+from sinergym.utils.logger import TerminalLogger
+
+# Logger
+terminal_logger = TerminalLogger()
+logger = terminal_logger.getLogger(
+    name='MAIN',
+    level=logging.INFO
+)
+
+NUM_ENVS = 16
+
+
+async def policy(
+        obs: np.ndarray,
+        action_space: gym.spaces.Space) -> np.ndarray:
+    # Stand-in for a request to a remote policy server
+    await asyncio.sleep(0.001)
+    return action_space.sample()
+
+
+async def run_episode(env: gym.Env, seed: int) -> float:
+    # Coroutines of the unwrapped environment, pending steps wait in the
+    # event loop (a future resolved by the EnergyPlus thread)
+    env = env.unwrapped
+    obs, info = await env.async_reset(seed=seed)
+    rewards = []
+    truncated = terminated = False
+    while not (terminated or truncated):
+        action = await policy(obs, env.action_space)
+        obs, reward, terminated, truncated, info = await env.async_step(action)
+        rewards.append(reward)
+    logger.info(
+        'Environment {} - Mean reward: {} - Cumulative Reward: {}'.format(
+            seed, np.mean(rewards), sum(rewards)))
+    return sum(rewards)
+
+
+async def main() -> None:
+    # One month episodes
+    envs = [gym.make('Eplus-5zone-hot-continuous-v1',
+                     config_params={'runperiod': (1, 1, 1991, 31, 1, 1991)},
+                     progress='off') for _ in range(NUM_ENVS)]
+    # All environments are driven by this loop (no executor): only EnergyPlus
+    # threads run besides the main thread
+    episodes = [asyncio.create_task(run_episode(env, seed))
+                for seed, env in enumerate(envs)]
+    await asyncio.sleep(1)
+    logger.info('Threads running: {}'.format(threading.active_count()))
+    rewards = await asyncio.gather(*episodes)
+    logger.info('Mean cumulative reward of {} environments: {}'.format(
+        NUM_ENVS, np.mean(rewards)))
+    for env in envs:
+        env.close()
+
+
+asyncio.run(main())
@@ -1,3 +1,4 @@
 """Modeling python objects about simulation (building, weather, etc)."""
 
 from .modeling import ModelJSON
+from .sizing import SizingCache
@@ -3,20 +3,76 @@ import fcntl
 import json
 import os
 import random
-from copy import deepcopy
-from shutil import rmtree
-from typing import Any, Dict, List, Optional, Tuple, Union
+import tempfile
+from copy import copy, deepcopy
+from shutil import copytree, rmtree
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 from eppy.modeleditor import IDF
 from epw.weather import Weather
 
+from sinergym.config.sizing import SizingCache
 from sinergym.utils.common import (eppy_element_to_dict, get_delta_seconds,
                                    ornstein_uhlenbeck_process)
 from sinergym.utils.constants import (CWD, LOG_MODEL_LEVEL, PKG_DATA_PATH,
                                       WEEKDAY_ENCODING, YEAR)
 from sinergym.utils.logger import TerminalLogger
 
+# Report object types removed in lean output mode (prefixes); only
+# Output:Variable and Output:Meter (required by simulator handles) remain
+LEAN_OUTPUT_REMOVED_OBJECTS = (
+    'Output:SQLite',
+    'Output:JSON',
+    'Output:Table:',
+    'OutputControl:Table:Style',
+    'OutputControl:IlluminanceMap:Style',
+    'OutputControl:ReportingTolerances',
+    'Output:VariableDictionary',
+    'Output:Surfaces:',
+    'Output:Constructions',
+    'Output:Schedules',
+    'Output:EnergyManagementSystem',
+    'Output:Meter:MeterFileOnly',
+    'Output:Meter:Cumulative',
+    'Output:EnvironmentalImpactFactors',
+    'Output:IlluminanceMap',
+    'Output:DebuggingData')
+
+# Output files disabled in lean output mode (eio and err files are kept,
+# eio is used by sizing cache)
+LEAN_OUTPUT_FILES = {
+    'output_csv': 'No',
+    'output_mtr': 'No',
+    'output_eso': 'No',
+    'output_tabular': 'No',
+    'output_sqlite': 'No',
+    'output_json': 'No',
+    'output_audit': 'No',
+    'output_zone_sizing': 'No',
+    'output_system_sizing': 'No',
+    'output_dxf': 'No',
+    'output_bnd': 'No',
+    'output_rdd': 'No',
+    'output_mdd': 'No',
+    'output_mtd': 'No',
+    'output_shd': 'No',
+    'output_dfs': 'No',
+    'output_edd': 'No',
+    'output_sln': 'No',
+    'output_sci': 'No',
+    'output_wrl': 'No',
+    'output_screen': 'No',
+    'output_extshd': 'No'}
+
+# RAM workspace default options (config_params['ram_workspace'])
+RAM_WORKSPACE_DEFAULTS = {
+    'path': '/dev/shm',
+    'persist': 'monitor',
+    'persist_on': 'episode_end'}
+RAM_WORKSPACE_PERSIST = ('none', 'monitor', 'all')
+RAM_WORKSPACE_PERSIST_ON = ('episode_end', 'close')
+
 
 class ModelJSON(object):
     """Class to manage backend models (building, weathers...) and folders in Sinergym (JSON version).
@@ -32,6 +88,9 @@ class ModelJSON(object):
         :param experiment_path: Path for Sinergym experiment output.
         :param episode_path: Path for Sinergym specific episode (before first simulator reset this param is None).
         :param max_ep_store: Number of episodes directories will be stored in experiment_path.
+        :param protected_episode_paths: Episode directories which are not removed by max_ep_store rotation while they are in use.
+        :param ram_workspace: RAM workspace options (path, persist and persist_on) or None if episode directories are created in experiment_path.
+        :param episode_workspace_path: Path where episode directories are created (experiment_path or a directory in RAM workspace path).
         :param config: Dict config with extra configuration which is required to modify building model (may be None).
         :param building: Building model (Dictionary extracted from JSON).
         :param ddy_model: eppy object with DDY model.
@@ -57,7 +116,8 @@ class ModelJSON(object):
             meters: Dict[str, str],
             actuators: Dict[str, Tuple[str, str, str]],
             max_ep_store: int,
-            extra_config: Dict[str, Any]):
+            extra_config: Dict[str, Any],
+            workspace_path: Optional[str] = None):
         """Constructor. Variables, meters and actuators are required to update building model scheme.
 
         Args:
@@ -69,6 +129,7 @@ class ModelJSON(object):
             actuators (Dict[str, Tuple[str, str, str]]): Specification for EnergyPlus Input Actuators. The key name is custom, then value is a tuple with actuator type, value type and original actuator name.
             max_ep_store (int): Number of episodes directories will be stored in experiment_path.
             extra_config (Dict[str, Any]): Dict config with extra configuration which is required to modify building model (may be None).
+            workspace_path (Optional[str], optional): Experiment directory to use instead of a new Eplus-env-<env_name>-res<N> directory in CWD (e.g. a fixed directory for each worker of a vector environment). Defaults to None.
         """
         self.pkg_data_path = PKG_DATA_PATH
         # ----------------------- Transform filenames in paths ----------------------- #
@@ -107,9 +168,17 @@ class ModelJSON(object):
         # ----------------------------- Other attributes ----------------------------- #
 
         # Output paths and config
-        self.experiment_path = self._set_experiment_working_dir(env_name)
+        if workspace_path is None:
+            self.experiment_path = self._set_experiment_working_dir(env_name)
+        else:
+            self.experiment_path = self._set_fixed_working_dir(
+                workspace_path)
         self.episode_path: Optional[str] = None
         self.max_ep_store = max_ep_store
+        # Episode directories skipped by max_ep_store rotation (e.g. output of
+        # a simulation which continues in next episodes, or of a simulator
+        # parked in a simulator pool)
+        self.protected_episode_paths: Set[str] = set()
         self.config = extra_config
 
         # Input/Output varibles
@@ -128,6 +197,27 @@ class ModelJSON(object):
         self._check_eplus_config()
         self.logger.info('Model Config is correct.')
 
+        # Sizing cache (disabled by default, True or a path can be specified)
+        sizing_cache = (self.config or {}).get('sizing_cache', False)
+        if sizing_cache is False:
+            self.sizing_cache: Optional[SizingCache] = None
+        elif sizing_cache is True:
+            self.sizing_cache = SizingCache()
+        else:
+            self.sizing_cache = SizingCache(path=sizing_cache)
+        # Episode building paths pending of sizing capture: path -> cache key
+        self._pending_sizing: Dict[str, str] = {}
+
+        # Episode directories in RAM (tmpfs) if specified, artifacts are
+        # copied to experiment_path according to persistence policy
+        ram_workspace = (self.config or {}).get('ram_workspace')
+        if ram_workspace is None:
+            self.ram_workspace: Optional[Dict[str, str]] = None
+            self.episode_workspace_path = self.experiment_path
+        else:
+            self.ram_workspace = dict(RAM_WORKSPACE_DEFAULTS, **ram_workspace)
+            self.episode_workspace_path = self._set_ram_workspace_dir()
+
         # ------------- Apply adaptations in building model automatically ------------ #
         self.adapt_building_to_variables()
         self.adapt_building_to_meters()
@@ -196,7 +286,15 @@ class ModelJSON(object):
 
     def adapt_building_to_variables(self) -> None:
         """This method reads all variables and write it in the building model as Output:Variable field.
+           If variables are requested through EnergyPlus API (request_variables extra config), Output:Variable
+           objects are removed instead (variables are not reported in output files).
         """
+        if (self.config or {}).get('request_variables'):
+            self.building.pop('Output:Variable', None)
+            self.logger.info(
+                'Variables requested through EnergyPlus API, Output:Variable objects removed from building model.')
+            return
+
         output_variables = {}
         for i, (variable_name, variable_key) in enumerate(
                 list(self._variables.values()), start=1):
@@ -215,7 +313,15 @@ class ModelJSON(object):
 
     def adapt_building_to_meters(self) -> None:
         """This method reads all meters and write it in the building model as Output:Meter field.
+           If variables are requested through EnergyPlus API (request_variables extra config), Output:Meter
+           objects are removed instead (meters handles are available without output objects).
         """
+        if (self.config or {}).get('request_variables'):
+            self.building.pop('Output:Meter', None)
+            self.logger.info(
+                'Variables requested through EnergyPlus API, Output:Meter objects removed from building model.')
+            return
+
         output_meters = {}
         for i, meter_name in enumerate(
                 list(self._meters.values()), start=1):
@@ -276,6 +382,25 @@ class ModelJSON(object):
                     'Updated timesteps per episode: {}'.format(
                         self.timestep_per_episode))
 
+            # Report objects and output files not used by Sinergym
+            if self.config.get('lean_output'):
+                self.adapt_building_to_lean_output()
+
+    def adapt_building_to_lean_output(self) -> None:
+        """Remove report objects (tables, SQLite, variable dictionary, drawings...) from building model and disable
+           EnergyPlus output files not used by Sinergym. Output:Variable and Output:Meter objects are kept.
+        """
+        removed = [obj_type for obj_type in self.building.keys(
+        ) if obj_type.startswith(LEAN_OUTPUT_REMOVED_OBJECTS)]
+        for obj_type in removed:
+            del self.building[obj_type]
+        self.building['OutputControl:Files'] = {
+            'OutputControl:Files 1': dict(LEAN_OUTPUT_FILES)}
+
+        self.logger.info(
+            'Extra config: lean output, report objects removed from building model.')
+        self.logger.debug('Report objects removed: {}'.format(removed))
+
     def save_building_model(self) -> str:
         """Take current building model and save as epJSON in current episode path folder.
 
@@ -287,8 +412,21 @@ class ModelJSON(object):
         if self.episode_path is not None:
             episode_json_path = os.path.join(self.episode_path,
                                              os.path.basename(self._json_path))
+            building = self.building
+            # Hard-sized building model if sizing results are cached,
+            # else sizing results are captured when simulation ends
+            if self.sizing_cache is not None:
+                sizing_key = self.sizing_cache.get_key(
+                    self.building, self._weather_path)
+                sized_building = self.sizing_cache.get(sizing_key)
+                if sized_building is not None:
+                    building = sized_building
+                    self.logger.info(
+                        'Using hard-sized building model from sizing cache.')
+                elif not self.sizing_cache.contains(sizing_key):
+                    self._pending_sizing[episode_json_path] = sizing_key
             with open(episode_json_path, "w") as outfile:
-                json.dump(self.building, outfile, indent=4)
+                json.dump(building, outfile, indent=4)
 
             self.logger.debug(
                 'Saving episode building model... [{}]'.format(
@@ -300,17 +438,53 @@ class ModelJSON(object):
                 'Episode path should be set before saving building model.')
             raise RuntimeError
 
+    def capture_sizing(
+            self,
+            building_path: str,
+            output_path: str,
+            completed: bool) -> None:
+        """Capture sizing results of a finished simulation in the sizing cache, if its building model was
+           saved by this model and its key has not been captured yet. Results are only captured from simulations
+           which completed the run period normally (the eio file of an aborted or failed run can be partial).
+
+        Args:
+            building_path (str): Building model path used in the simulation.
+            output_path (str): EnergyPlus output path of the simulation.
+            completed (bool): Whether the simulation completed the run period normally (exit code 0).
+        """
+        sizing_key = self._pending_sizing.pop(building_path, None)
+        if sizing_key is not None and not completed:
+            self.logger.debug(
+                'Sizing cache: simulation did not complete the run period, sizing results are not captured.')
+            return
+        if self.sizing_cache is not None and sizing_key is not None and not self.sizing_cache.contains(
+                sizing_key):
+            with open(building_path) as json_f:
+                building = json.load(json_f)
+            self.sizing_cache.capture(
+                sizing_key, building, os.path.join(
+                    output_path, 'eplusout.eio'))
+
     # ---------------------------------------------------------------------------- #
     #                        EPW and Weather Data management                       #
     # ---------------------------------------------------------------------------- #
 
-    def update_weather_path(self) -> None:
+    def update_weather_path(
+            self,
+            np_random: Optional[np.random.Generator] = None) -> None:
         """When this method is called, weather file is changed randomly and building model is adapted to new one.
+
+        Args:
+            np_random (Optional[np.random.Generator], optional): Random generator used to choose the weather file (e.g. environment np_random, seeded in reset). Defaults to None (random module).
         """
+        weather_file = random.choice(self.weather_files) if np_random is None else self.weather_files[
+            np_random.integers(len(self.weather_files))]
         self._weather_path = os.path.join(
-            self.pkg_data_path, 'weather', random.choice(self.weather_files))
+            self.pkg_data_path, 'weather', weather_file)
         self._ddy_path = self._weather_path.split('.epw')[0] + '.ddy'
         self.ddy_model = IDF(self._ddy_path)
+        # New instance, previous one could be stored in an episode context
+        self.weather_data = Weather()
         self.weather_data.read(self._weather_path)
         self.logger.info(
             'Weather file {} used.'.format(
@@ -318,11 +492,13 @@ class ModelJSON(object):
 
     def apply_weather_variability(
             self,
-            weather_variability: Optional[Dict[str, Tuple[float, float, float]]] = None) -> str:
+            weather_variability: Optional[Dict[str, Tuple[float, float, float]]] = None,
+            np_random: Optional[np.random.Generator] = None) -> str:
         """Modify weather data using Ornstein-Uhlenbeck process according to the variation specified in the weather_variability dictionary.
 
         Args:
             weather_variability (Optional[Dict[str, Tuple[float, float, float]]], optional): Dictionary with the variation for each column in the weather data. Defaults to None. The key is the column name and the value is a tuple with the sigma, mean and tau for OU process.
+            np_random (Optional[np.random.Generator], optional): Random generator used for the OU noise. Defaults to None (numpy global random state).
 
         Returns:
             str: New EPW file path generated in simulator working path in that episode or current EPW path if variation is not defined.
@@ -336,7 +512,8 @@ class ModelJSON(object):
 
             weather_data_mod.dataframe = ornstein_uhlenbeck_process(
                 data=self.weather_data.dataframe,
-                variability_config=weather_variability)
+                variability_config=weather_variability,
+                np_random=np_random)
 
             self.logger.info(
                 'Weather noise applied in columns: {}'.format(
@@ -477,7 +654,7 @@ class ModelJSON(object):
             raise Exception
         else:
             episode_path = self._get_working_folder(
-                directory_path=self.experiment_path,
+                directory_path=self.episode_workspace_path,
                 base_name='-sub_run')
             # Create directoy
             os.makedirs(episode_path)
@@ -495,8 +672,134 @@ class ModelJSON(object):
 
             return episode_path
 
-    def _set_experiment_working_dir(self, env_name: str) -> str:
-        """Set experiment working dir path like config attribute for current simulation.
+    def get_episode_context(self) -> Dict[str, Any]:
+        """Get model elements which change in each episode preparation (episode path, weather and DDY files and
+           data, and building location and design days), in order to prepare an episode in advance and restore them.
+
+        Returns:
+            Dict[str, Any]: Episode context, it can be applied again with set_episode_context.
+        """
+        return {
+            'episode_path': self.episode_path,
+            'weather_path': self._weather_path,
+            'ddy_path': self._ddy_path,
+            'ddy_model': self.ddy_model,
+            'weather_data': self.weather_data,
+            # Episode preparation replaces building first level keys
+            'building': dict(self.building)
+        }
+
+    def set_episode_context(self, context: Dict[str, Any]) -> None:
+        """Apply an episode context obtained with get_episode_context.
+
+        Args:
+            context (Dict[str, Any]): Episode context.
+        """
+        self.episode_path = context['episode_path']
+        self._weather_path = context['weather_path']
+        self._ddy_path = context['ddy_path']
+        self.ddy_model = context['ddy_model']
+        self.weather_data = context['weather_data']
+        self.building = context['building']
+
+    def copy_for_episode(self) -> 'ModelJSON':
+        """Shallow copy of the model to prepare an episode in advance (e.g. in a background thread) without changing
+           current episode context. Episode directories protection and pending sizing captures are shared with this model.
+
+        Returns:
+            ModelJSON: Model copy, its episode context can be obtained with get_episode_context once it is prepared.
+        """
+        model = copy(self)
+        # Episode preparation replaces building first level keys
+        model.building = dict(self.building)
+        return model
+
+    def persist_episode(self, episode_path: Optional[str] = None) -> None:
+        """Copy episode artifacts from RAM workspace to experiment_path, according to persistence policy
+           (none, monitor or all). It does nothing if episode directories are not in RAM.
+
+        Args:
+            episode_path (Optional[str], optional): Episode directory in RAM workspace. Defaults to current episode path.
+        """
+        episode_path = episode_path or self.episode_path
+        if self.ram_workspace is None or self.ram_workspace['persist'] == 'none' or episode_path is None or not os.path.isdir(
+                episode_path):
+            return
+
+        persistent_path = os.path.join(
+            self.experiment_path, os.path.basename(episode_path))
+        if self.ram_workspace['persist'] == 'all':
+            copytree(episode_path, persistent_path, dirs_exist_ok=True)
+        elif os.path.isdir(episode_path + '/monitor'):
+            copytree(
+                episode_path + '/monitor',
+                persistent_path + '/monitor',
+                dirs_exist_ok=True)
+        self.logger.debug(
+            'Episode artifacts persisted in {}.'.format(persistent_path))
+
+    def close_workspace(self, remove_ram_workspace: bool = True) -> None:
+        """Persist episode artifacts pending (according to RAM workspace policy) and free the RAM workspace.
+           It does nothing if episode directories are not in RAM.
+
+        Args:
+            remove_ram_workspace (bool, optional): Whether to remove the whole RAM workspace, else only current episode directory is removed (other episodes can be in use by simulators started in advance). Defaults to True.
+        """
+        if self.ram_workspace is None or not os.path.isdir(
+                self.episode_workspace_path):
+            return
+
+        if self.ram_workspace['persist_on'] == 'close':
+            for folder_name in sorted(os.listdir(self.episode_workspace_path)):
+                self.persist_episode(os.path.join(
+                    self.episode_workspace_path, folder_name))
+        else:
+            self.persist_episode()
+
+        if remove_ram_workspace:
+            rmtree(self.episode_workspace_path, ignore_errors=True)
+        elif self.episode_path is not None:
+            rmtree(self.episode_path, ignore_errors=True)
+        self.logger.info('RAM workspace closed.')
+
+    def protect_episode_dir(self, episode_path: str) -> None:
+        """Protect an episode directory from max_ep_store rotation while it is in use (simulation output).
+
+        Args:
+            episode_path (str): Episode directory.
+        """
+        self.protected_episode_paths.add(episode_path)
+
+    def unprotect_episode_dir(self, episode_path: str) -> None:
+        """Remove protection of an episode directory. It is removed if it is not one of the last max_ep_store episodes anymore.
+
+        Args:
+            episode_path (str): Protected episode directory.
+        """
+        if episode_path not in self.protected_episode_paths:
+            return
+        self.protected_episode_paths.discard(episode_path)
+        if self.episode_path is not None and episode_path != self.episode_path:
+            protected_id = int(episode_path.split('-sub_run')[-1])
+            current_id = int(self.episode_path.split('-sub_run')[-1])
+            if current_id - protected_id >= self.max_ep_store:
+                self._rm_episode_dir(episode_path)
+
+    def discard_episode_dir(self, episode_path: str) -> None:
+        """Remove an episode directory prepared in advance which is not going to be used (e.g. a discarded
+           prefetched episode), so next episode directory takes its number.
+
+        Args:
+            episode_path (str): Episode directory.
+        """
+        self.protected_episode_paths.discard(episode_path)
+        self._rm_episode_dir(episode_path)
+        self.logger.debug(
+            'Episode directory discarded: {}'.format(episode_path))
+
+    @classmethod
+    def create_experiment_dir(cls, env_name: str) -> str:
+        """Create a new experiment directory Eplus-env-<env_name>-res<N> in current working directory, where N is the next run number.
 
         Args:
             env_name (str): simulation env name to define a name in directory
@@ -511,7 +814,7 @@ class ModelJSON(object):
             fcntl.flock(f, fcntl.LOCK_EX)
             try:
                 # Generate experiment dir path
-                experiment_path = self._get_working_folder(
+                experiment_path = cls._get_working_folder(
                     directory_path=CWD,
                     base_name='-%s-res' %
                     (env_name))
@@ -520,6 +823,18 @@ class ModelJSON(object):
             finally:
                 # Release lock
                 fcntl.flock(f, fcntl.LOCK_UN)
+        return experiment_path
+
+    def _set_experiment_working_dir(self, env_name: str) -> str:
+        """Set experiment working dir path like config attribute for current simulation.
+
+        Args:
+            env_name (str): simulation env name to define a name in directory
+
+        Returns:
+            str: Experiment path for directory created.
+        """
+        experiment_path = self.create_experiment_dir(env_name)
         # Set path like config attribute
         self.experiment_path = experiment_path
 
@@ -530,8 +845,47 @@ class ModelJSON(object):
 
         return experiment_path
 
+    def _set_fixed_working_dir(self, workspace_path: str) -> str:
+        """Set a fixed experiment working dir path (created if it does not exist), without the CWD lock and numbering.
+
+        Args:
+            workspace_path (str): Experiment directory path.
+
+        Returns:
+            str: Absolute experiment path.
+        """
+        experiment_path = os.path.abspath(workspace_path)
+        os.makedirs(experiment_path, exist_ok=True)
+        self.experiment_path = experiment_path
+
+        self.logger.info(
+            'Experiment working directory set.')
+        self.logger.info(
+            'Working directory: {}'.format(experiment_path))
+
+        return experiment_path
+
+    def _set_ram_workspace_dir(self) -> str:
+        """Create the directory for episode directories in RAM workspace path, named like the experiment directory.
+
+        Returns:
+            str: Path of the directory created.
+        """
+        os.makedirs(self.ram_workspace['path'], exist_ok=True)
+        episode_workspace_path = tempfile.mkdtemp(
+            prefix=os.path.basename(self.experiment_path) + '-',
+            dir=self.ram_workspace['path'])
+
+        self.logger.info(
+            'RAM workspace directory created: {} (persist: {}, on {}).'.format(
+                episode_workspace_path,
+                self.ram_workspace['persist'],
+                self.ram_workspace['persist_on']))
+
+        return episode_workspace_path
+
+    @staticmethod
     def _get_working_folder(
-            self,
             directory_path: str,
             base_name: str = '-run') -> str:
         """Create a working folder path from path_folder using base_name, returning the absolute result path.
@@ -584,7 +938,28 @@ class ModelJSON(object):
         if cur_dir_id - self.max_ep_store > 0:
             rm_dir_id = cur_dir_id - self.max_ep_store
             rm_dir_full_name = cur_dir_name + base_name + str(rm_dir_id)
-            rmtree(rm_dir_full_name)
+            if rm_dir_full_name in self.protected_episode_paths:
+                self.logger.debug(
+                    'Episode directory {} is protected, it is not removed yet.'.format(rm_dir_full_name))
+                return
+            # Already removed if current number was used by a discarded
+            # episode directory
+            if os.path.isdir(rm_dir_full_name):
+                self._rm_episode_dir(rm_dir_full_name)
+
+    def _rm_episode_dir(self, episode_path: str) -> None:
+        """Removes an episode directory and its persisted copy (RAM workspace) if it exists.
+
+        Args:
+            episode_path (str): Path of the episode directory.
+        """
+        rmtree(episode_path)
+        # Persisted copy of the episode (RAM workspace)
+        persistent_path = os.path.join(
+            self.experiment_path, os.path.basename(episode_path))
+        if persistent_path != episode_path and os.path.isdir(
+                persistent_path):
+            rmtree(persistent_path)
 
     # ---------------------------------------------------------------------------- #
     #                             Model class checker                              #
@@ -628,6 +1003,59 @@ class ModelJSON(object):
                         self.logger.critical(
                             'Extra Config: Runperiod specified in extra configuration has an incorrect format (tuple with 6 elements).')
                         raise err
+                # Lean output and variables requested through API
+                elif config_key in ['lean_output', 'request_variables']:
+                    try:
+                        assert isinstance(self.config[config_key], bool)
+                    except AssertionError as err:
+                        self.logger.critical(
+                            'Extra Config: {} must be a bool value.'.format(config_key))
+                        raise err
+                # Sizing and handle caches
+                elif config_key in ['sizing_cache', 'handle_cache']:
+                    try:
+                        assert isinstance(
+                            self.config[config_key], (bool, str))
+                    except AssertionError as err:
+                        self.logger.critical(
+                            'Extra Config: {} must be a bool or the cache directory path.'.format(config_key))
+                        raise err
+                # Episode directories in RAM
+                elif config_key == 'ram_workspace':
+                    try:
+                        ram_workspace = self.config[config_key]
+                        assert isinstance(ram_workspace, dict)
+                        assert set(ram_workspace.keys()) <= set(
+                            RAM_WORKSPACE_DEFAULTS.keys())
+                        assert ram_workspace.get(
+                            'persist', 'monitor') in RAM_WORKSPACE_PERSIST
+                        assert ram_workspace.get(
+                            'persist_on', 'episode_end') in RAM_WORKSPACE_PERSIST_ON
+                    except AssertionError as err:
+                        self.logger.critical(
+                            'Extra Config: ram_workspace must be a dict with path, persist ({}) and persist_on ({}) optional keys.'.format(
+                                RAM_WORKSPACE_PERSIST, RAM_WORKSPACE_PERSIST_ON))
+                        raise err
+                # Simulator waiting timeouts
+                elif config_key in ['step_timeout', 'reset_timeout']:
+                    try:
+                        assert self.config[config_key] is None or self.config[config_key] == 'adaptive' or (
+                            isinstance(self.config[config_key], (int, float)) and self.config[config_key] > 0)
+                    except AssertionError as err:
+                        self.logger.critical(
+                            'Extra Config: {} must be adaptive, a positive number of seconds or None.'.format(config_key))
+                        raise err
+                # Actuators written in every timestep
+                elif config_key == 'always_write_actuators':
+                    try:
+                        always_write = self.config[config_key]
+                        assert isinstance(always_write, (bool, list))
+                        assert isinstance(always_write, bool) or all(
+                            name in self._actuators for name in always_write)
+                    except AssertionError as err:
+                        self.logger.critical(
+                            'Extra Config: always_write_actuators must be a bool or a list of actuator names defined in the environment.')
+                        raise err
                 else:
                     self.logger.error(
                         'Extra Config: Key name specified in config called [{}] is not available in Sinergym, it will be ignored.'.format(config_key))
@@ -0,0 +1,242 @@
+"""Persistent cache of EnergyPlus sizing results, used to generate hard-sized building models."""
+import hashlib
+import json
+import os
+import re
+from copy import deepcopy
+from shutil import rmtree
+from typing import Any, Dict, List, Optional, Tuple
+
+from sinergym.utils.constants import LOG_MODEL_LEVEL, SIZING_CACHE_PATH
+from sinergym.utils.logger import TerminalLogger
+
+
+class SizingCache(object):
+    """Cache of hard-sized building models. Each entry is identified by a hash of the adapted building model
+    (epJSON) and the weather file, so it is invalidated automatically when any of them changes. Building models
+    which use sizing results during the run (besides autosized and autocalculated fields) are not hard-sized.
+
+        :param path: Directory where cache entries are stored.
+    """
+
+    logger = TerminalLogger().getLogger(
+        name='MODELING',
+        level=LOG_MODEL_LEVEL)
+
+    # SimulationControl fields disabled in hard-sized models
+    SIZING_FIELDS = (
+        'do_zone_sizing_calculation',
+        'do_system_sizing_calculation',
+        'do_plant_sizing_calculation',
+        'run_simulation_for_sizing_periods')
+
+    # Field values resolved from design sizes
+    SIZED_VALUES = ('autosize', 'autocalculate')
+
+    def __init__(self, path: str = SIZING_CACHE_PATH):
+        """Constructor.
+
+        Args:
+            path (str, optional): Directory where cache entries are stored. Defaults to SIZING_CACHE_PATH.
+        """
+        self.path = path
+        os.makedirs(self.path, exist_ok=True)
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def get_key(self, building: Dict[str, Any], weather_file: str) -> str:
+        """Cache key of a building model and weather file.
+
+        Args:
+            building (Dict[str, Any]): Building model (adapted to the weather).
+            weather_file (str): Weather file name.
+
+        Returns:
+            str: Cache key.
+        """
+        content = json.dumps(building, sort_keys=True) + \
+            os.path.basename(weather_file)
+        return hashlib.sha256(content.encode()).hexdigest()[:32]
+
+    def contains(self, key: str) -> bool:
+        """Whether sizing results have been captured for a key (even if the model could not be hard-sized).
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            bool: Flag to describe if key has been captured.
+        """
+        return os.path.isfile(self._building_path(key)) or os.path.isfile(
+            self._unsized_path(key))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the hard-sized building model of a key.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: Hard-sized building model or None if it is not available.
+        """
+        try:
+            with open(self._building_path(key)) as json_f:
+                return json.load(json_f)
+        except (OSError, ValueError):
+            return None
+
+    def capture(
+            self,
+            key: str,
+            building: Dict[str, Any],
+            eio_path: str) -> bool:
+        """Capture sizing results of a completed simulation (from its eio file) and store the hard-sized building
+           model. If some autosized or autocalculated field cannot be resolved, or the building model uses sizing
+           results during the run, the key is marked as captured without a hard-sized model (sizing is kept in
+           that building).
+
+        Args:
+            key (str): Cache key.
+            building (Dict[str, Any]): Building model simulated.
+            eio_path (str): EnergyPlus eio output file of the simulation.
+
+        Returns:
+            bool: Whether a hard-sized building model has been stored.
+        """
+        if not os.path.isfile(eio_path):
+            self.logger.warning(
+                'Sizing cache: eio file {} not found, sizing results cannot be captured.'.format(eio_path))
+            return False
+
+        sizing_results = self.read_sizing_results(eio_path)
+        if len(sizing_results) == 0:
+            self.logger.warning(
+                'Sizing cache: eio file {} has no sizing results, they cannot be captured.'.format(eio_path))
+            return False
+
+        sized_building, unresolved = self.hard_size(building, sizing_results)
+
+        if len(unresolved) > 0:
+            self.logger.warning(
+                'Sizing cache: {} sized fields could not be resolved, building model will keep sizing calculations. Fields: {}'.format(
+                    len(unresolved), unresolved))
+            with open(self._unsized_path(key), 'w') as f:
+                f.write('\n'.join(unresolved))
+            return False
+
+        # Write in a temporal file first, other processes can read the cache
+        tmp_path = self._building_path(key) + '.{}.tmp'.format(os.getpid())
+        with open(tmp_path, 'w') as outfile:
+            json.dump(sized_building, outfile, indent=4)
+        os.replace(tmp_path, self._building_path(key))
+        self.logger.info(
+            'Sizing cache: hard-sized building model stored [{}].'.format(key))
+        return True
+
+    def clear(self) -> None:
+        """Remove all cache entries.
+        """
+        rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path, exist_ok=True)
+
+    # ---------------------------------------------------------------------------- #
+    #                              Sizing utilities                                #
+    # ---------------------------------------------------------------------------- #
+
+    @staticmethod
+    def read_sizing_results(
+            eio_path: str) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Read design sizes from Component Sizing Information records of an eio file.
+
+        Args:
+            eio_path (str): EnergyPlus eio output file.
+
+        Returns:
+            Dict[Tuple[str, str], Dict[str, float]]: For each object (type and name in lower case), design size value of each (normalized) description.
+        """
+        results = {}
+        with open(eio_path) as eio_f:
+            for line in eio_f:
+                fields = [field.strip() for field in line.split(',')]
+                if len(fields) < 5 or \
+                        fields[0] != 'Component Sizing Information':
+                    continue
+                obj_type, obj_name, description, value = fields[1:5]
+                if not description.startswith('Design Size '):
+                    continue
+                try:
+                    value = float(value)
+                except ValueError:
+                    continue
+                description = re.sub(
+                    r'\[.*?\]', '', description[len('Design Size '):])
+                results.setdefault((obj_type.lower(), obj_name.lower()), {})[
+                    SizingCache._normalize(description)] = value
+        return results
+
+    @staticmethod
+    def hard_size(building: Dict[str, Any],
+                  sizing_results: Dict[Tuple[str,
+                                             str],
+                                       Dict[str,
+                                            float]]) -> Tuple[Dict[str,
+                                                                   Any],
+                                                              List[str]]:
+        """Replace autosized and autocalculated fields of a building model with design sizes and disable sizing
+           calculations. EMS internal variables with design data (sizing results read during the run) cannot be
+           resolved.
+
+        Args:
+            building (Dict[str, Any]): Building model.
+            sizing_results (Dict[Tuple[str, str], Dict[str, float]]): Design sizes (see read_sizing_results).
+
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: Hard-sized building model and fields not resolved (object type, name and field).
+        """
+        sized_building = deepcopy(building)
+        unresolved = []
+        for obj_type, objects in sized_building.items():
+            if not isinstance(objects, dict):
+                continue
+            for obj_name, obj_fields in objects.items():
+                if not isinstance(obj_fields, dict):
+                    continue
+                sizes = sizing_results.get(
+                    (obj_type.lower(), obj_name.lower()), {})
+                for field_name, field_value in obj_fields.items():
+                    if isinstance(
+                            field_value,
+                            str) and field_value.lower() in SizingCache.SIZED_VALUES:
+                        size = sizes.get(SizingCache._normalize(field_name))
+                        if size is None:
+                            unresolved.append('{}:{}:{}'.format(
+                                obj_type, obj_name, field_name))
+                        else:
+                            obj_fields[field_name] = size
+
+        # Sizing results read during the run
+        for obj_name, obj_fields in sized_building.get(
+                'EnergyManagementSystem:InternalVariable', {}).items():
+            data_type = obj_fields.get('internal_data_type', '')
+            if 'design' in data_type.lower():
+                unresolved.append(
+                    'EnergyManagementSystem:InternalVariable:{}:internal_data_type'.format(obj_name))
+
+        # Sizing calculations are not required anymore
+        for control in sized_building.get('SimulationControl', {}).values():
+            for field_name in SizingCache.SIZING_FIELDS:
+                control[field_name] = 'No'
+
+        return sized_building, unresolved
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return re.sub(r'[^a-z0-9]', '', text.lower())
+
+    def _building_path(self, key: str) -> str:
+        return os.path.join(self.path, key + '.epJSON')
+
+    def _unsized_path(self, key: str) -> str:
+        return os.path.join(self.path, key + '.unsized')
@@ -1,3 +1,4 @@
 """Sinergym simulation environments."""
 
 from .eplus_env import EplusEnv
+from .vector_env import SinergymSubprocVectorEnv, SinergymThreadedVectorEnv
@@ -2,17 +2,27 @@
 Gymnasium environment for simulation with EnergyPlus.
 """
 
-from queue import Empty, Full, Queue
-from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
+import os
+import threading
+import time
+from contextlib import nullcontext
+from queue import Empty
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import gymnasium as gym
 import numpy as np
 
 from sinergym.config import ModelJSON
-from sinergym.simulators import EnergyPlus
-from sinergym.utils.constants import LOG_ENV_LEVEL
+from sinergym.simulators import (EnergyPlus, EnergyPlusProcess,
+                                 SimulationProgress, SimulatorPool)
+from sinergym.utils.common import ObservationView
+from sinergym.utils.constants import (LOG_ENV_LEVEL, RESET_TIMEOUT_INITIAL,
+                                      RESET_TIMEOUT_MIN, STEP_TIMEOUT_INITIAL,
+                                      STEP_TIMEOUT_MIN, TRACE_BUFFER_SIZE)
 from sinergym.utils.logger import SimpleLogger, TerminalLogger
 from sinergym.utils.rewards import *
+from sinergym.utils.timing import LatencyTracker, PhaseTimer, TraceRecorder
 
 
 class EplusEnv(gym.Env):
@@ -29,6 +39,19 @@ class EplusEnv(gym.Env):
 
     simple_printer = SimpleLogger().getLogger()
 
+    # Step and reset phases measured when timing is enabled (recorded by
+    # their index in this order)
+    TIMING_PHASES = (
+        'reset',
+        'step',
+        'action_enqueue',
+        'simulator_wait',
+        'reward')
+
+    # Simulator backends: EnergyPlus in a thread of this process or in a
+    # child process
+    SIMULATOR_BACKENDS = ('thread', 'process')
+
     # ---------------------------------------------------------------------------- #
     #                            ENVIRONMENT CONSTRUCTOR                           #
     # ---------------------------------------------------------------------------- #
@@ -47,7 +70,19 @@ class EplusEnv(gym.Env):
         reward_kwargs: Optional[Dict[str, Any]] = {},
         max_ep_data_store_num: int = 10,
         env_name: str = 'eplus-env-v1',
-        config_params: Optional[Dict[str, Any]] = None
+        config_params: Optional[Dict[str, Any]] = None,
+        action_repeat: int = 1,
+        observation_aggregation: Optional[Dict[str, str]] = None,
+        prefetch_threshold: Optional[float] = None,
+        simulator_pool: Optional[SimulatorPool] = None,
+        progress: str = 'bar',
+        progress_interval: float = 1.0,
+        episode_split: Optional[Union[str, int]] = None,
+        timing: bool = False,
+        trace: bool = False,
+        trace_buffer_size: int = TRACE_BUFFER_SIZE,
+        simulator_backend: str = 'thread',
+        workspace_path: Optional[str] = None
     ):
         """Environment with EnergyPlus simulator.
 
@@ -65,6 +100,18 @@ class EplusEnv(gym.Env):
             max_ep_data_store_num (int, optional): Number of last sub-folders (one for each episode) generated during execution on the simulation.
             env_name (str, optional): Env name used for working directory generation. Defaults to eplus-env-v1.
             config_params (Optional[Dict[str, Any]], optional): Dictionary with all extra configuration for simulator. Defaults to None.
+            action_repeat (int, optional): Number of simulation timesteps each action is held by the simulator (agent decides every action_repeat timesteps). Defaults to 1.
+            observation_aggregation (Optional[Dict[str, str]], optional): Aggregation method (last, mean, sum or max) over the decision interval for observation variables. Variables not specified use last value. Defaults to None.
+            prefetch_threshold (Optional[float], optional): Fraction of timestep_per_episode after which next episode is prepared and its simulation warmed up in background (parked before its first action), so reset only swaps it in. It is discarded if reset is called with seed or options. Prefetch is disabled if None. Defaults to None.
+            simulator_pool (Optional[SimulatorPool], optional): Pool of simulators started in advance (shared with other environments). Simulators are borrowed from the pool on reset and it is refilled in background. Defaults to None.
+            progress (str, optional): Simulation progress reporting: bar (terminal progress bar), throttled (progress bar redrawn at most once per progress_interval), structured (percent completed and sim-time/wall-time ratio in progress counter, without terminal output) or off. Defaults to bar.
+            progress_interval (float, optional): Minimum seconds between progress bar redraws in throttled mode. Defaults to 1.0.
+            episode_split (Optional[Union[str, int]], optional): Continuous mode, a single EnergyPlus run over the run period is split into episodes at monthly or weekly boundaries, or every N timesteps (int). Reset continues the live simulation instead of restarting it. Defaults to None (an EnergyPlus run per episode).
+            timing (bool, optional): Whether to measure the duration of each step and reset phase (see timing_stats). Defaults to False.
+            trace (bool, optional): Whether to record trace events of environment, episode preparation and EnergyPlus threads, written per episode in Chrome Trace Event Format (monitor/trace.json). Defaults to False.
+            trace_buffer_size (int, optional): Maximum number of trace events kept per episode (oldest events are dropped). Defaults to TRACE_BUFFER_SIZE.
+            simulator_backend (str, optional): Where EnergyPlus runs: thread (in this process) or process (child process, exchanging observations and actions through shared memory). Defaults to thread.
+            workspace_path (Optional[str], optional): Fixed experiment directory (created if it does not exist) instead of a new numbered Eplus-env-<env_name>-res<N> directory in the current working directory. Defaults to None.
         """
 
         self.simple_printer.info(
@@ -103,6 +150,9 @@ class EplusEnv(gym.Env):
         self.observation_variables = self.time_variables + \
             list(self.variables.keys()) + list(self.meters.keys())
         self.action_variables = list(self.actuators.keys())
+        # Position of each variable in observation arrays (for dict views)
+        self.observation_index = {
+            name: i for i, name in enumerate(self.observation_variables)}
 
         # ---------------------------------------------------------------------------- #
         #                               Building modeling                              #
@@ -116,7 +166,8 @@ class EplusEnv(gym.Env):
             variables=self.variables,
             meters=self.meters,
             max_ep_store=max_ep_data_store_num,
-            extra_config=config_params
+            extra_config=config_params,
+            workspace_path=workspace_path
         )
 
         # ---------------------------------------------------------------------------- #
@@ -125,28 +176,91 @@ class EplusEnv(gym.Env):
         self.name = env_name
         self.episode = 0
         self.timestep = 0
-        # Queues for E+ Python API communication
-        self.obs_queue = Queue(maxsize=1)
-        self.info_queue = Queue(maxsize=1)
-        self.act_queue = Queue(maxsize=1)
         # last obs, action and info
-        self.last_obs: Optional[Dict[str, float]] = None
+        self.last_obs: Optional[np.ndarray] = None
         self.last_info: Optional[Dict[str, Any]] = None
         self.last_action: Optional[List[float]] = None
+        # Current episode directory (set on reset)
+        self.episode_dir: Optional[str] = None
 
         # ---------------------------------------------------------------------------- #
         #                                   Simulator                                  #
         # ---------------------------------------------------------------------------- #
-        self.energyplus_simulator = EnergyPlus(
+        simulator_kwargs = dict(
             name=env_name,
-            obs_queue=self.obs_queue,
-            info_queue=self.info_queue,
-            act_queue=self.act_queue,
             time_variables=self.time_variables,
             variables=self.variables,
             meters=self.meters,
-            actuators=self.actuators
+            actuators=self.actuators,
+            always_write_actuators=(
+                config_params or {}).get(
+                'always_write_actuators',
+                False),
+            action_repeat=action_repeat,
+            aggregation=observation_aggregation,
+            request_variables=(
+                config_params or {}).get(
+                'request_variables',
+                False),
+            progress=progress,
+            progress_interval=progress_interval,
+            episode_length=self.model.episode_length,
+            handle_cache=(
+                config_params or {}).get(
+                'handle_cache',
+                False)
         )
+        self._simulator_kwargs = simulator_kwargs
+        self.simulator_backend = simulator_backend
+        self.energyplus_simulator = self._make_simulator()
+
+        # Next episode prefetch (second simulator and its model context)
+        self.prefetch_threshold = prefetch_threshold
+        self.prefetch_simulator: Optional[Union[EnergyPlus, EnergyPlusProcess]] = self._make_simulator(
+        ) if prefetch_threshold is not None else None
+        self._prefetch_context: Optional[Dict[str, Any]] = None
+
+        # Simulators started in advance, shared with other environments (pool
+        # is refilled in a background thread)
+        self.simulator_pool = simulator_pool
+        self._refill_thread: Optional[threading.Thread] = None
+        # Model and episode directory protected from rotation while current
+        # simulation is running in it
+        self._output_protection: Optional[Tuple[ModelJSON, str]] = None
+
+        # Simulator waiting timeouts (adaptive, fixed seconds or None) and
+        # latency distributions measured (reset waits indefinitely by default)
+        self.step_timeout = (
+            config_params or {}).get(
+            'step_timeout', 'adaptive')
+        self.reset_timeout = (
+            config_params or {}).get(
+            'reset_timeout', None)
+        self.step_latency = LatencyTracker(
+            initial_timeout=STEP_TIMEOUT_INITIAL,
+            min_timeout=STEP_TIMEOUT_MIN)
+        self.reset_latency = LatencyTracker(
+            initial_timeout=RESET_TIMEOUT_INITIAL,
+            min_timeout=RESET_TIMEOUT_MIN)
+        # Truncation caused by a timeout (not by end of run period)
+        self.timeout_truncated = False
+        self.timeout_truncations = 0
+
+        # Step and reset phases timer (per episode, None if disabled)
+        self.timer: Optional[PhaseTimer] = PhaseTimer(
+            list(self.TIMING_PHASES)) if timing else None
+        # Trace events recorder (per episode, None if disabled)
+        self.trace_buffer_size = trace_buffer_size
+        self.tracer: Optional[TraceRecorder] = TraceRecorder(
+            capacity=trace_buffer_size) if trace else None
+
+        # Continuous mode: episode boundaries in a live simulation (first
+        # observation and info of next episode are kept when one is reached)
+        self.episode_split = episode_split
+        self._split_pending = False
+        self._split_start_info: Optional[Dict[str, Any]] = None
+        self._split_obs: Optional[np.ndarray] = None
+        self._split_info: Optional[Dict[str, Any]] = None
 
         # ---------------------------------------------------------------------------- #
         #                          reset default options                               #
@@ -212,7 +326,35 @@ class EplusEnv(gym.Env):
         Returns:
             Tuple[np.ndarray,Dict[str,Any]]: Current observation and info context with additional information.
         """
+        return self._run_process(self._reset_process(seed, options))
+
+    async def async_reset(self,
+                          seed: Optional[int] = None,
+                          options: Optional[Dict[str,
+                                                 Any]] = None) -> Tuple[np.ndarray,
+                                                                        Dict[str,
+                                                                             Any]]:
+        """Coroutine version of reset. Episode preparation runs in the event loop, and warmup and first observation
+           are awaited with a future resolved by the EnergyPlus thread, so many environments can be reset concurrently
+           from one loop without a thread each. Wrappers are not applied (it is called on the unwrapped environment).
 
+        Args:
+            seed (Optional[int]): The seed that is used to initialize the environment's episode (np_random). if value is None, a seed will be chosen from some source of entropy. Defaults to None.
+            options (Optional[Dict[str, Any]]):Additional information to specify how the environment is reset. Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray,Dict[str,Any]]: Current observation and info context with additional information.
+        """
+        return await self._run_process_async(self._reset_process(seed, options))
+
+    def _reset_process(self,
+                       seed: Optional[int] = None,
+                       options: Optional[Dict[str, Any]] = None
+                       ) -> Generator[Tuple[str, Optional[float]], Any,
+                                      Tuple[np.ndarray, Dict[str, Any]]]:
+        """Reset logic. It yields the simulator waits (warmup or observation, and timeout), which are done by the
+           caller (blocking or awaiting), and it returns the reset result.
+        """
         # We need the following line to seed self.np_random
         super().reset(seed=seed)
 
@@ -221,12 +363,42 @@ class EplusEnv(gym.Env):
 
         self.episode += 1
         self.timestep = 0
+        self.timeout_truncated = False
+        # Phase durations are measured per episode
+        measure = self.timer is not None or self.tracer is not None
+        if measure:
+            reset_begin = time.perf_counter()
+        if self.timer is not None:
+            self.timer.reset()
+
+        # Continuous mode: next episode is the rest of the live simulation
+        if self._split_pending and options is None and self.energyplus_simulator.is_running and not self.energyplus_simulator.simulation_complete:
+            obs, info = self._continue_simulation()
+            if measure:
+                self._record_phase(0, reset_begin, time.perf_counter())
+            return obs, info
+        self._split_pending = False
+        # Pool refill of previous reset prepares episodes with this model
+        self._join_refill()
 
         # Stop oold thread of old episode if exists
-        self.energyplus_simulator.stop()
-
-        self.last_obs = dict(
-            zip(self.observation_variables, self.observation_space.sample()))
+        with self._trace_span('stop_simulation'):
+            self._stop_simulation()
+        self._dump_trace()
+        # Copy finished episode artifacts from RAM workspace (if it is used)
+        if self.model.ram_workspace is not None and \
+                self.model.ram_workspace['persist_on'] == 'episode_end':
+            self.model.persist_episode()
+
+        # Prefetched episode is only valid for default reset options and
+        # without seed (its weather and noise were drawn before this reset)
+        if self._prefetch_context is not None and (
+                seed is not None or options is not None):
+            self.logger.info(
+                'Reset seed or options specified, prefetched episode discarded.')
+            self._discard_prefetch()
+
+        self.last_obs = self.observation_space.sample()
         self.last_info = {'timestep': self.timestep}
 
         # ------------------------ Preparation for new episode ----------------------- #
@@ -239,61 +411,112 @@ class EplusEnv(gym.Env):
                 self.episode, self.name))
         self.simple_printer.info(
             '#----------------------------------------------------------------------------------------------#')
-        # Get new episode working dir
-        self.episode_dir = self.model.set_episode_working_dir()
-        # get weather path
-        self.model.update_weather_path()
-        # Readapt building to epw
-        self.model.adapt_building_to_epw()
-        # Getting building, weather and Energyplus output directory
-        eplus_working_building_path = self.model.save_building_model()
-        eplus_working_weather_path = self.model.apply_weather_variability(
-            weather_variability=reset_options.get('weather_variability'))
-        eplus_working_out_path = (self.episode_dir + '/' + 'output')
-        self.logger.info(
-            'Saving episode output path.'.format(
-                eplus_working_out_path))
-        self.logger.debug(
-            'Path: {}'.format(
-                eplus_working_out_path))
-
-        self.energyplus_simulator.start(
-            building_path=eplus_working_building_path,
-            weather_path=eplus_working_weather_path,
-            output_path=eplus_working_out_path,
-            episode=self.episode)
-
-        self.logger.info('Episode {} started.'.format(self.episode))
-
-        # wait for E+ warmup to complete
-        if not self.energyplus_simulator.warmup_complete:
-            self.logger.debug('Waiting for finishing WARMUP process.')
-            self.energyplus_simulator.warmup_queue.get()
-            self.logger.debug('WARMUP process finished.')
-
-        # Wait to receive simulation first observation and info
+        self.energyplus_simulator.timer = self.timer
+        self.energyplus_simulator.tracer = self.tracer
+        refill_key = None
+        # Simulator started in this reset (not warmed up in background)
+        cold_start = False
+        if self._prefetch_context is not None:
+            # Swap in the episode prepared (and warmed up) in background
+            self.model.set_episode_context(self._prefetch_context)
+            self.episode_dir = self.model.episode_path
+            self._prefetch_context = None
+            self.energyplus_simulator, self.prefetch_simulator = self.prefetch_simulator, self.energyplus_simulator
+            self.logger.info(
+                'Episode {} started (prefetched).'.format(self.episode))
+        elif self.simulator_pool is not None:
+            # Borrow a simulator started for this episode key if available
+            self.model.update_weather_path(np_random=self.np_random)
+            pool_key = self._get_pool_key(reset_options)
+            pooled = self.simulator_pool.acquire(pool_key)
+            if pooled is not None:
+                self._swap_pooled_simulator(*pooled)
+                self.logger.info(
+                    'Episode {} started (pooled).'.format(self.episode))
+            else:
+                self.episode_dir, simulation_paths = self._prepare_episode(
+                    reset_options, update_weather=False)
+                with self._trace_span('simulator_start'):
+                    self.energyplus_simulator.start(
+                        episode=self.episode, **simulation_paths)
+                cold_start = True
+                self.logger.info('Episode {} started.'.format(self.episode))
+            # Start a simulator for next reset with this key (once first
+            # observation is received)
+            if self.simulator_pool.refill:
+                refill_key = pool_key
+        else:
+            self.episode_dir, simulation_paths = self._prepare_episode(
+                reset_options)
+            with self._trace_span('simulator_start'):
+                self.energyplus_simulator.start(
+                    episode=self.episode, **simulation_paths)
+            cold_start = True
+            self.logger.info('Episode {} started.'.format(self.episode))
+            # Simulation output is in this directory during next episodes
+            if self.episode_split is not None:
+                self.model.protect_episode_dir(self.episode_dir)
+                self._output_protection = (self.model, self.episode_dir)
+
+        timeout = self._get_timeout(self.reset_timeout, self.reset_latency)
+        begin = time.perf_counter()
         try:
-            obs = self.obs_queue.get(timeout=20)
-        except Empty:  # pragma: no cover
+            # wait for E+ warmup to complete
+            if not self.energyplus_simulator.warmup_complete:
+                self.logger.debug('Waiting for finishing WARMUP process.')
+                yield 'warmup', timeout
+                self.logger.debug('WARMUP process finished.')
+
+            # Wait to receive simulation first observation and info (None if
+            # simulation has ended before reaching the first timestep)
+            obs, info = yield 'observation', None if timeout is None else max(
+                0.0, timeout - (time.perf_counter() - begin))
+        except (Empty, TimeoutError) as err:
+            self.logger.critical(
+                'Reset: Simulator did not publish the first observation in {:.1f} seconds (reset_timeout).'.format(timeout))
+            self._stop_simulation()
+            raise TimeoutError(
+                'Reset timeout ({:.1f} s) waiting for simulator.'.format(timeout)) from err
+        wait_end = time.perf_counter()
+        if self.tracer is not None:
+            self.tracer.complete('reset_wait', 'env', begin, wait_end)
+        # Only cold starts are representative of reset latency (pooled and
+        # prefetched simulators are already waiting in first observation)
+        if obs is not None and cold_start:
+            self.reset_latency.record(wait_end - begin)
+
+        if obs is None:  # pragma: no cover
+            # check for simulation errors
+            try:
+                assert not self.energyplus_simulator.failed()
+            except AssertionError as err:
+                self.logger.critical(
+                    'EnergyPlus failed with exit code {}'.format(
+                        self.energyplus_simulator.sim_results['exit_code']))
+                raise err
             self.logger.warning(
-                'Reset: Observation queue empty, returning a random observation (not real).')
+                'Reset: Simulation ended before first observation, returning a random observation (not real).')
             obs = self.last_obs
-
-        try:
-            info = self.info_queue.get(timeout=20)
-        except Empty:  # pragma: no cover
             info = self.last_info
-            self.logger.warning(
-                'Reset: info queue empty, returning an empty info dictionary (not real).')
+        else:
+            # Copy of simulator observation buffer
+            obs = obs.astype(np.float32)
 
         info.update({'timestep': self.timestep})
         self.last_obs = obs
         self.last_info = info
+        self._split_start_info = info
 
         self.logger.debug('RESET observation received: {}'.format(obs))
         self.logger.debug('RESET info received: {}'.format(info))
 
-        return np.array(list(obs.values()), dtype=np.float32), info
+        if measure:
+            self._record_phase(0, reset_begin, time.perf_counter())
+
+        if refill_key is not None:
+            self._start_refill(refill_key, reset_options)
+
+        return obs, info
 
     # ---------------------------------------------------------------------------- #
     #                                     STEP                                     #
@@ -314,6 +537,39 @@ class EplusEnv(gym.Env):
         Returns:
             Tuple[np.ndarray, float, bool, Dict[str, Any]]: Observation for next timestep, reward obtained, Whether the episode has ended or not, Whether episode has been truncated or not, and a dictionary with extra information
         """
+        return self._run_process(self._step_process(action))
+
+    async def async_step(self,
+                         action: Union[int,
+                                       float,
+                                       np.integer,
+                                       np.ndarray,
+                                       List[Any],
+                                       Tuple[Any]]
+                         ) -> Tuple[np.ndarray, float, bool, bool,
+                                    Dict[str, Any]]:
+        """Coroutine version of step. The next observation is awaited with a future resolved by the EnergyPlus thread,
+           so pending steps of many environments are multiplexed in one loop without a thread each. Wrappers are not
+           applied (it is called on the unwrapped environment).
+
+        Args:
+            action (Union[int, float, np.integer, np.ndarray, List[Any], Tuple[Any]]): Action selected by the agent.
+
+        Returns:
+            Tuple[np.ndarray, float, bool, Dict[str, Any]]: Observation for next timestep, reward obtained, Whether the episode has ended or not, Whether episode has been truncated or not, and a dictionary with extra information
+        """
+        return await self._run_process_async(self._step_process(action))
+
+    def _step_process(self, action: Any
+                      ) -> Generator[Tuple[str, Optional[float]], Any,
+                                     Tuple[np.ndarray, float, bool, bool,
+                                           Dict[str, Any]]]:
+        """Step logic. It yields the simulator wait (observation and timeout), which is done by the caller (blocking
+           or awaiting), and it returns the step result.
+        """
+        measure = self.timer is not None or self.tracer is not None
+        if measure:
+            step_begin = time.perf_counter()
 
         # timestep +1 and flags initialization
         self.timestep += 1
@@ -345,34 +601,75 @@ class EplusEnv(gym.Env):
                     self.energyplus_simulator.sim_results['exit_code']))
             raise err
 
-        if self.energyplus_simulator.simulation_complete:
+        if self.energyplus_simulator.simulation_complete or self.timeout_truncated:
             self.logger.debug(
                 'Trying STEP in a simulation completed, changing TRUNCATED flag to TRUE.')
             truncated = True
             obs = self.last_obs
             info = self.last_info
         else:
-            # enqueue action (received by EnergyPlus through dedicated callback)
-            # then wait to get next observation.
-            # timeout is set to 2s to handle end of simulation cases, which happens async
-            # and materializes by worker thread waiting on this queue (EnergyPlus callback
-            # not consuming yet/anymore)
-            # timeout value can be increased if E+ timestep takes longer
-            timeout = 2
+            # publish action (received by EnergyPlus through dedicated callback)
+            # then wait to get next observation. End of simulation is
+            # published explicitly by simulator thread (None observation),
+            # timeout only detects a simulator which is stalled.
+            channel = self.energyplus_simulator.channel
+            if measure:
+                enqueue_begin = time.perf_counter()
+            channel.put_action(action)
+            timeout = self._get_timeout(self.step_timeout, self.step_latency)
+            begin = time.perf_counter()
+            if measure:
+                self._record_phase(2, enqueue_begin, begin)
             try:
-                self.act_queue.put(action, timeout=timeout)
-                self.last_obs = obs = self.obs_queue.get(timeout=timeout)
-                self.last_info = info = self.info_queue.get(
-                    timeout=timeout)
-            except (Full, Empty):
+                obs, info = yield 'observation', timeout
+            except TimeoutError:
+                self.logger.warning(
+                    'STEP timeout ({:.2f} s) waiting for simulator, changing TRUNCATED flag to TRUE.'.format(timeout))
+                self.timeout_truncated = True
+                self.timeout_truncations += 1
+                obs = info = None
+            else:
+                wait_time = time.perf_counter() - begin
+                if measure:
+                    self._record_phase(3, begin, begin + wait_time)
+                if obs is not None:
+                    self.step_latency.record(wait_time)
+            if self.timeout_truncated:
+                truncated = True
+                obs = self.last_obs
+                info = self.last_info
+            elif obs is None:
                 self.logger.debug(
-                    'STEP queues not receive value, simulation must be completed. changing TRUNCATED flag to TRUE')
+                    'STEP received end of simulation, changing TRUNCATED flag to TRUE')
                 truncated = True
                 obs = self.last_obs
                 info = self.last_info
-
-        # Calculate reward
-        reward, rw_terms = self.reward_fn(obs)
+            else:
+                # Copy of simulator observation buffer
+                self.last_obs = obs = obs.astype(np.float32)
+                self.last_info = info
+                # Prepare next episode in background if threshold is reached
+                if self.prefetch_threshold is not None and \
+                        self._prefetch_context is None and \
+                        self.timestep >= self.prefetch_threshold * \
+                        self.timestep_per_episode:
+                    self._prefetch_episode()
+                # Continuous mode: episode boundary, simulation goes on in
+                # next episode
+                if self.episode_split is not None and self._is_split_boundary(
+                        info):
+                    truncated = True
+                    self._split_pending = True
+                    self._split_obs, self._split_info = obs, dict(info)
+
+        # Calculate reward (dict view over simulator observation buffer, last
+        # values are kept there when simulation is completed)
+        if measure:
+            reward_begin = time.perf_counter()
+        reward, rw_terms = self.reward_fn(ObservationView(
+            self.observation_index, self.energyplus_simulator.obs_buffer))
+        if measure:
+            self._record_phase(4, reward_begin, time.perf_counter())
 
         # Update info with
         info.update({'action': action})
@@ -387,8 +684,67 @@ class EplusEnv(gym.Env):
         # self.logger.debug('STEP truncated: {}'.format(truncated))
         # self.logger.debug('STEP info: {}'.format(info))
 
-        return np.array(list(obs.values()), dtype=np.float32
-                        ), reward, terminated, truncated, info
+        if measure:
+            self._record_phase(1, step_begin, time.perf_counter())
+
+        return obs, reward, terminated, truncated, info
+
+    def _run_process(self, process: Generator) -> Any:
+        """Run a reset or step process, blocking in its simulator waits.
+
+        Args:
+            process (Generator): Reset or step process.
+
+        Returns:
+            Any: Result of the process.
+        """
+        try:
+            request = next(process)
+            while True:
+                kind, timeout = request
+                try:
+                    if kind == 'warmup':
+                        result = self.energyplus_simulator.warmup_queue.get(
+                            timeout=timeout)
+                    else:
+                        result = self.energyplus_simulator.channel.get_observation(
+                            timeout=timeout)
+                except (Empty, TimeoutError) as err:
+                    request = process.throw(err)
+                else:
+                    request = process.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _run_process_async(self, process: Generator) -> Any:
+        """Run a reset or step process, awaiting its simulator waits in the running event loop.
+
+        Args:
+            process (Generator): Reset or step process.
+
+        Returns:
+            Any: Result of the process.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            request = next(process)
+            while True:
+                kind, timeout = request
+                if kind == 'warmup':
+                    # First observation is published after warmup, it is
+                    # awaited in next request (same timeout)
+                    request = process.send(True)
+                    continue
+                channel = self.energyplus_simulator.channel
+                try:
+                    await asyncio.wait_for(channel.wait_observation(loop), timeout)
+                    result = channel.get_observation(timeout=0)
+                except TimeoutError as err:
+                    request = process.throw(err)
+                else:
+                    request = process.send(result)
+        except StopIteration as stop:
+            return stop.value
 
     # ---------------------------------------------------------------------------- #
     #                                RENDER (empty)                                #
@@ -406,13 +762,368 @@ class EplusEnv(gym.Env):
     # ---------------------------------------------------------------------------- #
     def close(self) -> None:
         """End simulation."""
-        self.energyplus_simulator.stop()
+        self._join_refill()
+        self._stop_simulation()
+        self._dump_trace()
+        if self.prefetch_simulator is not None:
+            # Prefetched simulator has not been used, give it to the pool
+            if self._prefetch_context is not None and self.simulator_pool is not None:
+                self.simulator_pool.release(
+                    self._get_pool_key(
+                        self.default_options,
+                        self._prefetch_context['weather_path']),
+                    self.prefetch_simulator,
+                    self._prefetch_context,
+                    model=self.model)
+                self.prefetch_simulator = self._make_simulator()
+                self._prefetch_context = None
+            else:
+                self._discard_prefetch()
+        # Finish simulator processes (started again if environment is reset)
+        if self.simulator_backend == 'process':
+            self.energyplus_simulator.close()
+            if self.prefetch_simulator is not None:
+                self.prefetch_simulator.close()
+        # Pooled simulators can be running in RAM workspace episode
+        # directories
+        self.model.close_workspace(
+            remove_ram_workspace=self.simulator_pool is None)
         self.logger.info('Environment closed. [{}]'.format(self.name))
 
     # ---------------------------------------------------------------------------- #
     #                           Environment functionality                          #
     # ---------------------------------------------------------------------------- #
 
+    def _make_simulator(self) -> Union[EnergyPlus, EnergyPlusProcess]:
+        """Create a simulator (not running) of the environment backend.
+
+        Returns:
+            Union[EnergyPlus, EnergyPlusProcess]: EnergyPlus simulator.
+        """
+        if self.simulator_backend == 'process':
+            return EnergyPlusProcess(**self._simulator_kwargs)
+        return EnergyPlus(**self._simulator_kwargs)
+
+    def _stop_simulation(self) -> None:
+        """Stop current simulation and capture its sizing results (if they are pending in sizing cache and the
+           simulation completed the run period normally).
+        """
+        # EnergyPlus run finished by itself, not aborted by stop (results of
+        # the run are cleared when it is stopped)
+        completed = self.energyplus_simulator.sim_results.get('exit_code') == 0
+        self.energyplus_simulator.stop()
+        if self.energyplus_simulator.building_path is not None:
+            self.model.capture_sizing(
+                self.energyplus_simulator.building_path,
+                self.energyplus_simulator.output_path,
+                completed)
+        # Simulation directory can be rotated now
+        if self._output_protection is not None:
+            model, episode_path = self._output_protection
+            model.unprotect_episode_dir(episode_path)
+            self._output_protection = None
+
+    def timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Duration statistics of each phase in current episode (timing must be enabled): reset, step, action enqueue,
+           simulator wait, EnergyPlus callbacks (observation and action), reward function and each wrapper layer
+           instrumented by TimingWrapper. Wrapper layers include a self_mean value, without inner layers time.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Count, total, mean, max, p50 and p99 (seconds) of each phase. Empty if timing is disabled.
+        """
+        if self.timer is None:
+            return {}
+        stats = self.timer.stats()
+        # Wrapper layers are added from outer to inner layer
+        layers = [phase for phase in self.timer.phases if phase.startswith(
+            'wrapper:')] + ['step']
+        for layer, inner_layer in zip(layers[:-1], layers[1:]):
+            stats[layer]['self_mean'] = stats[layer]['mean'] - \
+                stats[inner_layer]['mean']
+        return stats
+
+    def _record_phase(self, phase: int, begin: float, end: float) -> None:
+        """Record a step or reset phase in phases timer and trace events recorder (if they are enabled).
+
+        Args:
+            phase (int): Index of the phase in TIMING_PHASES.
+            begin (float): Begin time (time.perf_counter).
+            end (float): End time (time.perf_counter).
+        """
+        if self.timer is not None:
+            self.timer.record(phase, end - begin)
+        if self.tracer is not None:
+            self.tracer.complete(
+                self.TIMING_PHASES[phase], 'env', begin, end, {
+                    'episode': self.episode, 'timestep': self.timestep})
+
+    def _trace_span(self, name: str, category: str = 'model'):
+        """Context manager recording a trace event (it does nothing if tracing is disabled).
+
+        Args:
+            name (str): Event name.
+            category (str, optional): Event category. Defaults to model.
+        """
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, category)
+
+    def _dump_trace(self) -> None:
+        """Write trace events recorded since last dump in the monitor directory of current episode
+           (monitor/trace.json), and clear the recorder.
+        """
+        if self.tracer is None:
+            return
+        if self.tracer.size > 0 and self.episode_dir is not None:
+            if self.tracer.dropped > 0:
+                self.logger.warning(
+                    'Trace buffer full, {} oldest events of the episode dropped (trace_buffer_size).'.format(
+                        self.tracer.dropped))
+            monitor_path = self.episode_dir + '/monitor'
+            os.makedirs(monitor_path, exist_ok=True)
+            self.tracer.dump(monitor_path + '/trace.json')
+        self.tracer.clear()
+
+    def _get_timeout(self, setting: Union[str, float, None],
+                     latency: LatencyTracker) -> Optional[float]:
+        """Timeout to wait for the simulator.
+
+        Args:
+            setting (Union[str, float, None]): Timeout setting, adaptive (derived from latency), fixed seconds or None (wait indefinitely).
+            latency (LatencyTracker): Latency distribution measured for that wait.
+
+        Returns:
+            Optional[float]: Timeout in seconds (None to wait indefinitely).
+        """
+        if setting == 'adaptive':
+            return latency.timeout
+        return setting
+
+    def _continue_simulation(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Start next episode in the live simulation (continuous mode), without restarting EnergyPlus. Episode
+           data is stored in a new episode directory, while EnergyPlus output remains in the directory of the episode
+           which started the simulation.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, Any]]: First observation and info of the episode (received in last step).
+        """
+        self._split_pending = False
+        self._dump_trace()
+        # Copy finished episode artifacts from RAM workspace (if it is used)
+        if self.model.ram_workspace is not None and \
+                self.model.ram_workspace['persist_on'] == 'episode_end':
+            self.model.persist_episode()
+        self.episode_dir = self.model.set_episode_working_dir()
+        self.logger.info(
+            'Episode {}: {} (continuous simulation)'.format(
+                self.episode, self.name))
+
+        obs, info = self._split_obs, self._split_info
+        info.update({'timestep': self.timestep})
+        self.last_obs = obs
+        self.last_info = info
+        self._split_start_info = info
+
+        self.logger.debug('RESET observation received: {}'.format(obs))
+        self.logger.debug('RESET info received: {}'.format(info))
+
+        return obs, info
+
+    def _is_split_boundary(self, info: Dict[str, Any]) -> bool:
+        """Check whether an episode boundary of continuous mode has been reached.
+
+        Args:
+            info (Dict[str, Any]): Info of the observation received in current step.
+
+        Returns:
+            bool: Whether observation belongs to next episode.
+        """
+        if self.episode_split == 'monthly':
+            return info['month'] != self._split_start_info['month']
+        elif self.episode_split == 'weekly':
+            return info['time_elapsed(hours)'] - \
+                self._split_start_info['time_elapsed(hours)'] >= 168
+        else:
+            return self.timestep >= self.episode_split
+
+    def _prepare_episode(
+            self,
+            reset_options: Dict[str, Any],
+            update_weather: bool = True,
+            model: Optional[ModelJSON] = None) -> Tuple[str, Dict[str, str]]:
+        """Prepare building model, weather and working directory for a new episode.
+
+        Args:
+            reset_options (Dict[str, Any]): Options to prepare the episode (weather variability).
+            update_weather (bool, optional): Whether to select a new weather file randomly, else current one is used. Defaults to True.
+            model (Optional[ModelJSON], optional): Model where the episode is prepared. Defaults to environment model.
+
+        Returns:
+            Tuple[str, Dict[str, str]]: Episode directory and paths to start the simulator (building, weather, output and data directory).
+        """
+        model = model if model is not None else self.model
+        # Get new episode working dir
+        with self._trace_span('set_episode_working_dir'):
+            episode_dir = model.set_episode_working_dir()
+        # get weather path
+        if update_weather:
+            model.update_weather_path(np_random=self.np_random)
+        # Readapt building to epw
+        with self._trace_span('adapt_building_to_epw'):
+            model.adapt_building_to_epw()
+        # Getting building, weather and Energyplus output directory
+        with self._trace_span('save_building_model'):
+            eplus_working_building_path = model.save_building_model()
+        with self._trace_span('apply_weather_variability'):
+            eplus_working_weather_path = model.apply_weather_variability(
+                weather_variability=reset_options.get('weather_variability'),
+                np_random=self.np_random)
+        eplus_working_out_path = (episode_dir + '/' + 'output')
+        self.logger.info(
+            'Saving episode output path.'.format(
+                eplus_working_out_path))
+        self.logger.debug(
+            'Path: {}'.format(
+                eplus_working_out_path))
+
+        return episode_dir, {
+            'building_path': eplus_working_building_path,
+            'weather_path': eplus_working_weather_path,
+            'output_path': eplus_working_out_path,
+            'data_dir': model.experiment_path}
+
+    def _start_in_background(
+            self,
+            simulator: EnergyPlus,
+            reset_options: Dict[str, Any],
+            update_weather: bool = True) -> Dict[str, Any]:
+        """Prepare a next episode (in a copy of the model, current episode context is kept) and start its
+           simulation in the simulator specified. Simulation warmup runs in background.
+
+        Args:
+            simulator (EnergyPlus): Simulator (not running) to start.
+            reset_options (Dict[str, Any]): Options to prepare the episode (weather variability).
+            update_weather (bool, optional): Whether to select a new weather file randomly, else current one is used. Defaults to True.
+
+        Returns:
+            Dict[str, Any]: Model episode context of the episode started.
+        """
+        model = self.model.copy_for_episode()
+        _, simulation_paths = self._prepare_episode(
+            reset_options, update_weather, model=model)
+        context = model.get_episode_context()
+        simulator.timer = self.timer
+        simulator.tracer = self.tracer
+        with self._trace_span('simulator_start'):
+            simulator.start(episode=self.episode + 1, **simulation_paths)
+        return context
+
+    def _prefetch_episode(self) -> None:
+        """Prepare next episode (with default reset options and current np_random) and start its simulation in the
+           prefetch simulator.
+        """
+        self._prefetch_context = self._start_in_background(
+            self.prefetch_simulator, self.default_options)
+        self.logger.info(
+            'Episode {} prefetch started.'.format(
+                self.episode + 1))
+
+    def _start_refill(self,
+                      pool_key: Any,
+                      reset_options: Dict[str, Any]) -> None:
+        """Start a simulator for the pool in a background thread (episode preparation and simulator start
+           are out of the reset critical path), which is given to the pool with the key specified.
+
+        Args:
+            pool_key (Any): Simulator pool key of the episode.
+            reset_options (Dict[str, Any]): Options to prepare the episode (weather variability).
+        """
+        def _refill() -> None:
+            simulator = self._make_simulator()
+            try:
+                context = self._start_in_background(
+                    simulator, reset_options, update_weather=False)
+            except Exception as err:
+                self.logger.error(
+                    'Simulator pool refill failed: {}'.format(err))
+                simulator.close()
+                return
+            self.simulator_pool.release(
+                pool_key, simulator, context, model=self.model)
+
+        self._refill_thread = threading.Thread(
+            target=_refill, name=self.name + '-refill', daemon=True)
+        self._refill_thread.start()
+
+    def _join_refill(self) -> None:
+        """Wait for the pool refill in progress (if any).
+        """
+        if self._refill_thread is not None:
+            self._refill_thread.join()
+            self._refill_thread = None
+
+    def _get_pool_key(self,
+                      reset_options: Dict[str, Any],
+                      weather_path: Optional[str] = None) -> Any:
+        """Simulator pool key of an episode.
+
+        Args:
+            reset_options (Dict[str, Any]): Options to prepare the episode (weather variability).
+            weather_path (Optional[str], optional): Weather file of the episode. Defaults to current model weather file.
+
+        Returns:
+            Any: Simulator pool key.
+        """
+        return SimulatorPool.make_key(
+            building_file=self.building_file,
+            weather_file=os.path.basename(
+                weather_path if weather_path is not None else self.model.weather_path),
+            weather_variability=reset_options.get('weather_variability'),
+            simulator_spec=dict(
+                self._simulator_kwargs,
+                backend=self.simulator_backend,
+                extra_config=self.model.config))
+
+    def _swap_pooled_simulator(
+            self,
+            simulator: EnergyPlus,
+            context: Dict[str, Any],
+            model: Optional[ModelJSON]) -> None:
+        """Use a simulator borrowed from the pool for current episode.
+
+        Args:
+            simulator (EnergyPlus): Simulator borrowed from the pool.
+            context (Dict[str, Any]): Model episode context used to start it.
+            model (Optional[ModelJSON]): Model which protects its episode directory (it is unprotected when the simulator is stopped).
+        """
+        self.model.set_episode_context(context)
+        if model is not None:
+            self._output_protection = (model, context['episode_path'])
+        simulator.timer = self.timer
+        simulator.tracer = self.tracer
+        if os.path.dirname(
+                context['episode_path']) == self.model.episode_workspace_path:
+            self.episode_dir = context['episode_path']
+        else:
+            # Started by other environment, its EnergyPlus output is stored
+            # there and this environment episode data in its own workspace
+            self.episode_dir = self.model.set_episode_working_dir()
+            self.logger.info(
+                'Pooled simulation output path: {}'.format(
+                    os.path.dirname(
+                        simulator._output_path)))
+        self.energyplus_simulator = simulator
+
+    def _discard_prefetch(self) -> None:
+        """Stop prefetch simulator and forget the prepared episode. Its directory is removed, so next episode
+           directory takes its number.
+        """
+        self.prefetch_simulator.stop()
+        if self._prefetch_context is not None:
+            self.model.discard_episode_dir(
+                self._prefetch_context['episode_path'])
+        self._prefetch_context = None
+
     def _check_eplus_env(self) -> None:
         """This method checks that environment definition is correct and it has not inconsistencies.
         """
@@ -434,6 +1145,69 @@ class EplusEnv(gym.Env):
                 'Action space shape must match with number of action variables specified.')
             raise err
 
+        # SIMULATOR BACKEND
+        try:
+            assert self.simulator_backend in self.SIMULATOR_BACKENDS
+        except AssertionError as err:
+            self.logger.critical(
+                'Simulator backend must be one of {}, specified value is {}.'.format(
+                    self.SIMULATOR_BACKENDS, self.simulator_backend))
+            raise err
+
+        # PROGRESS
+        try:
+            assert self.energyplus_simulator.progress_mode in EnergyPlus.PROGRESS_MODES
+        except AssertionError as err:
+            self.logger.critical(
+                'Progress reporting must be one of {}, specified value is {}.'.format(
+                    EnergyPlus.PROGRESS_MODES,
+                    self.energyplus_simulator.progress_mode))
+            raise err
+
+        # TRACE
+        if self.tracer is not None:
+            try:
+                assert isinstance(
+                    self.trace_buffer_size, int) and self.trace_buffer_size > 0
+            except AssertionError as err:
+                self.logger.critical(
+                    'Trace buffer size must be a positive int value, specified value is {}.'.format(
+                        self.trace_buffer_size))
+                raise err
+
+        # CONTINUOUS MODE
+        if self.episode_split is not None:
+            try:
+                assert self.episode_split in ['monthly', 'weekly'] or (
+                    isinstance(self.episode_split, int) and self.episode_split > 0)
+            except AssertionError as err:
+                self.logger.critical(
+                    'Episode split must be monthly, weekly or a positive number of timesteps, specified value is {}.'.format(
+                        self.episode_split))
+                raise err
+            try:
+                assert self.prefetch_threshold is None and self.simulator_pool is None
+            except AssertionError as err:
+                self.logger.critical(
+                    'Continuous mode (episode_split) does not restart simulations in each episode, it cannot be used with prefetch or simulator pool.')
+                raise err
+
+        # PREFETCH AND POOL
+        if self.prefetch_threshold is not None:
+            try:
+                assert 0 <= self.prefetch_threshold <= 1
+            except AssertionError as err:
+                self.logger.critical(
+                    'Prefetch threshold must be a fraction of the episode in [0, 1].')
+                raise err
+        if self.prefetch_threshold is not None or self.simulator_pool is not None:
+            try:
+                assert self.model.max_ep_store > 1
+            except AssertionError as err:
+                self.logger.critical(
+                    'Episodes started in advance (prefetch or simulator pool) require storing more than one episode directory (max_ep_data_store_num).')
+                raise err
+
     # ---------------------------------------------------------------------------- #
     #                                  Properties                                  #
     # ---------------------------------------------------------------------------- #
@@ -505,11 +1279,19 @@ class EplusEnv(gym.Env):
 
     @property  # pragma: no cover
     def timestep_per_episode(self) -> int:
-        return self.model.timestep_per_episode
+        return self.model.timestep_per_episode // self.action_repeat
 
     @property  # pragma: no cover
     def step_size(self) -> float:
-        return self.model.step_size
+        return self.model.step_size * self.action_repeat
+
+    @property  # pragma: no cover
+    def action_repeat(self) -> int:
+        return self.energyplus_simulator.action_repeat
+
+    @property  # pragma: no cover
+    def progress(self) -> SimulationProgress:
+        return self.energyplus_simulator.progress
 
     @property  # pragma: no cover
     def zone_names(self) -> list:
@@ -0,0 +1,859 @@
+"""
+Vector environments running several Sinergym environments in threads of a single process or in subprocesses.
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+import traceback
+from contextlib import contextmanager
+from functools import partial
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Sequence,
+                    Tuple, Type, Union)
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import CloudpickleWrapper, batch_space
+
+from sinergym.config import ModelJSON
+from sinergym.utils.common import is_wrapped
+from sinergym.utils.constants import LOG_ENV_LEVEL
+from sinergym.utils.logger import TerminalLogger
+
+
+class SinergymThreadedVectorEnv(VectorEnv):
+
+    # ---------------------------------------------------------------------------- #
+    #                        Vector Environment Terminal Logger                    #
+    # ---------------------------------------------------------------------------- #
+
+    logger = TerminalLogger().getLogger(
+        name='VECTOR ENVIRONMENT',
+        level=LOG_ENV_LEVEL)
+
+    def __init__(
+            self,
+            env_fns: Sequence[Callable[[], gym.Env]],
+            copy: bool = True,
+            autoreset_mode: Union[str, AutoresetMode] = AutoresetMode.NEXT_STEP):
+        """Vector environment which drives N Sinergym environments (each one with its own EnergyPlus state) from N
+           threads of this process. Step delivers the batch of actions to all threads at once, and each thread writes
+           its results in preallocated (N, obs_dim) observation and (N,) reward, terminated and truncated arrays, so
+           simulations advance concurrently (EnergyPlus runs in native code) without pickling or processes.
+
+        Args:
+            env_fns (Sequence[Callable[[], gym.Env]]): Functions that create the environments (they can be wrapped). Observation spaces must be Box spaces of the same shape.
+            copy (bool, optional): Whether reset and step return a copy of the observations array, else preallocated array is returned (overwritten in next step). Defaults to True.
+            autoreset_mode (Union[str, AutoresetMode], optional): Autoreset of finished sub-environments: next step (reset in the next call to step) or same step (final observation and info are returned in infos). Defaults to NEXT_STEP.
+        """
+        super().__init__()
+
+        self.env_fns = env_fns
+        self.copy = copy
+        self.autoreset_mode = autoreset_mode if isinstance(
+            autoreset_mode, AutoresetMode) else AutoresetMode(autoreset_mode)
+
+        try:
+            assert self.autoreset_mode in [
+                AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP]
+        except AssertionError as err:
+            self.logger.critical(
+                'Autoreset mode must be NextStep or SameStep, specified value is {}.'.format(
+                    self.autoreset_mode))
+            raise err
+
+        # Sub-environments
+        self.envs: List[gym.Env] = [env_fn() for env_fn in env_fns]
+        self.num_envs = len(self.envs)
+        self.metadata = dict(self.envs[0].metadata)
+        self.metadata['autoreset_mode'] = self.autoreset_mode
+        self.render_mode = self.envs[0].render_mode
+
+        # Spaces
+        self.single_observation_space = self.envs[0].observation_space
+        self.single_action_space = self.envs[0].action_space
+        for env in self.envs:
+            try:
+                assert isinstance(env.observation_space, gym.spaces.Box)
+                assert len(env.observation_space.shape) == 1
+                assert env.observation_space.shape == self.single_observation_space.shape
+                assert env.action_space == self.single_action_space
+            except AssertionError as err:
+                self.logger.critical(
+                    'Sub-environments must have 1D Box observation spaces of the same shape and the same action space.')
+                raise err
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs)
+        self.action_space = batch_space(
+            self.single_action_space, self.num_envs)
+
+        # Preallocated results (written in place by each thread)
+        self._observations = np.zeros(
+            (self.num_envs,) + self.single_observation_space.shape,
+            dtype=self.single_observation_space.dtype)
+        self._rewards = np.zeros((self.num_envs,), dtype=np.float64)
+        self._terminations = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._infos: List[Optional[Dict[str, Any]]] = [None] * self.num_envs
+        self._final_infos: List[Optional[Dict[str, Any]]] = [
+            None] * self.num_envs
+
+        # Commands for each thread (step, reset or None to finish) and their
+        # arguments
+        self._commands: List[Optional[str]] = [None] * self.num_envs
+        self._actions: Any = None
+        self._reset_kwargs: List[Dict[str, Any]] = [{}] * self.num_envs
+        self._errors: List[Optional[BaseException]] = [None] * self.num_envs
+
+        # Signals: command ready for each thread, and command completed
+        self._command_ready = [threading.Semaphore(0)
+                               for _ in range(self.num_envs)]
+        self._command_done = threading.Semaphore(0)
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(i,),
+                name='sinergym-vector-{}'.format(i),
+                daemon=True) for i in range(self.num_envs)]
+        for thread in self._threads:
+            thread.start()
+
+        self.logger.info(
+            'Threaded vector environment created with {} environments.'.format(
+                self.num_envs))
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def reset(self,
+              *,
+              seed: Optional[Union[int,
+                                   List[Optional[int]]]] = None,
+              options: Optional[Dict[str,
+                                     Any]] = None) -> Tuple[np.ndarray,
+                                                            Dict[str,
+                                                                 Any]]:
+        """Reset all sub-environments (concurrently).
+
+        Args:
+            seed (Optional[Union[int, List[Optional[int]]]], optional): Seed of each sub-environment, or seed of the first one (seed + i is used in sub-environment i). Defaults to None.
+            options (Optional[Dict[str, Any]], optional): Reset options of all sub-environments. Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, Any]]: Batch of observations and batched infos.
+        """
+        if seed is None:
+            seed = [None] * self.num_envs
+        elif isinstance(seed, int):
+            seed = [seed + i for i in range(self.num_envs)]
+        try:
+            assert len(seed) == self.num_envs
+        except AssertionError as err:
+            self.logger.critical(
+                'A seed must be specified for each environment ({}), specified seeds are {}.'.format(
+                    self.num_envs, seed))
+            raise err
+
+        self._reset_kwargs = [{'seed': env_seed, 'options': options}
+                              for env_seed in seed]
+        self._run_command('reset')
+        self._autoreset_envs[:] = False
+
+        infos = {}
+        for i, info in enumerate(self._infos):
+            infos = self._add_info(infos, info, i)
+        return (self._observations.copy()
+                if self.copy else self._observations), infos
+
+    def step(self, actions: Any) -> Tuple[
+            np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Send a batch of actions to the sub-environments (concurrently) and gather their results.
+
+        Args:
+            actions (Any): Batch of actions (one for each sub-environment).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]: Batch of observations, rewards, terminated and truncated flags, and batched infos.
+        """
+        self._actions = actions
+        self._run_command('step')
+
+        infos = {}
+        for i, info in enumerate(self._infos):
+            if self._final_infos[i] is not None:
+                infos = self._add_info(infos, self._final_infos[i], i)
+            infos = self._add_info(infos, info, i)
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            np.logical_or(
+                self._terminations,
+                self._truncations,
+                out=self._autoreset_envs)
+
+        return (self._observations.copy() if self.copy else self._observations,
+                self._rewards.copy(),
+                self._terminations.copy(),
+                self._truncations.copy(),
+                infos)
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+        """Call a method (or get an attribute) of each sub-environment, including wrapper attributes.
+
+        Args:
+            name (str): Method or attribute name.
+
+        Returns:
+            Tuple[Any, ...]: Result of each sub-environment.
+        """
+        results = []
+        for env in self.envs:
+            attribute = env.get_wrapper_attr(name)
+            results.append(attribute(*args, **kwargs)
+                           if callable(attribute) else attribute)
+        return tuple(results)
+
+    def get_attr(self, name: str) -> Tuple[Any, ...]:
+        """Get an attribute of each sub-environment (including wrapper attributes).
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Tuple[Any, ...]: Attribute value of each sub-environment.
+        """
+        return tuple(env.get_wrapper_attr(name) for env in self.envs)
+
+    def env_is_wrapped(
+            self, wrapper_class: Type[gym.Wrapper]) -> Tuple[bool, ...]:
+        """Check if each sub-environment has been wrapped with a given wrapper.
+
+        Args:
+            wrapper_class (Type[gym.Wrapper]): Wrapper class to look for.
+
+        Returns:
+            Tuple[bool, ...]: Whether each sub-environment is wrapped with wrapper_class.
+        """
+        return tuple(is_wrapped(env, wrapper_class) for env in self.envs)
+
+    def close_extras(self, **kwargs: Any) -> None:
+        """Finish the threads and close all sub-environments.
+        """
+        self._commands = [None] * self.num_envs
+        for ready in self._command_ready:
+            ready.release()
+        for thread in self._threads:
+            thread.join()
+        for env in self.envs:
+            env.close()
+        self.logger.info('Threaded vector environment closed.')
+
+    # ---------------------------------------------------------------------------- #
+    #                              Auxiliary methods                               #
+    # ---------------------------------------------------------------------------- #
+
+    def _run_command(self, command: str) -> None:
+        """Run a command in all threads and wait for their completion.
+
+        Args:
+            command (str): step or reset.
+
+        Raises:
+            Exception: First exception raised in a sub-environment (all of them have completed the command).
+        """
+        for i in range(self.num_envs):
+            self._commands[i] = command
+            self._command_ready[i].release()
+        for _ in range(self.num_envs):
+            self._command_done.acquire()
+        for i, err in enumerate(self._errors):
+            if err is not None:
+                self._errors[i] = None
+                self.logger.critical(
+                    'Environment {} raised an exception in {}.'.format(
+                        i, command))
+                raise err
+
+    def _worker(self, i: int) -> None:
+        """Loop of the thread of sub-environment i.
+
+        Args:
+            i (int): Index of the sub-environment.
+        """
+        env = self.envs[i]
+        while True:
+            self._command_ready[i].acquire()
+            command = self._commands[i]
+            if command is None:
+                break
+            try:
+                self._final_infos[i] = None
+                if command == 'reset' or self._autoreset_envs[i]:
+                    if command == 'reset':
+                        obs, info = env.reset(**self._reset_kwargs[i])
+                    else:
+                        obs, info = env.reset()
+                    reward, terminated, truncated = 0.0, False, False
+                else:
+                    obs, reward, terminated, truncated, info = env.step(
+                        self._actions[i])
+                    if self.autoreset_mode == AutoresetMode.SAME_STEP and (
+                            terminated or truncated):
+                        self._final_infos[i] = {
+                            'final_obs': obs, 'final_info': info}
+                        obs, info = env.reset()
+                self._observations[i] = obs
+                self._rewards[i] = reward
+                self._terminations[i] = terminated
+                self._truncations[i] = truncated
+                self._infos[i] = info
+            except BaseException as err:
+                self._errors[i] = err
+            self._command_done.release()
+
+
+class SharedArrays(object):
+    """Named numpy arrays in a single shared memory block. The block is attached (by name) when the object is passed
+       to a child process, so arrays are written by workers and read by the owner without copies through pipes.
+
+        :param specs: Shape and dtype of each array.
+    """
+
+    def __init__(self, specs: Dict[str, Tuple[Tuple[int, ...], Any]]):
+        """Constructor (creates the shared memory block).
+
+        Args:
+            specs (Dict[str, Tuple[Tuple[int, ...], Any]]): Shape and dtype of each array by name.
+        """
+        self.specs = {name: (tuple(shape), np.dtype(dtype))
+                      for name, (shape, dtype) in specs.items()}
+        size = sum(self._nbytes(shape, dtype)
+                   for shape, dtype in self.specs.values())
+        self.shm = SharedMemory(create=True, size=max(size, 1))
+        self._owner = True
+        self._bind_arrays()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'name': self.shm.name, 'specs': self.specs}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.specs = state['specs']
+        # Attached block is unlinked by its owner (not by this process)
+        try:
+            self.shm = SharedMemory(name=state['name'], track=False)
+        except TypeError:  # pragma: no cover
+            # Python < 3.13: spawned processes share the resource tracker of
+            # the owner, where the block is already registered
+            self.shm = SharedMemory(name=state['name'])
+        self._owner = False
+        self._bind_arrays()
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def release(self) -> None:
+        """Detach the shared memory block (and unlink it if this object is the owner).
+        """
+        self.arrays = {}
+        try:
+            self.shm.close()
+        except BufferError:  # pragma: no cover
+            # Views of the block still alive, memory is freed with them
+            pass
+        if self._owner:
+            self.shm.unlink()
+            self._owner = False
+
+    @staticmethod
+    def _nbytes(shape: Tuple[int, ...], dtype: np.dtype) -> int:
+        # Arrays are 8 bytes aligned in the block
+        return -(-int(np.prod(shape)) * dtype.itemsize // 8) * 8
+
+    def _bind_arrays(self) -> None:
+        self.arrays: Dict[str, np.ndarray] = {}
+        offset = 0
+        for name, (shape, dtype) in self.specs.items():
+            self.arrays[name] = np.ndarray(
+                shape, dtype=dtype, buffer=self.shm.buf, offset=offset)
+            offset += self._nbytes(shape, dtype)
+
+
+@contextmanager
+def _main_module_hidden() -> Iterator[None]:
+    """Hide the main module of this process while sub-environment processes are spawned, so they do not run it
+       again (their environment factory is pickled by value with cloudpickle). Scripts creating a
+       SinergymSubprocVectorEnv do not need a __main__ guard.
+    """
+    main_module = sys.modules['__main__']
+    main_spec = getattr(main_module, '__spec__', None)
+    main_file = getattr(main_module, '__file__', None)
+    main_module.__spec__ = None
+    if main_file is not None:
+        del main_module.__file__
+    try:
+        yield
+    finally:
+        main_module.__spec__ = main_spec
+        if main_file is not None:
+            main_module.__file__ = main_file
+
+
+def _make_env(env_id: str,
+              env_kwargs: Dict[str, Any],
+              wrappers: Optional[Callable[[gym.Env], gym.Env]],
+              workspace_path: str) -> gym.Env:
+    """Create a sub-environment of SinergymSubprocVectorEnv in its own workspace.
+
+    Args:
+        env_id (str): Environment id.
+        env_kwargs (Dict[str, Any]): Environment parameters.
+        wrappers (Optional[Callable[[gym.Env], gym.Env]]): Function applying wrappers to the environment.
+        workspace_path (str): Experiment directory of the sub-environment.
+
+    Returns:
+        gym.Env: Sub-environment.
+    """
+    env = gym.make(env_id, **dict(env_kwargs, workspace_path=workspace_path))
+    if wrappers is not None:
+        env = wrappers(env)
+    return env
+
+
+def _subproc_worker(index: int,
+                    env_fn: CloudpickleWrapper,
+                    pipe: Connection,
+                    parent_pipe: Connection,
+                    autoreset_mode: str,
+                    infos: bool) -> None:
+    """Loop of the process of sub-environment index. Observation, reward, terminated and truncated are written in
+       shared arrays, only infos (if enabled) and call results are sent through the pipe.
+
+    Args:
+        index (int): Index of the sub-environment.
+        env_fn (CloudpickleWrapper): Function that creates the sub-environment.
+        pipe (Connection): Worker end of the pipe.
+        parent_pipe (Connection): Parent end of the pipe (closed in the worker).
+        autoreset_mode (str): Autoreset mode value (NextStep or SameStep).
+        infos (bool): Whether infos are sent to the parent.
+    """
+    parent_pipe.close()
+    env, arrays = None, None
+    same_step = autoreset_mode == AutoresetMode.SAME_STEP.value
+    autoreset = False
+    while True:
+        try:
+            if env is None:
+                env = env_fn()
+                command, result = 'make', (env.observation_space,
+                                           env.action_space,
+                                           env.metadata,
+                                           env.render_mode)
+            else:
+                command, data = pipe.recv()
+                result = None
+                if command == 'attach':
+                    arrays = data
+                elif command in ('reset', 'step'):
+                    final = None
+                    if command == 'reset' or autoreset:
+                        obs, info = env.reset(
+                            **data) if command == 'reset' else env.reset()
+                        reward, terminated, truncated = 0.0, False, False
+                    else:
+                        action = arrays['actions'][index]
+                        if isinstance(action, np.ndarray):
+                            action = action.copy()
+                        obs, reward, terminated, truncated, info = env.step(
+                            action)
+                        if same_step and (terminated or truncated):
+                            final = {'final_obs': obs,
+                                     'final_info': info if infos else {}}
+                            obs, info = env.reset()
+                    autoreset = not same_step and (terminated or truncated)
+                    arrays['observations'][index] = obs
+                    arrays['rewards'][index] = reward
+                    arrays['terminations'][index] = terminated
+                    arrays['truncations'][index] = truncated
+                    result = (info if infos else None, final)
+                elif command == 'call':
+                    name, args, kwargs = data
+                    attribute = env.get_wrapper_attr(name)
+                    result = attribute(
+                        *args, **kwargs) if callable(attribute) else attribute
+                elif command == 'is_wrapped':
+                    result = is_wrapped(env, data)
+                elif command == 'close':
+                    env.close()
+                    if arrays is not None:
+                        arrays.release()
+            pipe.send((True, result))
+        except (KeyboardInterrupt, EOFError):
+            break
+        except BaseException as err:
+            try:
+                pipe.send((False, err))
+            except BaseException:
+                # Exception cannot be pickled
+                pipe.send((False, RuntimeError(traceback.format_exc())))
+            if env is None:
+                break
+            continue
+        if command == 'close':
+            break
+    pipe.close()
+
+
+class SinergymSubprocVectorEnv(VectorEnv):
+
+    # ---------------------------------------------------------------------------- #
+    #                        Vector Environment Terminal Logger                    #
+    # ---------------------------------------------------------------------------- #
+
+    logger = TerminalLogger().getLogger(
+        name='VECTOR ENVIRONMENT',
+        level=LOG_ENV_LEVEL)
+
+    CLOSE_TIMEOUT = 60
+
+    def __init__(
+            self,
+            env_id: str,
+            num_envs: int,
+            env_kwargs: Optional[Dict[str, Any]] = None,
+            wrappers: Optional[Callable[[gym.Env], gym.Env]] = None,
+            workspace_path: Optional[str] = None,
+            infos: bool = True,
+            copy: bool = True,
+            autoreset_mode: Union[str, AutoresetMode] = AutoresetMode.NEXT_STEP):
+        """Vector environment which runs N Sinergym environments in N spawned processes. Observations, rewards,
+           terminated and truncated flags are written by the workers in shared memory arrays, and actions are read
+           from a shared array, so only commands and (optionally) infos go through pipes. All sub-environments share
+           an experiment directory, where sub-environment i uses the worker-<i> directory, and reset with an int seed
+           uses seed + i in sub-environment i (weather file choice and weather variability noise depend on it).
+
+        Args:
+            env_id (str): Sinergym environment id.
+            num_envs (int): Number of sub-environments.
+            env_kwargs (Optional[Dict[str, Any]], optional): Parameters of all sub-environments (gym.make). Defaults to None.
+            wrappers (Optional[Callable[[gym.Env], gym.Env]], optional): Function applying wrappers to each sub-environment (it is pickled with cloudpickle). Defaults to None.
+            workspace_path (Optional[str], optional): Experiment directory of the vector environment. Defaults to a new Eplus-env-<env_name>-res<N> directory in current working directory.
+            infos (bool, optional): Whether infos of the sub-environments are sent to this process and batched, else step and reset return empty infos. Defaults to True.
+            copy (bool, optional): Whether reset and step return a copy of the observations array, else shared array is returned (overwritten in next step). Defaults to True.
+            autoreset_mode (Union[str, AutoresetMode], optional): Autoreset of finished sub-environments: next step (reset in the next call to step) or same step (final observation and info are returned in infos). Defaults to NEXT_STEP.
+        """
+        super().__init__()
+
+        self.env_id = env_id
+        self.num_envs = num_envs
+        self.env_kwargs = dict(env_kwargs or {})
+        self.infos = infos
+        self.copy = copy
+        self.autoreset_mode = autoreset_mode if isinstance(
+            autoreset_mode, AutoresetMode) else AutoresetMode(autoreset_mode)
+
+        try:
+            assert self.num_envs >= 1
+        except AssertionError as err:
+            self.logger.critical(
+                'Number of environments must be at least 1, specified value is {}.'.format(
+                    self.num_envs))
+            raise err
+        try:
+            assert self.autoreset_mode in [
+                AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP]
+        except AssertionError as err:
+            self.logger.critical(
+                'Autoreset mode must be NextStep or SameStep, specified value is {}.'.format(
+                    self.autoreset_mode))
+            raise err
+        try:
+            assert 'workspace_path' not in self.env_kwargs
+        except AssertionError as err:
+            self.logger.critical(
+                'workspace_path is set by the vector environment for each sub-environment, use workspace_path argument of the vector environment instead.')
+            raise err
+
+        # Experiment directory (created once) and a fixed directory for each
+        # sub-environment
+        if workspace_path is None:
+            env_name = self.env_kwargs.get(
+                'env_name', gym.spec(env_id).kwargs.get('env_name', env_id))
+            self.workspace_path = ModelJSON.create_experiment_dir(env_name)
+        else:
+            self.workspace_path = os.path.abspath(workspace_path)
+            os.makedirs(self.workspace_path, exist_ok=True)
+        self.worker_paths = [
+            os.path.join(
+                self.workspace_path,
+                'worker-{}'.format(i)) for i in range(
+                self.num_envs)]
+
+        # Sub-environment processes
+        ctx = multiprocessing.get_context('spawn')
+        self._pipes: List[Connection] = []
+        self._processes = []
+        with _main_module_hidden():
+            for i in range(self.num_envs):
+                parent_pipe, child_pipe = ctx.Pipe()
+                env_fn = partial(
+                    _make_env,
+                    env_id,
+                    self.env_kwargs,
+                    wrappers,
+                    self.worker_paths[i])
+                process = ctx.Process(
+                    target=_subproc_worker,
+                    name='sinergym-vector-{}'.format(i),
+                    args=(i,
+                          CloudpickleWrapper(env_fn),
+                          child_pipe,
+                          parent_pipe,
+                          self.autoreset_mode.value,
+                          self.infos),
+                    daemon=True)
+                process.start()
+                child_pipe.close()
+                self._pipes.append(parent_pipe)
+                self._processes.append(process)
+        self._arrays: Optional[SharedArrays] = None
+
+        # Spaces (reported by each sub-environment once it is created)
+        try:
+            spaces = self._receive('make')
+        except BaseException as err:
+            self.close()
+            raise err
+        observation_space, action_space, metadata, render_mode = spaces[0]
+        for env_observation_space, env_action_space, _, _ in spaces:
+            try:
+                assert isinstance(env_observation_space, gym.spaces.Box)
+                assert len(env_observation_space.shape) == 1
+                assert env_observation_space.shape == observation_space.shape
+                assert env_action_space == action_space
+            except AssertionError as err:
+                self.logger.critical(
+                    'Sub-environments must have 1D Box observation spaces of the same shape and the same action space.')
+                self.close()
+                raise err
+        self.metadata = dict(metadata)
+        self.metadata['autoreset_mode'] = self.autoreset_mode
+        self.render_mode = render_mode
+        self.single_observation_space = observation_space
+        self.single_action_space = action_space
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs)
+        self.action_space = batch_space(
+            self.single_action_space, self.num_envs)
+
+        # Shared arrays (written by the workers)
+        self._arrays = SharedArrays({
+            'observations': ((self.num_envs,) + self.single_observation_space.shape,
+                             self.single_observation_space.dtype),
+            'actions': ((self.num_envs,) + self.single_action_space.shape,
+                        self.single_action_space.dtype),
+            'rewards': ((self.num_envs,), np.float64),
+            'terminations': ((self.num_envs,), np.bool_),
+            'truncations': ((self.num_envs,), np.bool_)})
+        self._observations = self._arrays['observations']
+        self._actions = self._arrays['actions']
+        self._rewards = self._arrays['rewards']
+        self._terminations = self._arrays['terminations']
+        self._truncations = self._arrays['truncations']
+        self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
+        for pipe in self._pipes:
+            pipe.send(('attach', self._arrays))
+        self._receive('attach')
+
+        self.logger.info(
+            'Subprocess vector environment created with {} environments in {}.'.format(
+                self.num_envs, self.workspace_path))
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def reset(self,
+              *,
+              seed: Optional[Union[int,
+                                   List[Optional[int]]]] = None,
+              options: Optional[Dict[str,
+                                     Any]] = None) -> Tuple[np.ndarray,
+                                                            Dict[str,
+                                                                 Any]]:
+        """Reset all sub-environments (concurrently).
+
+        Args:
+            seed (Optional[Union[int, List[Optional[int]]]], optional): Seed of each sub-environment, or seed of the first one (seed + i is used in sub-environment i). Defaults to None.
+            options (Optional[Dict[str, Any]], optional): Reset options of all sub-environments. Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, Any]]: Batch of observations and batched infos (empty if infos are disabled).
+        """
+        if seed is None:
+            seed = [None] * self.num_envs
+        elif isinstance(seed, int):
+            seed = [seed + i for i in range(self.num_envs)]
+        try:
+            assert len(seed) == self.num_envs
+        except AssertionError as err:
+            self.logger.critical(
+                'A seed must be specified for each environment ({}), specified seeds are {}.'.format(
+                    self.num_envs, seed))
+            raise err
+
+        for pipe, env_seed in zip(self._pipes, seed):
+            pipe.send(('reset', {'seed': env_seed, 'options': options}))
+        results = self._receive('reset')
+        self._autoreset_envs[:] = False
+
+        return (self._observations.copy()
+                if self.copy else self._observations), self._batch_infos(results)
+
+    def step(self, actions: Any) -> Tuple[
+            np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """Send a batch of actions to the sub-environments (concurrently) and gather their results.
+
+        Args:
+            actions (Any): Batch of actions (one for each sub-environment).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]: Batch of observations, rewards, terminated and truncated flags, and batched infos (empty if infos are disabled).
+        """
+        self._actions[:] = actions
+        for pipe in self._pipes:
+            pipe.send(('step', None))
+        results = self._receive('step')
+
+        infos = self._batch_infos(results)
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            np.logical_or(
+                self._terminations,
+                self._truncations,
+                out=self._autoreset_envs)
+
+        return (self._observations.copy() if self.copy else self._observations,
+                self._rewards.copy(),
+                self._terminations.copy(),
+                self._truncations.copy(),
+                infos)
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+        """Call a method (or get an attribute) of each sub-environment, including wrapper attributes. Arguments and
+           results are pickled.
+
+        Args:
+            name (str): Method or attribute name.
+
+        Returns:
+            Tuple[Any, ...]: Result of each sub-environment.
+        """
+        for pipe in self._pipes:
+            pipe.send(('call', (name, args, kwargs)))
+        return tuple(self._receive('call'))
+
+    def get_attr(self, name: str) -> Tuple[Any, ...]:
+        """Get an attribute of each sub-environment (including wrapper attributes).
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Tuple[Any, ...]: Attribute value of each sub-environment.
+        """
+        return self.call(name)
+
+    def env_is_wrapped(
+            self, wrapper_class: Type[gym.Wrapper]) -> Tuple[bool, ...]:
+        """Check if each sub-environment has been wrapped with a given wrapper (checked in each worker).
+
+        Args:
+            wrapper_class (Type[gym.Wrapper]): Wrapper class to look for.
+
+        Returns:
+            Tuple[bool, ...]: Whether each sub-environment is wrapped with wrapper_class.
+        """
+        for pipe in self._pipes:
+            pipe.send(('is_wrapped', wrapper_class))
+        return tuple(self._receive('is_wrapped'))
+
+    def close_extras(self, **kwargs: Any) -> None:
+        """Close all sub-environments, finish their processes and free shared memory.
+        """
+        for pipe, process in zip(self._pipes, self._processes):
+            if process.is_alive():
+                try:
+                    pipe.send(('close', None))
+                except (BrokenPipeError, OSError):
+                    pass
+        for pipe, process in zip(self._pipes, self._processes):
+            try:
+                if pipe.poll(self.CLOSE_TIMEOUT):
+                    pipe.recv()
+            except (EOFError, OSError):
+                pass
+            process.join(self.CLOSE_TIMEOUT)
+            if process.is_alive():
+                self.logger.warning(
+                    'Process {} did not finish in {} seconds, terminating it.'.format(
+                        process.name, self.CLOSE_TIMEOUT))
+                process.terminate()
+                process.join()
+            pipe.close()
+        if self._arrays is not None:
+            self._observations = self._observations.copy()
+            self._actions = self._rewards = self._terminations = self._truncations = None
+            self._arrays.release()
+        self.logger.info('Subprocess vector environment closed.')
+
+    # ---------------------------------------------------------------------------- #
+    #                              Auxiliary methods                               #
+    # ---------------------------------------------------------------------------- #
+
+    def _receive(self, command: str) -> List[Any]:
+        """Wait for the result of a command in all sub-environments.
+
+        Args:
+            command (str): Command sent to the sub-environments.
+
+        Raises:
+            Exception: First exception raised in a sub-environment (all of them have completed the command).
+
+        Returns:
+            List[Any]: Result of each sub-environment.
+        """
+        results, error = [], None
+        for i, pipe in enumerate(self._pipes):
+            try:
+                success, result = pipe.recv()
+            except (EOFError, ConnectionResetError) as err:
+                success, result = False, err
+            if not success and error is None:
+                self.logger.critical(
+                    'Environment {} raised an exception in {}.'.format(
+                        i, command))
+                error = result
+            results.append(result)
+        if error is not None:
+            raise error
+        return results
+
+    def _batch_infos(self, results: List[Any]) -> Dict[str, Any]:
+        """Batch infos (and final observations and infos in same step autoreset) of the sub-environments.
+
+        Args:
+            results (List[Any]): Info and final info of each sub-environment.
+
+        Returns:
+            Dict[str, Any]: Batched infos.
+        """
+        infos = {}
+        for i, (info, final) in enumerate(results):
+            if final is not None:
+                infos = self._add_info(infos, final, i)
+            if info is not None:
+                infos = self._add_info(infos, info, i)
+        return infos
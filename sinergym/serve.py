@@ -0,0 +1,666 @@
+"""
+Environment server: Sinergym environments hosted behind a TCP or Unix socket, with a compact binary protocol, and
+clients (a Gymnasium environment among them) to use them from other processes or machines.
+
+Protocol (little-endian): each message is a header (type, flags, number of environments, payload length) followed
+by its payload. Observations, rewards and actions are float32 arrays and terminated and truncated flags are uint8
+arrays; JSON is only used for the environments specification, reset arguments and infos (when they are requested).
+
+    - SPEC: request without payload, response with JSON specification of the hosted environments.
+    - RESET: JSON request (indices, seeds and options), response with observations (and JSON infos).
+    - STEP: request with uint16 environment indices and float32 actions (one row per environment), response with
+      observations, rewards, terminated and truncated flags (and JSON infos).
+    - ERROR: response with the error message (utf-8) of a failed request.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import gymnasium as gym
+import numpy as np
+
+from sinergym.utils.constants import (LOG_SERVE_LEVEL, SERVE_CONNECT_TIMEOUT,
+                                      SERVE_PORT)
+from sinergym.utils.logger import TerminalLogger
+
+# Message header: type, flags, number of environments and payload length
+HEADER = struct.Struct('<BBHI')
+# Message types
+SPEC, RESET, STEP, ERROR = 1, 2, 3, 255
+# Flags
+INFOS = 1
+
+
+def _frame(kind: int, flags: int, count: int, *payload: bytes) -> bytes:
+    """Build a message.
+
+    Args:
+        kind (int): Message type.
+        flags (int): Message flags.
+        count (int): Number of environments in the message.
+
+    Returns:
+        bytes: Header and payload.
+    """
+    body = b''.join(payload)
+    return HEADER.pack(kind, flags, count, len(body)) + body
+
+
+def _dumps(data: Any) -> bytes:
+    # numpy values (actions, observation values in infos) as Python values
+    return json.dumps(
+        data,
+        default=lambda value: value.tolist() if hasattr(
+            value,
+            'tolist') else str(value)).encode()
+
+
+def _space_to_dict(space: gym.spaces.Space) -> Dict[str, Any]:
+    """JSON description of a Box or Discrete space.
+
+    Args:
+        space (gym.spaces.Space): Box or Discrete space.
+
+    Returns:
+        Dict[str, Any]: Space description.
+    """
+    if isinstance(space, gym.spaces.Discrete):
+        return {'type': 'Discrete', 'n': int(space.n),
+                'start': int(space.start)}
+    return {'type': 'Box',
+            'low': space.low.tolist(),
+            'high': space.high.tolist(),
+            'shape': list(space.shape),
+            'dtype': str(space.dtype)}
+
+
+def _space_from_dict(description: Dict[str, Any]) -> gym.spaces.Space:
+    """Space from its JSON description.
+
+    Args:
+        description (Dict[str, Any]): Space description.
+
+    Returns:
+        gym.spaces.Space: Box or Discrete space.
+    """
+    if description['type'] == 'Discrete':
+        return gym.spaces.Discrete(
+            description['n'], start=description['start'])
+    return gym.spaces.Box(
+        low=np.array(description['low'], dtype=description['dtype']),
+        high=np.array(description['high'], dtype=description['dtype']),
+        shape=tuple(description['shape']),
+        dtype=description['dtype'])
+
+
+def _action_dim(space: gym.spaces.Space) -> int:
+    # Discrete actions are sent as one value
+    if isinstance(space, gym.spaces.Discrete):
+        return 1
+    return int(np.prod(space.shape))
+
+
+class EnvServer(object):
+
+    # ---------------------------------------------------------------------------- #
+    #                           Server Terminal Logger                             #
+    # ---------------------------------------------------------------------------- #
+
+    logger = TerminalLogger().getLogger(
+        name='SERVER',
+        level=LOG_SERVE_LEVEL)
+
+    def __init__(
+            self,
+            envs: Sequence[gym.Env],
+            host: str = '127.0.0.1',
+            port: int = SERVE_PORT,
+            unix_path: Optional[str] = None):
+        """Server hosting Sinergym environments behind a TCP socket (host and port) or a Unix socket (unix_path).
+           Requests of all connections are served by one event loop: the environments of a STEP request advance
+           concurrently with async_step, so EnergyPlus simulations overlap without a thread per environment.
+           Environments are driven through their unwrapped async interface, wrappers can be applied on client side.
+
+        Args:
+            envs (Sequence[gym.Env]): Hosted environments (with async_reset and async_step). Observation spaces must be 1D Box spaces of the same shape and action spaces must be equal.
+            host (str, optional): TCP host. Defaults to '127.0.0.1' (localhost only).
+            port (int, optional): TCP port, 0 selects a free port. Defaults to SERVE_PORT.
+            unix_path (Optional[str], optional): Unix socket path, used instead of TCP if specified. Defaults to None.
+        """
+        self.envs = [env.unwrapped for env in envs]
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+
+        for env in self.envs:
+            try:
+                assert hasattr(env, 'async_step') and hasattr(
+                    env, 'async_reset')
+                assert isinstance(env.observation_space, gym.spaces.Box)
+                assert len(env.observation_space.shape) == 1
+                assert env.observation_space.shape == self.envs[0].observation_space.shape
+                assert env.action_space == self.envs[0].action_space
+            except AssertionError as err:
+                self.logger.critical(
+                    'Hosted environments must have async_reset and async_step, 1D Box observation spaces of the same shape and the same action space.')
+                raise err
+        if any(env is not env.unwrapped for env in envs):
+            self.logger.warning(
+                'Wrappers of hosted environments are not applied, apply them to the client environment.')
+
+        self.obs_dim = self.envs[0].observation_space.shape[0]
+        self.action_dim = _action_dim(self.envs[0].action_space)
+        # Environments used by a request (several connections can share
+        # them)
+        self._locks: List[asyncio.Lock] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Open connections (closed when the server is stopped)
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._stop_event: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def serve_forever(self) -> None:
+        """Serve requests in this thread until stop is called (or the process is interrupted).
+        """
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            self.logger.info('Server interrupted.')
+
+    def start(self) -> Union[Tuple[str, int], str]:
+        """Serve requests in a background thread.
+
+        Returns:
+            Union[Tuple[str, int], str]: Address of the server (host and port, or Unix socket path).
+        """
+        self._ready.clear()
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            name='sinergym-server',
+            daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        try:
+            assert self._server is not None
+        except AssertionError as err:
+            self.logger.critical('Server could not be started.')
+            raise err
+        return self.address
+
+    def stop(self) -> None:
+        """Stop serving requests and close open connections (hosted environments are kept).
+        """
+        if self._loop is not None and self._stop_event is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop serving requests and close hosted environments.
+        """
+        self.stop()
+        for env in self.envs:
+            env.close()
+        self.logger.info('Server closed.')
+
+    # ---------------------------------------------------------------------------- #
+    #                              Auxiliary methods                               #
+    # ---------------------------------------------------------------------------- #
+
+    async def _serve(self) -> None:
+        """Listen and serve connections until the server is stopped.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._locks = [asyncio.Lock() for _ in self.envs]
+        self._stop_event = asyncio.Event()
+        try:
+            if self.unix_path is not None:
+                self._server = await asyncio.start_unix_server(self._handle, path=self.unix_path)
+            else:
+                self._server = await asyncio.start_server(self._handle, host=self.host, port=self.port)
+                self.port = self._server.sockets[0].getsockname()[1]
+        finally:
+            self._ready.set()
+        self.logger.info(
+            'Serving {} environments in {}.'.format(
+                len(self.envs), self.address))
+        try:
+            await self._stop_event.wait()
+        finally:
+            # Server waits for open connections to be closed (clients could
+            # keep them open indefinitely)
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = self._stop_event = None
+            if self.unix_path is not None and os.path.exists(self.unix_path):
+                os.remove(self.unix_path)
+
+    async def _handle(self,
+                      reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of a connection.
+
+        Args:
+            reader (asyncio.StreamReader): Connection reader.
+            writer (asyncio.StreamWriter): Connection writer.
+        """
+        sock = writer.get_extra_info('socket')
+        if sock is not None and sock.family != socket.AF_UNIX:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._writers.add(writer)
+        try:
+            while True:
+                kind, flags, count, length = HEADER.unpack(
+                    await reader.readexactly(HEADER.size))
+                payload = await reader.readexactly(length)
+                try:
+                    response = await self._dispatch(kind, flags, count, payload)
+                except Exception as err:
+                    self.logger.error(
+                        'Request {} failed: {!r}'.format(kind, err))
+                    response = _frame(ERROR, 0, 0, repr(err).encode())
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError,
+                asyncio.CancelledError):
+            # Client closed the connection, or server was stopped (pending
+            # requests are cancelled)
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, kind: int, flags: int,
+                        count: int, payload: bytes) -> bytes:
+        """Run a request and build its response.
+
+        Args:
+            kind (int): Message type.
+            flags (int): Message flags.
+            count (int): Number of environments in the request.
+            payload (bytes): Request payload.
+
+        Returns:
+            bytes: Response message.
+        """
+        if kind == SPEC:
+            return _frame(SPEC, 0, len(self.envs), _dumps(self.spec))
+
+        if kind == RESET:
+            request = json.loads(payload)
+            indices = request['indices']
+            seeds = request.get('seeds') or [None] * len(indices)
+            results = await asyncio.gather(*[self._run(i, self.envs[i].async_reset(seed=seed, options=request.get('options')))
+                                             for i, seed in zip(self._check_indices(indices), seeds)])
+            obs = np.array([result[0] for result in results], dtype='<f4')
+            infos = [result[1] for result in results]
+            return _frame(RESET, flags, len(indices), obs.tobytes(),
+                          _dumps(infos) if flags & INFOS else b'')
+
+        if kind == STEP:
+            indices = self._check_indices(
+                np.frombuffer(payload, dtype='<u2', count=count).tolist())
+            actions = np.frombuffer(
+                payload,
+                dtype='<f4',
+                offset=2 * count).reshape(
+                count,
+                self.action_dim)
+            results = await asyncio.gather(*[self._run(i, self.envs[i].async_step(self._action(action)))
+                                             for i, action in zip(indices, actions)])
+            obs = np.array([result[0] for result in results], dtype='<f4')
+            rewards = np.array([result[1] for result in results], dtype='<f4')
+            terminated = np.array([result[2]
+                                  for result in results], dtype=np.uint8)
+            truncated = np.array([result[3]
+                                 for result in results], dtype=np.uint8)
+            infos = [result[4] for result in results]
+            return _frame(STEP, flags, count, obs.tobytes(), rewards.tobytes(),
+                          terminated.tobytes(), truncated.tobytes(),
+                          _dumps(infos) if flags & INFOS else b'')
+
+        raise ValueError('Unknown message type {}.'.format(kind))
+
+    async def _run(self, index: int, coroutine: Any) -> Any:
+        """Run a coroutine of an environment, after previous requests to that environment.
+
+        Args:
+            index (int): Index of the environment.
+            coroutine (Any): async_reset or async_step coroutine.
+
+        Returns:
+            Any: Result of the coroutine.
+        """
+        async with self._locks[index]:
+            return await coroutine
+
+    def _check_indices(self, indices: List[int]) -> List[int]:
+        num_envs = len(self.envs)
+        for index in indices:
+            if not 0 <= index < num_envs:
+                raise IndexError(
+                    'Environment index {} out of range ({} environments).'.format(
+                        index, num_envs))
+        return indices
+
+    def _action(self, action: np.ndarray) -> Any:
+        # float32 row as an action of the environment action space
+        action_space = self.envs[0].action_space
+        if isinstance(action_space, gym.spaces.Discrete):
+            return int(action[0])
+        return action.astype(action_space.dtype).reshape(action_space.shape)
+
+    # ---------------------------------------------------------------------------- #
+    #                                  Properties                                  #
+    # ---------------------------------------------------------------------------- #
+
+    @property
+    def address(self) -> Union[Tuple[str, int], str]:
+        return self.unix_path if self.unix_path is not None else (
+            self.host, self.port)
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        """Specification of the hosted environments (sent to clients)."""
+        return {'envs': [{'name': env.get_wrapper_attr('name'),
+                          'observation_space': _space_to_dict(env.observation_space),
+                          'action_space': _space_to_dict(env.action_space),
+                          'observation_variables': env.get_wrapper_attr('observation_variables'),
+                          'action_variables': env.get_wrapper_attr('action_variables'),
+                          'timestep_per_episode': env.get_wrapper_attr('timestep_per_episode'),
+                          'workspace_path': env.get_wrapper_attr('workspace_path')}
+                         for env in self.envs]}
+
+
+class EnvClient(object):
+
+    # ---------------------------------------------------------------------------- #
+    #                           Client Terminal Logger                             #
+    # ---------------------------------------------------------------------------- #
+
+    logger = TerminalLogger().getLogger(
+        name='CLIENT',
+        level=LOG_SERVE_LEVEL)
+
+    def __init__(
+            self,
+            address: Union[Tuple[str, int], str] = ('127.0.0.1', SERVE_PORT),
+            connect_timeout: float = SERVE_CONNECT_TIMEOUT):
+        """Connection to an EnvServer, with batched reset and step of its environments.
+
+        Args:
+            address (Union[Tuple[str, int], str], optional): Server address: host and port (TCP) or Unix socket path. Defaults to localhost and SERVE_PORT.
+            connect_timeout (float, optional): Seconds the connection is retried while the server is not available. Defaults to SERVE_CONNECT_TIMEOUT.
+        """
+        self.address = address
+        deadline = time.monotonic() + connect_timeout
+        while True:
+            try:
+                if isinstance(address, str):
+                    self.sock = socket.socket(
+                        socket.AF_UNIX, socket.SOCK_STREAM)
+                    try:
+                        self.sock.connect(address)
+                    except OSError:
+                        self.sock.close()
+                        raise
+                else:
+                    self.sock = socket.create_connection(tuple(address))
+                    self.sock.setsockopt(
+                        socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                break
+            except (ConnectionRefusedError, FileNotFoundError) as err:
+                if time.monotonic() >= deadline:
+                    self.logger.critical(
+                        'Server {} not available in {} seconds.'.format(
+                            address, connect_timeout))
+                    raise err
+                time.sleep(0.1)
+        self._header = bytearray(HEADER.size)
+        self.spec = json.loads(self._request(SPEC, 0, 0, b'')[1])
+        first_env = self.spec['envs'][0]
+        self.observation_space = _space_from_dict(
+            first_env['observation_space'])
+        self.action_space = _space_from_dict(first_env['action_space'])
+        self.obs_dim = self.observation_space.shape[0]
+        self.action_dim = _action_dim(self.action_space)
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def reset(self,
+              indices: Sequence[int],
+              seeds: Optional[Sequence[Optional[int]]] = None,
+              options: Optional[Dict[str, Any]] = None,
+              infos: bool = True) -> Tuple[np.ndarray, Optional[List[Dict[str, Any]]]]:
+        """Reset several environments of the server (concurrently).
+
+        Args:
+            indices (Sequence[int]): Indices of the environments.
+            seeds (Optional[Sequence[Optional[int]]], optional): Seed of each environment. Defaults to None.
+            options (Optional[Dict[str, Any]], optional): Reset options of all the environments. Defaults to None.
+            infos (bool, optional): Whether infos are requested. Defaults to True.
+
+        Returns:
+            Tuple[np.ndarray, Optional[List[Dict[str, Any]]]]: Observations (one row per environment) and infos (None if not requested).
+        """
+        request = _dumps({'indices': list(indices),
+                          'seeds': None if seeds is None else list(seeds),
+                          'options': options})
+        count, payload = self._request(
+            RESET, INFOS if infos else 0, len(indices), request)
+        size = count * self.obs_dim * 4
+        obs = np.frombuffer(payload, dtype='<f4', count=count *
+                            self.obs_dim).reshape(count, self.obs_dim)
+        return obs, (json.loads(payload[size:]) if infos else None)
+
+    def step(self,
+             indices: Sequence[int],
+             actions: Any,
+             infos: bool = True
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+                        Optional[List[Dict[str, Any]]]]:
+        """Send a batch of actions to several environments of the server (they advance concurrently).
+
+        Args:
+            indices (Sequence[int]): Indices of the environments.
+            actions (Any): Action of each environment.
+            infos (bool, optional): Whether infos are requested. Defaults to True.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Optional[List[Dict[str, Any]]]]: Observations, rewards, terminated and truncated flags (one row per environment) and infos (None if not requested).
+        """
+        count = len(indices)
+        request = np.asarray(indices, dtype='<u2').tobytes() + np.asarray(
+            actions, dtype='<f4').reshape(count, self.action_dim).tobytes()
+        count, payload = self._request(
+            STEP, INFOS if infos else 0, count, request)
+        offset = count * self.obs_dim * 4
+        obs = np.frombuffer(payload, dtype='<f4', count=count *
+                            self.obs_dim).reshape(count, self.obs_dim)
+        rewards = np.frombuffer(
+            payload, dtype='<f4', count=count, offset=offset)
+        offset += count * 4
+        terminated = np.frombuffer(
+            payload, dtype=np.uint8, count=count, offset=offset).astype(bool)
+        truncated = np.frombuffer(
+            payload,
+            dtype=np.uint8,
+            count=count,
+            offset=offset + count).astype(bool)
+        offset += 2 * count
+        return obs, rewards, terminated, truncated, (json.loads(
+            payload[offset:]) if infos else None)
+
+    def close(self) -> None:
+        """Close the connection (environments keep running in the server).
+        """
+        self.sock.close()
+
+    # ---------------------------------------------------------------------------- #
+    #                              Auxiliary methods                               #
+    # ---------------------------------------------------------------------------- #
+
+    def _request(self, kind: int, flags: int, count: int,
+                 payload: bytes) -> Tuple[int, bytes]:
+        """Send a request and wait for its response.
+
+        Args:
+            kind (int): Message type.
+            flags (int): Message flags.
+            count (int): Number of environments in the request.
+            payload (bytes): Request payload.
+
+        Raises:
+            RuntimeError: If the request failed in the server.
+
+        Returns:
+            Tuple[int, bytes]: Number of environments and payload of the response.
+        """
+        self.sock.sendall(_frame(kind, flags, count, payload))
+        self._recv_into(memoryview(self._header))
+        response_kind, _, count, length = HEADER.unpack(self._header)
+        response = bytearray(length)
+        self._recv_into(memoryview(response))
+        if response_kind == ERROR:
+            self.logger.critical(
+                'Server request failed: {}'.format(
+                    response.decode()))
+            raise RuntimeError(response.decode())
+        return count, bytes(response)
+
+    def _recv_into(self, buffer: memoryview) -> None:
+        while len(buffer):
+            received = self.sock.recv_into(buffer)
+            if received == 0:
+                raise ConnectionError('Server closed the connection.')
+            buffer = buffer[received:]
+
+
+class RemoteEnv(gym.Env):
+
+    metadata = {'render_modes': []}
+
+    def __init__(
+            self,
+            address: Union[Tuple[str, int], str] = ('127.0.0.1', SERVE_PORT),
+            env_index: int = 0,
+            infos: bool = True,
+            connect_timeout: float = SERVE_CONNECT_TIMEOUT):
+        """Gymnasium environment which runs in an EnvServer (observations are float32).
+
+        Args:
+            address (Union[Tuple[str, int], str], optional): Server address: host and port (TCP) or Unix socket path. Defaults to localhost and SERVE_PORT.
+            env_index (int, optional): Index of the hosted environment. Defaults to 0.
+            infos (bool, optional): Whether infos are requested in each step, else empty infos are returned. Defaults to True.
+            connect_timeout (float, optional): Seconds the connection is retried while the server is not available. Defaults to SERVE_CONNECT_TIMEOUT.
+        """
+        self.client = EnvClient(address, connect_timeout=connect_timeout)
+        self.env_index = env_index
+        self.infos = infos
+        spec = self.client.spec['envs'][env_index]
+        self.name = spec['name']
+        self.observation_variables = spec['observation_variables']
+        self.action_variables = spec['action_variables']
+        self.timestep_per_episode = spec['timestep_per_episode']
+        self.workspace_path = spec['workspace_path']
+        self.observation_space = _space_from_dict(spec['observation_space'])
+        self.action_space = _space_from_dict(spec['action_space'])
+
+    def reset(self,
+              seed: Optional[int] = None,
+              options: Optional[Dict[str,
+                                     Any]] = None) -> Tuple[np.ndarray,
+                                                            Dict[str,
+                                                                 Any]]:
+        """Reset the remote environment.
+
+        Args:
+            seed (Optional[int]): Seed of the episode. Defaults to None.
+            options (Optional[Dict[str, Any]]): Reset options (JSON serializable). Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray,Dict[str,Any]]: Current observation and info (empty if infos are disabled).
+        """
+        super().reset(seed=seed)
+        obs, infos = self.client.reset(
+            [self.env_index], [seed], options, infos=self.infos)
+        return obs[0], (infos[0] if self.infos else {})
+
+    def step(self, action: Any) -> Tuple[np.ndarray,
+                                         float, bool, bool, Dict[str, Any]]:
+        """Send action to the remote environment.
+
+        Args:
+            action (Any): Action selected by the agent.
+
+        Returns:
+            Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]: Observation for next timestep, reward, terminated and truncated flags and info (empty if infos are disabled).
+        """
+        obs, rewards, terminated, truncated, infos = self.client.step(
+            [self.env_index], [action], infos=self.infos)
+        return obs[0], float(rewards[0]), bool(terminated[0]), bool(
+            truncated[0]), (infos[0] if self.infos else {})
+
+    def close(self) -> None:
+        """Close the connection (the environment keeps running in the server).
+        """
+        self.client.close()
+
+
+# ---------------------------------------------------------------------------- #
+#                              Command line server                             #
+# ---------------------------------------------------------------------------- #
+
+if __name__ == '__main__':
+    import sinergym
+
+    parser = argparse.ArgumentParser(
+        description='Host Sinergym environments behind a TCP or Unix socket.')
+    parser.add_argument('--environment', '-env', type=str, required=True)
+    parser.add_argument('--num_envs', '-n', type=int, default=1)
+    parser.add_argument('--host', type=str, default='127.0.0.1')
+    parser.add_argument('--port', '-p', type=int, default=SERVE_PORT)
+    parser.add_argument('--unix_path', '-u', type=str, default=None)
+    parser.add_argument(
+        '--env_kwargs',
+        type=json.loads,
+        default={},
+        help='Environment parameters (JSON).')
+    args = parser.parse_args()
+
+    # Runperiod must be a tuple (JSON only has lists)
+    if args.env_kwargs.get('config_params', {}).get('runperiod'):
+        args.env_kwargs['config_params']['runperiod'] = tuple(
+            args.env_kwargs['config_params']['runperiod'])
+
+    envs = [gym.make(args.environment, **args.env_kwargs)
+            for _ in range(args.num_envs)]
+    server = EnvServer(envs,
+                       host=args.host,
+                       port=args.port,
+                       unix_path=args.unix_path)
+    server.serve_forever()
+    for env in server.envs:
+        env.close()
@@ -1,3 +1,6 @@
 """Communication interface with simulators."""
 
-from .eplus import EnergyPlus
+from .eplus import EnergyPlus, ExchangeChannel, SimulationProgress
+from .handles import HandleCache
+from .pool import SimulatorPool
+from .process import EnergyPlusProcess, SharedMemoryChannel
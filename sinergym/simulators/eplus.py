@@ -2,18 +2,227 @@
 Class for connecting EnergyPlus with Python using pyenergyplus API.
 """
 
+import asyncio
+import os
 import sys
 import threading
+import time
+from ctypes import CDLL, c_double, c_int, c_void_p
 from pathlib import Path
 from queue import Queue
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from pyenergyplus.api import EnergyPlusAPI
 from tqdm import tqdm
 
+from sinergym.simulators.handles import HandleCache
 from sinergym.utils.common import *
 from sinergym.utils.constants import LOG_SIM_LEVEL
 from sinergym.utils.logger import TerminalLogger
+from sinergym.utils.timing import PhaseTimer, TraceRecorder
+
+
+def _resolve_future(future: asyncio.Future) -> None:
+    # Called in the loop of the future (it may have been cancelled by a
+    # timeout)
+    if not future.done():
+        future.set_result(None)
+
+
+class ExchangeChannel(object):
+    """Single-slot rendezvous between the EnergyPlus thread and the Gymnasium environment.
+       One slot holds the observation and info of the current timestep, and another holds
+       the next action. Each direction is signalled with a lock used as a binary semaphore
+       (held while the slot is empty), so a timestep crosses only one handoff per direction.
+       Asyncio consumers wait for the observation with a future of their loop, which is
+       resolved by the EnergyPlus thread when the observation is published.
+    """
+
+    def __init__(self):
+        # Slots
+        self._obs: Any = None
+        self._info: Optional[Dict[str, Any]] = None
+        self._action: Any = None
+        # Signals (obs+info ready for agent, action ready for simulator)
+        self._obs_ready = threading.Lock()
+        self._act_ready = threading.Lock()
+        self._obs_ready.acquire()
+        self._act_ready.acquire()
+        # End of simulation flag
+        self.closed = False
+        # Loop and future waiting for the next observation (asyncio consumer)
+        self._waiter: Optional[Tuple[asyncio.AbstractEventLoop,
+                                     asyncio.Future]] = None
+        self._waiter_lock = threading.Lock()
+
+    def put_observation(self, obs: Any, info: Dict[str, Any]) -> None:
+        """Publish observation and info of the current timestep (EnergyPlus thread).
+
+        Args:
+            obs (Any): Observation values.
+            info (Dict[str, Any]): Extra information of the timestep.
+        """
+        self._obs = obs
+        self._info = info
+        self._obs_ready.release()
+        self._wake_waiter()
+
+    def get_observation(
+            self, timeout: Optional[float] = None) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Wait for the next observation and info (Gymnasium environment).
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. Defaults to None (wait until available).
+
+        Raises:
+            TimeoutError: If timeout is specified and observation is not published in time.
+
+        Returns:
+            Tuple[Any, Optional[Dict[str, Any]]]: Observation and info. Both are None if simulation has ended.
+        """
+        if not self._obs_ready.acquire(
+                timeout=-1 if timeout is None else timeout):
+            raise TimeoutError
+        if self.closed:
+            # Keep signal active, next waits must return immediately too
+            self._obs_ready.release()
+        return self._obs, self._info
+
+    def wait_observation(
+            self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        """Future of loop resolved when the next observation is published or the channel is closed. The observation
+           is not consumed, get_observation returns it without blocking once the future is done.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Event loop of the consumer.
+
+        Returns:
+            asyncio.Future: Future resolved (with None) when observation is available.
+        """
+        future = loop.create_future()
+        with self._waiter_lock:
+            if self._obs_ready.locked():
+                self._waiter = (loop, future)
+                return future
+        future.set_result(None)
+        return future
+
+    def put_action(self, action: Any) -> None:
+        """Publish the action to be applied in the next timestep (Gymnasium environment).
+
+        Args:
+            action (Any): Action values.
+        """
+        self._action = action
+        self._act_ready.release()
+
+    def get_action(self) -> Any:
+        """Wait for the next action (EnergyPlus thread).
+
+        Returns:
+            Any: Action values (None if channel has been closed).
+        """
+        self._act_ready.acquire()
+        if self.closed:
+            self._act_ready.release()
+        return self._action
+
+    def close(self) -> None:
+        """Publish end of simulation. Pending and future waits in both directions return
+           immediately (observation, info and action are None).
+        """
+        self.closed = True
+        self._obs = self._info = self._action = None
+        for signal in [self._obs_ready, self._act_ready]:
+            try:
+                signal.release()
+            except RuntimeError:
+                # Signal was already active
+                pass
+        self._wake_waiter()
+
+    def clear(self) -> None:
+        """Empty both slots and signals, preparing the channel for a new simulation.
+        """
+        self.closed = False
+        self._obs = self._info = self._action = None
+        # Non-blocking acquire leaves the signal held whatever its state was
+        self._obs_ready.acquire(blocking=False)
+        self._act_ready.acquire(blocking=False)
+        with self._waiter_lock:
+            self._waiter = None
+
+    def _wake_waiter(self) -> None:
+        """Resolve the future waiting for the observation (if any) in its loop.
+        """
+        with self._waiter_lock:
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            loop, future = waiter
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future)
+            except RuntimeError:
+                # Loop already closed
+                pass
+
+
+class SimulationProgress(object):
+    """Lightweight progress counter of a simulation. It is updated by the EnergyPlus thread and it can be
+       polled from other threads (vector environments, dashboards) without locks, since each update only
+       replaces attribute values.
+    """
+
+    def __init__(self, episode_length: Optional[float] = None):
+        """Constructor.
+
+        Args:
+            episode_length (Optional[float]): Simulated time of an episode in seconds, required for sim-time/wall-time ratio. Defaults to None.
+        """
+        self.episode_length = episode_length
+        self.episode = 0
+        self.percent = 0
+        self.start_time = time.perf_counter()
+        self.update_time = self.start_time
+
+    def reset(self, episode: int) -> None:
+        """Start counting a new simulation.
+
+        Args:
+            episode (int): Number of the episode simulated.
+        """
+        self.episode = episode
+        self.percent = 0
+        self.start_time = self.update_time = time.perf_counter()
+
+    def update(self, percent: int) -> None:
+        """Register simulation progress (EnergyPlus thread).
+
+        Args:
+            percent (int): Percentage of the run period simulated.
+        """
+        self.update_time = time.perf_counter()
+        self.percent = percent
+
+    @property
+    def sim_time_ratio(self) -> Optional[float]:
+        """Simulated time per wall-clock time since simulation start (None if episode length is unknown or there is not any update yet)."""
+        wall_time = self.update_time - self.start_time
+        if self.episode_length is None or wall_time <= 0:
+            return None
+        return self.percent / 100 * self.episode_length / wall_time
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Snapshot of the counter.
+
+        Returns:
+            Dict[str, Any]: Episode, percent completed, wall time since simulation start and sim-time/wall-time ratio.
+        """
+        return {
+            'episode': self.episode,
+            'percent': self.percent,
+            'wall_time': self.update_time - self.start_time,
+            'sim_time_ratio': self.sim_time_ratio}
 
 
 class EnergyPlus(object):
@@ -26,37 +235,58 @@ class EnergyPlus(object):
         name='SIMULATOR',
         level=LOG_SIM_LEVEL)
 
+    # Observation aggregation methods available for action repeat
+    AGGREGATION_METHODS = ('last', 'mean', 'sum', 'max')
+
+    # Simulation progress reporting modes
+    PROGRESS_MODES = ('bar', 'throttled', 'structured', 'off')
+
+    # Simulations running in this process (several EnergyPlus states can
+    # run at the same time, e.g. prefetching the next episode)
+    _running_simulations = 0
+    _running_lock = threading.Lock()
+
     def __init__(
             self,
             name: str,
-            obs_queue: Queue,
-            info_queue: Queue,
-            act_queue: Queue,
             time_variables: List[str] = [],
             variables: Dict[str, Tuple[str, str]] = {},
             meters: Dict[str, str] = {},
-            actuators: Dict[str, Tuple[str, str, str]] = {}):
+            actuators: Dict[str, Tuple[str, str, str]] = {},
+            fast_exchange: bool = True,
+            always_write_actuators: Union[bool, List[str]] = False,
+            action_repeat: int = 1,
+            aggregation: Optional[Dict[str, str]] = None,
+            request_variables: bool = False,
+            progress: str = 'bar',
+            progress_interval: float = 1.0,
+            episode_length: Optional[float] = None,
+            handle_cache: Union[bool, str] = False):
         """EnergyPlus runner class. This class run an episode in a thread when start() is called.
 
         Args:
             name (str): Name of the environment which is using the simulator.
-            obs_queue (Queue): Observation queue for Gymnasium environment communication.
-            info_queue (Queue): Extra information dict queue for Gymnasium environment communication.
-            act_queue (Queue): Action queue for Gymnasium environment communication.
             time_variables (List[str]): EnergyPlus time variables we want to observe. The name of the variable must match with the name of the E+ Data Transfer API method name. Defaults to empty list
             variables (Dict[str, Tuple[str, str]]): Specification for EnergyPlus Output:Variable. The key name is custom, then tuple must be the original variable name and the output variable key. Defaults to empty dict.
             meters (Dict[str, str]): Specification for EnergyPlus Output:Meter. The key name is custom, then value is the original EnergyPlus Meters name.
             actuators (Dict[str, Tuple[str, str, str]]): Specification for EnergyPlus Input Actuators. The key name is custom, then value is a tuple with actuator type, value type and original actuator name. Defaults to empty dict.
+            fast_exchange (bool): Whether to read/write handles calling EnergyPlus library functions directly (bound once with fixed argtypes) instead of pyenergyplus wrappers. Wrappers are used as fallback if binding is not available. Defaults to True.
+            always_write_actuators (Union[bool, List[str]]): Actuators are only written when their value changes with respect to the last written value. Actuator names in this list (or all of them if True) are written in every timestep instead, for actuators that EnergyPlus resets each timestep. Defaults to False.
+            action_repeat (int): Number of simulation timesteps that each received action is held in callbacks before publishing a new observation (decision interval). Defaults to 1.
+            aggregation (Optional[Dict[str, str]]): Aggregation method (last, mean, sum or max) of each observation variable (time variables, variables and meters names) over the decision interval. Variables not specified use last. Defaults to None.
+            request_variables (bool): Whether to request variables through EnergyPlus API before each run, so their handles are available without Output:Variable objects in building model. Defaults to False.
+            progress (str): Simulation progress reporting: bar (terminal progress bar updated every percent), throttled (progress bar redrawn at most once per progress_interval), structured (only progress counter, without terminal output) or off (progress callback is not registered). Defaults to bar.
+            progress_interval (float): Minimum seconds between progress bar redraws in throttled mode. Defaults to 1.0.
+            episode_length (Optional[float]): Simulated time of an episode in seconds, used to calculate sim-time/wall-time ratio in progress counter. Defaults to None.
+            handle_cache (Union[bool, str]): Whether to use the persistent cache of API data catalog and handles (keyed by building model file hash), or its directory path. True uses HANDLE_CACHE_PATH. Defaults to False.
         """
 
         # ---------------------------------------------------------------------------- #
         #                               Attributes set up                              #
         # ---------------------------------------------------------------------------- #
         self.name = name
-        # Gym communication queues
-        self.obs_queue = obs_queue
-        self.info_queue = info_queue
-        self.act_queue = act_queue
+        # Gym communication channel (observation+info and action slots)
+        self.channel = ExchangeChannel()
 
         # Warmup process
         self.warmup_queue = Queue()
@@ -71,13 +301,77 @@ class EnergyPlus(object):
         self.meter_handlers: Optional[Dict[str, int]] = None
         self.actuator_handlers: Optional[Dict[str, int]] = None
         self.available_data: Optional[str] = None
+        # Persistent API data catalog and handles cache
+        if handle_cache is False:
+            self.handle_cache: Optional[HandleCache] = None
+        elif handle_cache is True:
+            self.handle_cache = HandleCache()
+        else:
+            self.handle_cache = HandleCache(path=handle_cache)
+        # Handle tables in observation/action order (filled with handlers)
+        self._var_handles: List[int] = []
+        self._meter_handles: List[int] = []
+        self._actuator_handles: List[int] = []
+
+        # Data exchange functions used in each timestep (bound in start)
+        self.fast_exchange = fast_exchange
+        self.fast_exchange_bound = False
+        self._get_variable_value: Callable[[
+            Any, int], float] = self.exchange.get_variable_value
+        self._get_meter_value: Callable[[
+            Any, int], float] = self.exchange.get_meter_value
+        self._set_actuator_value: Callable[[
+            Any, int, float], None] = self.exchange.set_actuator_value
+
+        # Last value written in each actuator (NaN means not written yet) and
+        # actuators written in every timestep
+        self.always_write_actuators = always_write_actuators
+        self._last_actuator_values = np.full(
+            len(actuators), np.nan, dtype=np.float64)
+        self._always_write_mask = np.array(
+            [always_write_actuators is True or (
+                isinstance(always_write_actuators, list) and name in always_write_actuators)
+             for name in actuators], dtype=bool)
+
+        # Observation buffer (time variables, variables and meters order),
+        # written in place in each timestep
+        self.obs_buffer: Optional[np.ndarray] = None
 
         # Simulation elements to read/write
+        self.request_variables = request_variables
         self.time_variables = time_variables
         self.variables = variables
         self.meters = meters
         self.actuators = actuators
 
+        # Time variable accessors (bound DataExchange methods)
+        self._time_accessors = self._get_time_accessors()
+
+        # Decision interval: timestep values are read in sample buffer and
+        # aggregated in observation buffer
+        self.action_repeat = action_repeat
+        self.aggregation = aggregation if aggregation is not None else {}
+        self._aggregation_indexes = self._get_aggregation_indexes()
+        self._sample_buffer: Optional[np.ndarray] = None
+        self._interval_count = 0
+        self._interval_length = 1
+        self._decision_due = False
+
+        # Progress reporting (counter is updated in all modes except off)
+        self.progress_mode = progress
+        self.progress_interval = progress_interval
+        self.progress = SimulationProgress(episode_length=episode_length)
+        self.progress_bar = None
+        self._last_progress_draw = 0.0
+
+        # Callback phases timer (set by the environment if timing is enabled)
+        self.timer: Optional[PhaseTimer] = None
+        self._timer_phases: Tuple[int, int] = (-1, -1)
+        # Trace events recorder (set by the environment if tracing is
+        # enabled)
+        self.tracer: Optional[TraceRecorder] = None
+        self._run_begin = 0.0
+
         # Simulation thread
         self.energyplus_thread: Optional[threading.Thread] = None
         self.energyplus_state: Optional[int] = None
@@ -90,6 +384,7 @@ class EnergyPlus(object):
         self._building_path: Optional[str] = None
         self._weather_path: Optional[str] = None
         self._output_path: Optional[str] = None
+        self._data_dir: Optional[str] = None
 
         self.logger.debug('Energyplus simulator initialized.')
 
@@ -100,7 +395,8 @@ class EnergyPlus(object):
               building_path: str,
               weather_path: str,
               output_path: str,
-              episode: int) -> None:
+              episode: int,
+              data_dir: Optional[str] = None) -> None:
         """Initializes all callbacks and handlers using EnergyPlus API, prepare the simulation system
            and start running the simulation in a Python thread.
 
@@ -109,27 +405,66 @@ class EnergyPlus(object):
             weather_path (str): EnergyPlus weather path.
             output_path (str): Path where EnergyPlus process is going to allocate its output files.
             episode (int): Number of the episode to run (useful to show in progress bar).
+            data_dir (Optional[str], optional): Directory where data_available.txt is written (experiment directory). Defaults to the parent of the episode directory of output_path.
         """
 
         # Path attributes
         self._building_path = building_path
         self._weather_path = weather_path
         self._output_path = output_path
+        self._data_dir = data_dir
+
+        # Observation buffer for this simulation
+        self.obs_buffer = np.zeros(
+            len(self.time_variables) + len(self.variables) + len(self.meters),
+            dtype=np.float64)
+        # Timestep values are read directly in observation buffer if there is
+        # not decision interval. First observation is published without
+        # waiting a whole interval
+        self._sample_buffer = np.zeros_like(
+            self.obs_buffer) if self.action_repeat > 1 else self.obs_buffer
+        self._interval_count = 0
+        self._interval_length = 1
+        self._decision_due = False
+
+        # Data exchange functions for this simulation
+        self._bind_exchange()
+        # New simulation, actuators has not been written yet
+        self._last_actuator_values.fill(np.nan)
 
         # Initiate Energyplus state
         self.energyplus_state = self.api.state_manager.new_state()
+        with EnergyPlus._running_lock:
+            EnergyPlus._running_simulations += 1
+
+        # Request variables (instead of Output:Variable reporting)
+        if self.request_variables:
+            for variable_name, variable_key in self.variables.values():
+                self.exchange.request_variable(
+                    self.energyplus_state, variable_name, variable_key)
 
         # Disable default Energyplus Output
         self.api.runtime.set_console_output_status(
             self.energyplus_state, False)
 
-        # Progress bar for simulation
+        # Progress bar and counter for simulation
         self.progress_bar = None
+        self._last_progress_draw = 0.0
+        self.progress.reset(episode)
 
         # Register callback used to track simulation progress
         def _progress_update(percent: int) -> None:
             if self.system_ready:
 
+                self.progress.update(percent)
+                if self.progress_mode == 'structured':
+                    return
+                if self.progress_mode == 'throttled' and percent < 100:
+                    if self.progress.update_time - \
+                            self._last_progress_draw < self.progress_interval:
+                        return
+                    self._last_progress_draw = self.progress.update_time
+
                 if self.progress_bar is None:
                     # Progress bar for simulation
                     self.progress_bar = tqdm(
@@ -148,11 +483,15 @@ class EnergyPlus(object):
                 self.progress_bar.set_postfix_str(f'{percent}% completed')
                 self.progress_bar.refresh()
 
-        self.api.runtime.callback_progress(
-            self.energyplus_state, _progress_update)
+        if self.progress_mode != 'off':
+            self.api.runtime.callback_progress(
+                self.energyplus_state, _progress_update)
 
         # register callback used to signal warmup complete
         def _warmup_complete(state: Any) -> None:
+            if self.tracer is not None:
+                self.tracer.complete('warmup', 'energyplus',
+                                     self._run_begin, time.perf_counter())
             self.warmup_complete = True
             self.warmup_queue.put(True)
             self.logger.debug(
@@ -161,9 +500,17 @@ class EnergyPlus(object):
         self.api.runtime.callback_after_new_environment_warmup_complete(
             self.energyplus_state, _warmup_complete)
 
-        # register callback used to collect observations
+        # register callback used to collect observations (timed version if
+        # timing or tracing is enabled)
+        collect_obs_and_info = self._collect_obs_and_info
+        if self.timer is not None:
+            self._timer_phases = (
+                self.timer.add_phase('callback_observation'),
+                self.timer.add_phase('callback_action'))
+        if self.timer is not None or self.tracer is not None:
+            collect_obs_and_info = self._timed_collect_obs_and_info
         self.api.runtime.callback_end_zone_timestep_after_zone_reporting(
-            self.energyplus_state, self._collect_obs_and_info)
+            self.energyplus_state, collect_obs_and_info)
 
         # register callback used to send actions
         self.api.runtime.callback_end_zone_timestep_after_zone_reporting(
@@ -175,8 +522,13 @@ class EnergyPlus(object):
                 'Running EnergyPlus with args: {}'.format(cmd_args))
 
             # start simulation
-            results["exit_code"] = runtime.run_energyplus(state, cmd_args)
-            self.simulation_complete = True
+            self._run_begin = time.perf_counter()
+            try:
+                results["exit_code"] = runtime.run_energyplus(state, cmd_args)
+            finally:
+                self.simulation_complete = True
+                # Signal end of run explicitly to whoever is waiting
+                self._publish_end_of_simulation()
 
         # Creating the thread and start execution
         self.energyplus_thread = threading.Thread(
@@ -195,26 +547,32 @@ class EnergyPlus(object):
         self.energyplus_thread.start()
 
     def stop(self) -> None:
-        """It forces the simulation ends, cleans all communication queues, thread is deleted (joined) and simulator attributes are
+        """It forces the simulation ends, cleans communication channel, thread is deleted (joined) and simulator attributes are
            reset (except handlers, to not initialize again if there is a next thread execution).
+           The EnergyPlus runtime is asked to abort at the next timestep, so the rest of the run period is not simulated.
         """
         if self.is_running:
             # Set simulation as complete and force thread to finish
             self.simulation_complete = True
+            # Abort EnergyPlus run at the next timestep (instead of simulating
+            # the rest of the run period with callbacks doing nothing)
+            self.api.runtime.stop_simulation(self.energyplus_state)
             # Kill progress bar
             if self.progress_bar is not None:
                 self.progress_bar.close()
-            # Flush all queues and unblock thread if needed
-            self._flush_queues()
-            if self.act_queue.empty():
-                self.act_queue.put([0] * len(self.actuators))
+            # Unblock thread if it is waiting for an action
+            self.channel.close()
             # Wait to thread to finish (without control)
             self.energyplus_thread.join()
-            self._flush_queues()
+            self._flush_channels()
             # Delete thread
             self.energyplus_thread = None
-            # Clean runtime callbacks
-            self.api.runtime.clear_callbacks()
+            # Clean runtime callbacks (it affects all EnergyPlus states, so
+            # only when there are not other simulations running)
+            with EnergyPlus._running_lock:
+                EnergyPlus._running_simulations -= 1
+                if EnergyPlus._running_simulations == 0:
+                    self.api.runtime.clear_callbacks()
             # Clean Energyplus state
             self.api.state_manager.delete_state(
                 self.energyplus_state)
@@ -227,6 +585,12 @@ class EnergyPlus(object):
 
             self.logger.debug('Energyplus thread stopped.')
 
+    def close(self) -> None:
+        """Stop current simulation. The simulation thread is the only resource of this simulator, it is defined
+           for the same interface as EnergyPlusProcess (whose process is finished).
+        """
+        self.stop()
+
     def failed(self) -> bool:
         """Method to determine if simulation has failed.
 
@@ -254,8 +618,8 @@ class EnergyPlus(object):
     # ---------------------------------------------------------------------------- #
 
     def _collect_obs_and_info(self, state_argument: int) -> None:
-        """EnergyPlus callback that collects output variables and info
-        values and enqueue them in each simulation timestep.
+        """EnergyPlus callback that collects output variables (written in place in observation buffer)
+        and info values and publish them in each simulation timestep.
 
         Args:
             state_argument (int): EnergyPlus API state
@@ -269,31 +633,36 @@ class EnergyPlus(object):
         if not self.system_ready:
             return
 
-        # Obtain observation (time_variables, variables and meters) values in dict
-        # format
-        self.next_obs = {
-            # time variables (calling in exchange module directly)
-            **{
-                t_variable: eval('self.exchange.' +
-                                 t_variable +
-                                 '(self.energyplus_state)', {'self': self})
-                for t_variable in self.time_variables
-            },
-            # variables (getting value from handlers)
-            ** {
-                key: self.exchange.get_variable_value(state_argument, handle)
-                for key, handle
-                in self.var_handlers.items()
-            },
-            # meters (getting value from handlers)
-            **{
-                key: self.exchange.get_meter_value(state_argument, handle)
-                for key, handle
-                in self.meter_handlers.items()
-            }
-        }
-
-        # Mount the info dict in queue
+        # Write observation (time_variables, variables and meters) values in
+        # buffer by index
+        buffer = self._sample_buffer
+        i = 0
+        # time variables (calling bound exchange methods directly)
+        for accessor in self._time_accessors:
+            buffer[i] = accessor(state_argument)
+            i += 1
+        # variables (getting value from handlers)
+        get_variable_value = self._get_variable_value
+        for handle in self._var_handles:
+            buffer[i] = get_variable_value(state_argument, handle)
+            i += 1
+        # meters (getting value from handlers)
+        get_meter_value = self._get_meter_value
+        for handle in self._meter_handles:
+            buffer[i] = get_meter_value(state_argument, handle)
+            i += 1
+
+        # Aggregate timestep values over the decision interval, observation is
+        # only published when interval is complete
+        if self.action_repeat > 1:
+            self._aggregate_sample()
+            if self._interval_count < self._interval_length:
+                return
+            self._interval_count = 0
+            self._interval_length = self.action_repeat
+        self._decision_due = True
+
+        # Mount the info dict
         self.next_info = {
             # 'timestep': self.exchange.system_time_step(state_argument),
             'time_elapsed(hours)': self.exchange.current_sim_time(state_argument),
@@ -303,11 +672,9 @@ class EnergyPlus(object):
             'is_raining': self.exchange.is_raining(state_argument)
         }
 
-        # Put in the queues the observation and info
-        # self.logger.debug('OBSERVATION put in QUEUE: {}'.format(self.next_obs))
-        self.obs_queue.put(self.next_obs)
-        # self.logger.debug('INFO put in QUEUE: {}'.format(self.next_obs))
-        self.info_queue.put(self.next_info)
+        # Publish observation and info in the channel
+        # self.logger.debug('OBSERVATION published: {}'.format(self.obs_buffer))
+        self.channel.put_observation(self.obs_buffer, self.next_info)
 
     def _process_action(self, state_argument: int) -> None:
         """EnergyPlus callback that sets output actuator value(s) from last received action.
@@ -323,22 +690,200 @@ class EnergyPlus(object):
         self._init_system(self.energyplus_state)
         if not self.system_ready:
             return
-        # Get next action from queue and check type
-        next_action = self.act_queue.get()
-        # self.logger.debug('ACTION get from queue: {}'.format(next_action))
+        # Inside a decision interval, last action is held (only always write
+        # actuators must be set again)
+        if not self._decision_due:
+            if self._always_write_mask.any():
+                self._write_actuators(
+                    state_argument,
+                    self._last_actuator_values,
+                    self._always_write_mask)
+            return
+        self._decision_due = False
+        timer, tracer = self.timer, self.tracer
+        if tracer is not None:
+            wait_begin = time.perf_counter()
+        # Get next action from channel
+        next_action = self.channel.get_action()
+        # self.logger.debug('ACTION received: {}'.format(next_action))
+        if timer is not None or tracer is not None:
+            begin = time.perf_counter()
         if not self.simulation_complete:
-            # Set the action values obtained in actuator handlers
-            for i, (act_name, act_handle) in enumerate(
-                    self.actuator_handlers.items()):
-                self.exchange.set_actuator_value(
-                    state=state_argument,
-                    actuator_handle=act_handle,
-                    actuator_value=next_action[i]
-                )
-
-                # self.logger.debug(
-                #     'Set in actuator {} value {}.'.format(
-                #         act_name, next_action[i]))
+            # Action converted once, only changed values (or always write
+            # actuators) are set in actuator handlers
+            values = np.asarray(next_action, dtype=np.float64)
+            to_write = (
+                values != self._last_actuator_values) | self._always_write_mask
+            if to_write.any():
+                self._write_actuators(state_argument, values, to_write)
+                self._last_actuator_values[:] = values
+        if timer is not None or tracer is not None:
+            end = time.perf_counter()
+            if timer is not None:
+                timer.record(self._timer_phases[1], end - begin)
+            if tracer is not None:
+                tracer.complete('action_wait', 'energyplus', wait_begin, begin)
+                tracer.complete('callback_action', 'energyplus', begin, end)
+
+    def _timed_collect_obs_and_info(self, state_argument: int) -> None:
+        """Observation callback measuring its duration in phases timer and trace events recorder.
+
+        Args:
+            state_argument (int): EnergyPlus API state
+        """
+        begin = time.perf_counter()
+        self._collect_obs_and_info(state_argument)
+        end = time.perf_counter()
+        if self.timer is not None:
+            self.timer.record(self._timer_phases[0], end - begin)
+        if self.tracer is not None:
+            self.tracer.complete(
+                'callback_observation', 'energyplus', begin, end)
+
+    def _write_actuators(
+            self,
+            state_argument: int,
+            values: np.ndarray,
+            to_write: np.ndarray) -> None:
+        """Set actuator values in EnergyPlus.
+
+        Args:
+            state_argument (int): EnergyPlus API state
+            values (np.ndarray): Values in actuators order (float64).
+            to_write (np.ndarray): Boolean mask with the actuators to be set.
+        """
+        set_actuator_value = self._set_actuator_value
+        act_handles = self._actuator_handles
+        for i in np.flatnonzero(to_write).tolist():
+            set_actuator_value(state_argument, act_handles[i], values[i])
+
+    def _aggregate_sample(self) -> None:
+        """Aggregate last timestep values (sample buffer) in observation buffer, depending on the
+           aggregation method of each variable in the current decision interval.
+        """
+        sample = self._sample_buffer
+        buffer = self.obs_buffer
+        count = self._interval_count
+        if count == 0:
+            buffer[:] = sample
+        else:
+            indexes = self._aggregation_indexes
+            last, mean, total, maximum = indexes['last'], indexes['mean'], indexes['sum'], indexes['max']
+            buffer[last] = sample[last]
+            buffer[mean] += (sample[mean] - buffer[mean]) / (count + 1)
+            buffer[total] += sample[total]
+            buffer[maximum] = np.maximum(buffer[maximum], sample[maximum])
+        self._interval_count = count + 1
+
+    def _bind_exchange(self) -> None:
+        """Bind data exchange functions used in each timestep (variable/meter reads and actuator writes).
+           If fast_exchange is enabled, underlying EnergyPlus library functions are bound once with fixed
+           argtypes, skipping pyenergyplus wrappers argument checking in each call. If they are not
+           available, pyenergyplus wrappers are used as fallback.
+        """
+        # Fallback (pyenergyplus wrappers)
+        self._get_variable_value = self.exchange.get_variable_value
+        self._get_meter_value = self.exchange.get_meter_value
+        self._set_actuator_value = self.exchange.set_actuator_value
+        self.fast_exchange_bound = False
+
+        if self.fast_exchange:
+            try:
+                library = self.exchange.api
+                get_variable_value = self._bind_library_function(
+                    library, 'getVariableValue', [c_void_p, c_int], c_double)
+                get_meter_value = self._bind_library_function(
+                    library, 'getMeterValue', [c_void_p, c_int], c_double)
+                set_actuator_value = self._bind_library_function(
+                    library, 'setActuatorValue', [c_void_p, c_int, c_double], None)
+            except (AttributeError, TypeError) as err:
+                self.logger.warning(
+                    'Fast data exchange binding is not available ({}), using pyenergyplus wrappers.'.format(err))
+            else:
+                self._get_variable_value = get_variable_value
+                self._get_meter_value = get_meter_value
+                self._set_actuator_value = set_actuator_value
+                self.fast_exchange_bound = True
+                self.logger.debug('Fast data exchange binding ready.')
+
+    @staticmethod
+    def _bind_library_function(
+            library: CDLL,
+            name: str,
+            argtypes: List[Any],
+            restype: Any) -> Callable:
+        """Create a new ctypes function object from EnergyPlus library with fixed argtypes and restype
+           (pyenergyplus function objects are not modified).
+
+        Args:
+            library (CDLL): EnergyPlus library loaded by pyenergyplus.
+            name (str): Name of the library function.
+            argtypes (List[Any]): ctypes types of the arguments.
+            restype (Any): ctypes type of the result.
+
+        Returns:
+            Callable: ctypes function object.
+        """
+        function = library._FuncPtr((name, library))
+        function.argtypes = argtypes
+        function.restype = restype
+        return function
+
+    def _get_time_accessors(self) -> List[Callable[[Any], Any]]:
+        """Resolve time variables as bound methods of EnergyPlus Data Transfer API (once, instead of in each timestep).
+
+        Raises:
+            AssertionError: If a time variable is not an available method in DataExchange.
+
+        Returns:
+            List[Callable[[Any], Any]]: Accessors in time variables order. Each one receives the EnergyPlus state.
+        """
+        for t_variable in self.time_variables:
+            try:
+                assert not t_variable.startswith('_') and callable(
+                    getattr(self.exchange, t_variable, None))
+            except AssertionError as err:
+                self.logger.critical(
+                    'Time variables: {} is not an available method in EnergyPlus Data Transfer API (DataExchange).'.format(t_variable))
+                raise err
+
+        return [getattr(self.exchange, t_variable)
+                for t_variable in self.time_variables]
+
+    def _get_aggregation_indexes(self) -> Dict[str, np.ndarray]:
+        """Check decision interval configuration and get observation indexes for each aggregation method.
+
+        Raises:
+            AssertionError: If action repeat is not a positive int, or an aggregation variable or method is not available.
+
+        Returns:
+            Dict[str, np.ndarray]: Observation indexes of each aggregation method.
+        """
+        try:
+            assert isinstance(self.action_repeat, int)
+            assert self.action_repeat > 0
+        except AssertionError as err:
+            self.logger.critical(
+                'Action repeat must be a positive int value, specified value is {}.'.format(
+                    self.action_repeat))
+            raise err
+
+        obs_names = self.time_variables + \
+            list(self.variables.keys()) + list(self.meters.keys())
+        for var_name, method in self.aggregation.items():
+            try:
+                assert var_name in obs_names and method in self.AGGREGATION_METHODS
+            except AssertionError as err:
+                self.logger.critical(
+                    'Aggregation: {} ({}) is not an observation variable or the method is not in {}.'.format(
+                        var_name, method, self.AGGREGATION_METHODS))
+                raise err
+
+        indexes = {method_name: [] for method_name in self.AGGREGATION_METHODS}
+        for i, var_name in enumerate(obs_names):
+            indexes[self.aggregation.get(var_name, 'last')].append(i)
+        return {method_name: np.array(method_indexes, dtype=np.int64)
+                for method_name, method_indexes in indexes.items()}
 
     def _init_system(self, state_argument: int) -> None:
         """Indicate whether system are ready to work. After waiting to API data is available, handlers are initialized, and warmup flag is correct.
@@ -365,35 +910,70 @@ class EnergyPlus(object):
                 state_argument) and not self.initialized_handlers:
 
             if self.var_handlers is None or self.meter_handlers is None or self.actuator_handlers is None:
-                # Get variable handlers using variables info
-                self.var_handlers = {
-                    key: self.exchange.get_variable_handle(state_argument, *var)
-                    for key, var in self.variables.items()
-                }
-
-                # Get meter handlers using meters info
-                self.meter_handlers = {
-                    key: self.exchange.get_meter_handle(state_argument, meter)
-                    for key, meter in self.meters.items()
-                }
-
-                # Get actuator handlers using actuators info
-                self.actuator_handlers = {
-                    key: self.exchange.get_actuator_handle(
-                        state_argument, *actuator)
-                    for key, actuator in self.actuators.items()
-                }
-
-                # Save available_data information
-                self.available_data = self.exchange.list_available_api_data_csv(
-                    state_argument).decode('utf-8')
-
-                # write available_data.csv in parent output_path
-                parent_dir = Path(
-                    self._output_path).parent.parent.absolute().__str__()
-                data = self.available_data.splitlines()
-                with open(parent_dir + '/data_available.txt', "w") as txt_file:
-                    txt_file.writelines([line + '\n' for line in data])
+                # Catalog and handles resolved previously for this building
+                # model (in any process)
+                cache_key = None
+                cache_entry = None
+                if self.handle_cache is not None:
+                    cache_key = self.handle_cache.get_key(
+                        self._building_path, {
+                            'variables': self.variables,
+                            'meters': self.meters,
+                            'actuators': self.actuators,
+                            'request_variables': self.request_variables})
+                    cache_entry = self.handle_cache.get(cache_key)
+
+                if cache_entry is not None:
+                    self.var_handlers = cache_entry['var_handlers']
+                    self.meter_handlers = cache_entry['meter_handlers']
+                    self.actuator_handlers = cache_entry['actuator_handlers']
+                    self.available_data = cache_entry['available_data']
+                    self.logger.debug('Handlers loaded from handle cache.')
+                else:
+                    # Get variable handlers using variables info
+                    self.var_handlers = {
+                        key: self.exchange.get_variable_handle(state_argument, *var)
+                        for key, var in self.variables.items()
+                    }
+
+                    # Get meter handlers using meters info
+                    self.meter_handlers = {
+                        key: self.exchange.get_meter_handle(state_argument, meter)
+                        for key, meter in self.meters.items()
+                    }
+
+                    # Get actuator handlers using actuators info
+                    self.actuator_handlers = {
+                        key: self.exchange.get_actuator_handle(
+                            state_argument, *actuator)
+                        for key, actuator in self.actuators.items()
+                    }
+
+                    # Save available_data information
+                    self.available_data = self.exchange.list_available_api_data_csv(
+                        state_argument).decode('utf-8')
+
+                    if self.handle_cache is not None:
+                        self.handle_cache.store(cache_key, {
+                            'var_handlers': self.var_handlers,
+                            'meter_handlers': self.meter_handlers,
+                            'actuator_handlers': self.actuator_handlers,
+                            'available_data': self.available_data})
+
+                # write available_data.csv in experiment directory (only if
+                # its content has changed)
+                if self._data_dir is not None:
+                    parent_dir = Path(self._data_dir).absolute().__str__()
+                else:
+                    parent_dir = Path(
+                        self._output_path).parent.parent.absolute().__str__()
+                data = ''.join(
+                    [line + '\n' for line in self.available_data.splitlines()])
+                data_path = parent_dir + '/data_available.txt'
+                if not os.path.isfile(data_path) or Path(
+                        data_path).read_text() != data:
+                    with open(data_path, "w") as txt_file:
+                        txt_file.write(data)
 
                 # Check handlers specified exists
                 for variable_name, handle_value in self.var_handlers.items():
@@ -419,20 +999,30 @@ class EnergyPlus(object):
 
                 self.logger.info('handlers initialized.')
 
+            # Handle tables in observation/action order
+            self._var_handles = list(self.var_handlers.values())
+            self._meter_handles = list(self.meter_handlers.values())
+            self._actuator_handles = list(self.actuator_handlers.values())
+
             self.logger.info('handlers are ready.')
             self.initialized_handlers = True
 
-    def _flush_queues(self) -> None:
-        """It empties all values allocated in observation, action and warmup queues
+    def _publish_end_of_simulation(self) -> None:
+        """Close the communication channel and unblock a pending warmup wait, so consumers
+           know that run has finished without timeout heuristics.
         """
-        for q in [
-                self.obs_queue,
-                self.act_queue,
-                self.info_queue,
-                self.warmup_queue]:
-            while not q.empty():
-                q.get()
-        self.logger.debug('Simulator queues emptied.')
+        self.channel.close()
+        if not self.warmup_complete:
+            self.warmup_queue.put(False)
+        self.logger.debug('End of simulation published.')
+
+    def _flush_channels(self) -> None:
+        """It empties communication channel and warmup queue
+        """
+        self.channel.clear()
+        while not self.warmup_queue.empty():
+            self.warmup_queue.get()
+        self.logger.debug('Simulator channels emptied.')
 
     # ---------------------------------------------------------------------------- #
     #                                  Properties                                  #
@@ -441,3 +1031,11 @@ class EnergyPlus(object):
     @property
     def is_running(self) -> bool:
         return self.energyplus_thread is not None
+
+    @property
+    def building_path(self) -> Optional[str]:
+        return self._building_path
+
+    @property
+    def output_path(self) -> Optional[str]:
+        return self._output_path
@@ -0,0 +1,105 @@
+"""
+Persistent cache of EnergyPlus API data catalog and handles, shared between processes and runs.
+"""
+
+import hashlib
+import json
+import os
+from shutil import rmtree
+from typing import Any, Dict, Optional
+
+from sinergym.utils.constants import HANDLE_CACHE_PATH, LOG_SIM_LEVEL
+from sinergym.utils.logger import TerminalLogger
+
+
+class HandleCache(object):
+    """Cache of the API data catalog (list_available_api_data_csv) and the variable, meter and actuator handles
+       resolved for a building model. Each entry is identified by a hash of the building model file (epJSON adapted
+       for the episode), the EnergyPlus installation and the elements requested, so it is invalidated automatically
+       when any of them changes. Cache directory is created on first write; if it cannot be written, entries are
+       not stored anymore (simulators resolve handles by name).
+
+        :param path: Directory where cache entries are stored.
+        :param writable: Whether cache entries can be stored (False if cache directory could not be written).
+    """
+
+    logger = TerminalLogger().getLogger(
+        name='SIMULATOR',
+        level=LOG_SIM_LEVEL)
+
+    def __init__(self, path: str = HANDLE_CACHE_PATH):
+        """Constructor.
+
+        Args:
+            path (str, optional): Directory where cache entries are stored. Defaults to HANDLE_CACHE_PATH.
+        """
+        self.path = path
+        self.writable = True
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+
+    def get_key(self, building_path: str, spec: Dict[str, Any]) -> str:
+        """Cache key of a building model file and the elements requested to the simulator.
+
+        Args:
+            building_path (str): Building model file simulated.
+            spec (Dict[str, Any]): Variables, meters and actuators specification (and other options which change the handles).
+
+        Returns:
+            str: Cache key.
+        """
+        content = hashlib.sha256()
+        with open(building_path, 'rb') as building_f:
+            content.update(building_f.read())
+        content.update(os.environ.get('EPLUS_PATH', '').encode())
+        content.update(json.dumps(spec, sort_keys=True).encode())
+        return content.hexdigest()[:32]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the cache entry of a key.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: API data catalog (available_data) and handles (var_handlers, meter_handlers and actuator_handlers), or None if key is not cached.
+        """
+        try:
+            with open(self._entry_path(key)) as json_f:
+                return json.load(json_f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store the cache entry of a key.
+
+        Args:
+            key (str): Cache key.
+            entry (Dict[str, Any]): API data catalog (available_data) and handles (var_handlers, meter_handlers and actuator_handlers).
+        """
+        if not self.writable:
+            return
+        # Write in a temporal file first, other processes can read the cache
+        tmp_path = self._entry_path(key) + '.{}.tmp'.format(os.getpid())
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(tmp_path, 'w') as outfile:
+                json.dump(entry, outfile)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError as err:
+            self.writable = False
+            self.logger.warning(
+                'Handle cache: directory {} cannot be written, entries will not be stored ({}).'.format(
+                    self.path, err))
+            return
+        self.logger.debug('Handle cache: entry stored [{}].'.format(key))
+
+    def clear(self) -> None:
+        """Remove all cache entries.
+        """
+        rmtree(self.path, ignore_errors=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key + '.json')
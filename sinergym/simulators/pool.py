@@ -0,0 +1,187 @@
+"""
+Pool of EnergyPlus simulators warmed up in advance, shared between environments.
+"""
+
+import threading
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from sinergym.config.modeling import ModelJSON
+from sinergym.simulators.eplus import EnergyPlus
+from sinergym.utils.constants import LOG_SIM_LEVEL
+from sinergym.utils.logger import TerminalLogger
+
+
+class SimulatorPool(object):
+
+    # ---------------------------------------------------------------------------- #
+    #                              Pool Terminal Logger                            #
+    # ---------------------------------------------------------------------------- #
+
+    logger = TerminalLogger().getLogger(
+        name='SIMULATOR POOL',
+        level=LOG_SIM_LEVEL)
+
+    def __init__(self, max_size: int = 4, refill: bool = True):
+        """Pool of EnergyPlus simulators started (warming up or parked before their first action) for a
+           simulation key (building, weather, weather variability and simulator specification). Environments
+           borrow a simulator on reset and give back simulators which have not been stepped yet. Episode directory
+           of a pooled simulator (its output) is protected from episode rotation of the model which prepared it,
+           until the simulator is stopped.
+
+        Args:
+            max_size (int, optional): Maximum number of simulators in the pool. Least recently released simulators are evicted (closed) when it is full. Defaults to 4.
+            refill (bool, optional): Whether environments using the pool release a new simulator for the same key after each reset, so next reset with that key is a hit. Defaults to True.
+        """
+        try:
+            assert isinstance(max_size, int) and max_size > 0
+        except AssertionError as err:
+            self.logger.critical(
+                'Pool max_size must be a positive int value, specified value is {}.'.format(max_size))
+            raise err
+
+        self.max_size = max_size
+        self.refill = refill
+
+        # Entries in release order: id -> (key, simulator, episode context,
+        # model which prepared the episode)
+        self._entries: OrderedDict[int, Tuple[
+            Hashable, EnergyPlus, Dict[str, Any],
+            Optional[ModelJSON]]] = OrderedDict()
+        self._entry_ids = count()
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+
+    @staticmethod
+    def make_key(
+            building_file: str,
+            weather_file: str,
+            weather_variability: Optional[Dict[str, Tuple[float, float, float]]],
+            simulator_spec: Dict[str, Any]) -> Hashable:
+        """Simulation key of a pool entry.
+
+        Args:
+            building_file (str): Building file name.
+            weather_file (str): Weather file name.
+            weather_variability (Optional[Dict[str, Tuple[float, float, float]]]): Weather variability applied in the episode.
+            simulator_spec (Dict[str, Any]): Simulator arguments (variables, meters, actuators...), simulators are only shared between environments with the same ones.
+
+        Returns:
+            Hashable: Key for acquire and release methods.
+        """
+        variability = None if weather_variability is None else tuple(
+            sorted((name, tuple(params)) for name, params in weather_variability.items()))
+        return (building_file, weather_file, variability, repr(sorted(
+            (name, value) for name, value in simulator_spec.items() if name != 'name')))
+
+    def acquire(self, key: Hashable) -> Optional[Tuple[
+            EnergyPlus, Dict[str, Any], Optional[ModelJSON]]]:
+        """Borrow a started simulator for a simulation key. Its episode directory remains protected, the borrower
+           must unprotect it in the returned model when the simulator is stopped.
+
+        Args:
+            key (Hashable): Simulation key (see make_key).
+
+        Returns:
+            Optional[Tuple[EnergyPlus, Dict[str, Any], Optional[ModelJSON]]]: Simulator, model episode context used to start it and model which protects its episode directory, or None if there is not any simulator for that key (miss).
+        """
+        with self._lock:
+            for entry_id, (entry_key, simulator, context,
+                           model) in list(self._entries.items()):
+                if entry_key != key:
+                    continue
+                del self._entries[entry_id]
+                # Simulation ended before reaching its first timestep
+                if simulator.simulation_complete or simulator.failed():
+                    self.logger.warning(
+                        'Pooled simulator finished before being used, it is discarded.')
+                    self._close(simulator, context, model)
+                    continue
+                self.hits += 1
+                self.logger.debug('Pool hit: {}'.format(key[:2]))
+                return simulator, context, model
+            self.misses += 1
+            self.logger.debug('Pool miss: {}'.format(key[:2]))
+            return None
+
+    def release(
+            self,
+            key: Hashable,
+            simulator: EnergyPlus,
+            context: Dict[str, Any],
+            model: Optional[ModelJSON] = None) -> None:
+        """Give a started simulator (which has not received any action) to the pool. If the pool is full,
+           the least recently released simulator is evicted.
+
+        Args:
+            key (Hashable): Simulation key (see make_key).
+            simulator (EnergyPlus): Started simulator.
+            context (Dict[str, Any]): Model episode context used to start the simulator.
+            model (Optional[ModelJSON], optional): Model which prepared the episode, its episode directory is protected from rotation while the simulator is running. Defaults to None.
+        """
+        if model is not None:
+            model.protect_episode_dir(context['episode_path'])
+        with self._lock:
+            while len(self._entries) >= self.max_size:
+                _, (_, evicted, evicted_context,
+                    evicted_model) = self._entries.popitem(last=False)
+                self._close(evicted, evicted_context, evicted_model)
+                self.evictions += 1
+                self.logger.debug('Pool full, simulator evicted.')
+            self._entries[next(self._entry_ids)] = (
+                key, simulator, context, model)
+
+    def clear(self) -> None:
+        """Close all simulators in the pool.
+        """
+        with self._lock:
+            for _, simulator, context, model in self._entries.values():
+                self._close(simulator, context, model)
+            self._entries.clear()
+        self.logger.debug('Pool cleared.')
+
+    # ---------------------------------------------------------------------------- #
+    #                              Auxiliary methods                               #
+    # ---------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _close(simulator: EnergyPlus,
+               context: Dict[str, Any],
+               model: Optional[ModelJSON]) -> None:
+        """Close a pooled simulator (its process is finished in process backend) and remove protection of its
+           episode directory.
+
+        Args:
+            simulator (EnergyPlus): Pooled simulator.
+            context (Dict[str, Any]): Model episode context used to start the simulator.
+            model (Optional[ModelJSON]): Model which protects its episode directory.
+        """
+        simulator.close()
+        if model is not None:
+            model.unprotect_episode_dir(context['episode_path'])
+
+    # ---------------------------------------------------------------------------- #
+    #                                  Properties                                  #
+    # ---------------------------------------------------------------------------- #
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            'size': self.size,
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions}
@@ -0,0 +1,562 @@
+"""
+EnergyPlus simulator running in a child process, exchanging observations and actions through shared memory.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from sinergym.simulators.eplus import EnergyPlus, SimulationProgress
+from sinergym.utils.constants import LOG_SIM_LEVEL
+from sinergym.utils.logger import TerminalLogger
+from sinergym.utils.timing import PhaseTimer, TraceRecorder
+
+
+class SharedMemoryChannel(object):
+    """Single-slot rendezvous between an EnergyPlus process and the Gymnasium environment, with the same interface
+       as ExchangeChannel. Observation, info and action slots are float64 arrays in a shared memory block, and each
+       direction is signalled with a process semaphore. The block also holds a header with end of simulation flag,
+       exit code and progress of the simulation.
+
+        :param obs_size: Number of observation values.
+        :param action_size: Number of action values.
+    """
+
+    # Info keys published in each timestep (in info slot order)
+    INFO_KEYS = ('time_elapsed(hours)', 'month', 'day', 'hour', 'is_raining')
+    # Header slots
+    CLOSED, EXIT_CODE, PERCENT, PROGRESS_TIME = range(4)
+    HEADER_SIZE = 4
+    # Polling interval bounds of wait_observation (seconds)
+    POLL_INTERVAL = (0.0001, 0.005)
+
+    def __init__(self, obs_size: int, action_size: int):
+        """Constructor (creates the shared memory block, it is attached when the channel is passed to a child process).
+
+        Args:
+            obs_size (int): Number of observation values.
+            action_size (int): Number of action values.
+        """
+        self.obs_size = obs_size
+        self.action_size = action_size
+        size = self.HEADER_SIZE + obs_size + len(self.INFO_KEYS) + action_size
+        self.shm = SharedMemory(create=True, size=max(size, 1) * 8)
+        self._owner = True
+        # Signals (obs+info ready for agent, action ready for simulator)
+        ctx = multiprocessing.get_context('spawn')
+        self._obs_ready = ctx.Semaphore(0)
+        self._act_ready = ctx.Semaphore(0)
+        self._bind_slots()
+        self.header[:] = 0.0
+        self.header[self.EXIT_CODE] = np.nan
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'name': self.shm.name,
+                'obs_size': self.obs_size,
+                'action_size': self.action_size,
+                'obs_ready': self._obs_ready,
+                'act_ready': self._act_ready}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.obs_size = state['obs_size']
+        self.action_size = state['action_size']
+        self._obs_ready = state['obs_ready']
+        self._act_ready = state['act_ready']
+        # Attached block is unlinked by its owner (not by this process)
+        try:
+            self.shm = SharedMemory(name=state['name'], track=False)
+        except TypeError:  # pragma: no cover
+            # Python < 3.13: spawned processes share the resource tracker of
+            # the owner, where the block is already registered
+            self.shm = SharedMemory(name=state['name'])
+        self._owner = False
+        self._bind_slots()
+
+    def _bind_slots(self) -> None:
+        buffer = np.ndarray(
+            (self.shm.size // 8,), dtype=np.float64, buffer=self.shm.buf)
+        info_begin = self.HEADER_SIZE + self.obs_size
+        action_begin = info_begin + len(self.INFO_KEYS)
+        self.header = buffer[:self.HEADER_SIZE]
+        self.obs = buffer[self.HEADER_SIZE:info_begin]
+        self._info = buffer[info_begin:action_begin]
+        self._action = buffer[action_begin:action_begin + self.action_size]
+
+    # ---------------------------------------------------------------------------- #
+    #                        ExchangeChannel interface                             #
+    # ---------------------------------------------------------------------------- #
+
+    def put_observation(self, obs: Any, info: Dict[str, Any]) -> None:
+        """Publish observation and info of the current timestep (EnergyPlus process).
+
+        Args:
+            obs (Any): Observation values.
+            info (Dict[str, Any]): Extra information of the timestep (INFO_KEYS).
+        """
+        self.obs[:] = obs
+        for i, key in enumerate(self.INFO_KEYS):
+            self._info[i] = info[key]
+        self._obs_ready.release()
+
+    def get_observation(self, timeout: Optional[float] = None) -> Tuple[
+            Optional[np.ndarray], Optional[Dict[str, Any]]]:
+        """Wait for the next observation and info (Gymnasium environment).
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. Defaults to None (wait until available).
+
+        Raises:
+            TimeoutError: If timeout is specified and observation is not published in time.
+
+        Returns:
+            Tuple[Optional[np.ndarray], Optional[Dict[str, Any]]]: Observation (view of the shared slot) and info. Both are None if simulation has ended.
+        """
+        if not self._obs_ready.acquire(timeout=timeout):
+            raise TimeoutError
+        if self.closed:
+            # Keep signal active, next waits must return immediately too
+            self._obs_ready.release()
+            return None, None
+        info = self._info
+        return self.obs, {
+            'time_elapsed(hours)': float(info[0]),
+            'month': int(info[1]),
+            'day': int(info[2]),
+            'hour': int(info[3]),
+            'is_raining': bool(info[4])}
+
+    def wait_observation(
+            self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        """Future of loop resolved when the next observation is published or the channel is closed. The observation
+           is not consumed, get_observation returns it without blocking once the future is done. The semaphore is
+           released by another process, so it is polled from the loop with increasing intervals (no threads).
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Event loop of the consumer.
+
+        Returns:
+            asyncio.Future: Future resolved (with None) when observation is available.
+        """
+        return loop.create_task(self._poll_observation())
+
+    async def _poll_observation(self) -> None:
+        interval, max_interval = self.POLL_INTERVAL
+        while not self._obs_ready.acquire(block=False):
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, max_interval)
+        # Keep signal active for get_observation
+        self._obs_ready.release()
+
+    def put_action(self, action: Any) -> None:
+        """Publish the action to be applied in the next timestep (Gymnasium environment).
+
+        Args:
+            action (Any): Action values.
+        """
+        self._action[:] = action
+        self._act_ready.release()
+
+    def get_action(self) -> Optional[np.ndarray]:
+        """Wait for the next action (EnergyPlus process).
+
+        Returns:
+            Optional[np.ndarray]: Action values (None if channel has been closed).
+        """
+        self._act_ready.acquire()
+        if self.closed:
+            self._act_ready.release()
+            return None
+        return self._action
+
+    def close(self) -> None:
+        """Publish end of simulation. Pending and future waits in both directions return
+           immediately (observation, info and action are None).
+        """
+        if self.closed:
+            return
+        self.header[self.CLOSED] = 1.0
+        self._obs_ready.release()
+        self._act_ready.release()
+
+    def clear(self) -> None:
+        """Empty both signals and reset header, preparing the channel for a new simulation.
+        """
+        self.header[self.CLOSED] = 0.0
+        self.header[self.EXIT_CODE] = np.nan
+        self.header[self.PERCENT] = 0.0
+        for signal in [self._obs_ready, self._act_ready]:
+            while signal.acquire(block=False):
+                pass
+
+    def release(self) -> None:
+        """Detach the shared memory block (and remove it if this process created it).
+        """
+        self.header = self.obs = self._info = self._action = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # Observation views still referenced, mapping is freed with them
+            pass
+        if self._owner:
+            self.shm.unlink()
+
+    # ---------------------------------------------------------------------------- #
+    #                                  Properties                                  #
+    # ---------------------------------------------------------------------------- #
+
+    @property
+    def closed(self) -> bool:
+        return self.header[self.CLOSED] > 0
+
+    @property
+    def exit_code(self) -> Optional[int]:
+        """EnergyPlus exit code (None while simulation is running)."""
+        exit_code = self.header[self.EXIT_CODE]
+        return None if np.isnan(exit_code) else int(exit_code)
+
+
+def _simulator_worker(
+        simulator_kwargs: Dict[str, Any],
+        channel: SharedMemoryChannel,
+        commands: Any,
+        warmup_queue: Any,
+        stop_event: Any,
+        stopped_event: Any) -> None:
+    """Main loop of the EnergyPlus process. It runs a simulation for each start command received (until a None command),
+       which is stopped when stop_event is set.
+
+    Args:
+        simulator_kwargs (Dict[str, Any]): EnergyPlus simulator arguments.
+        channel (SharedMemoryChannel): Channel attached to the environment.
+        commands (Any): Queue of start commands (EnergyPlus.start arguments).
+        warmup_queue (Any): Queue where warmup completion is published.
+        stop_event (Any): Event to stop current simulation.
+        stopped_event (Any): Event set when current simulation has been stopped.
+    """
+    simulator = EnergyPlus(**simulator_kwargs)
+    simulator.channel = channel
+    simulator.warmup_queue = warmup_queue
+
+    # Exit code is published before end of simulation
+    publish_end_of_simulation = simulator._publish_end_of_simulation
+
+    def _publish_end_of_simulation() -> None:
+        channel.header[channel.EXIT_CODE] = simulator.sim_results.get(
+            'exit_code', -1)
+        publish_end_of_simulation()
+    simulator._publish_end_of_simulation = _publish_end_of_simulation
+
+    # Progress counter values shared with the environment
+    progress_update = simulator.progress.update
+
+    def _progress_update(percent: int) -> None:
+        progress_update(percent)
+        channel.header[channel.PROGRESS_TIME] = simulator.progress.update_time
+        channel.header[channel.PERCENT] = percent
+    simulator.progress.update = _progress_update
+
+    while True:
+        command = commands.get()
+        if command is None:
+            break
+        simulator.start(**command)
+        stop_event.wait()
+        simulator.stop()
+        stop_event.clear()
+        stopped_event.set()
+    channel.release()
+
+
+def _finish_process(
+        process: Optional[multiprocessing.Process],
+        commands: Any) -> None:
+    """Finish an EnergyPlus process (killed if it does not finish in 10 seconds).
+
+    Args:
+        process (Optional[multiprocessing.Process]): EnergyPlus process.
+        commands (Any): Queue of start commands of the process.
+    """
+    if process is not None and process.is_alive():
+        commands.put(None)
+        process.join(timeout=10)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+def _shutdown_worker(
+        process: Optional[multiprocessing.Process],
+        commands: Any,
+        channel: SharedMemoryChannel) -> None:
+    """Finish an EnergyPlus process and free its channel.
+
+    Args:
+        process (Optional[multiprocessing.Process]): EnergyPlus process.
+        commands (Any): Queue of start commands of the process.
+        channel (SharedMemoryChannel): Channel of the process.
+    """
+    _finish_process(process, commands)
+    channel.release()
+
+
+class EnergyPlusProcess(object):
+
+    # ---------------------------------------------------------------------------- #
+    #                           Simulator Terminal Logger                          #
+    # ---------------------------------------------------------------------------- #
+
+    logger = TerminalLogger().getLogger(
+        name='SIMULATOR PROCESS',
+        level=LOG_SIM_LEVEL)
+
+    # Seconds to wait for a simulation to stop before killing its process
+    STOP_TIMEOUT = 60.0
+
+    def __init__(self, name: str, **simulator_kwargs: Any):
+        """EnergyPlus runner class with the same interface as EnergyPlus (start, stop, failed), but simulations run
+           in a child process (started on first start and reused in next ones). A native crash of EnergyPlus only
+           finishes that process (failed returns True and a new one is started in next start), and EnergyPlus
+           callbacks do not compete with the agent for the GIL. Callback phases are not measured by timer or tracer.
+
+        Args:
+            name (str): Name of the environment which is using the simulator.
+            **simulator_kwargs: EnergyPlus simulator arguments (time_variables, variables, meters, actuators...).
+        """
+        self.name = name
+        self.simulator_kwargs = dict(simulator_kwargs, name=name)
+        self.time_variables = simulator_kwargs.get('time_variables', [])
+        self.variables = simulator_kwargs.get('variables', {})
+        self.meters = simulator_kwargs.get('meters', {})
+        self.actuators = simulator_kwargs.get('actuators', {})
+        self.action_repeat = simulator_kwargs.get('action_repeat', 1)
+        self.progress_mode = simulator_kwargs.get('progress', 'bar')
+
+        # Gym communication channel (shared memory slots)
+        self.channel = SharedMemoryChannel(
+            obs_size=len(self.time_variables) + len(self.variables) + len(self.meters),
+            action_size=len(self.actuators))
+        # Observation buffer is the shared observation slot
+        self.obs_buffer: np.ndarray = self.channel.obs
+
+        # Process elements (created on first start)
+        self._ctx = multiprocessing.get_context('spawn')
+        self.process: Optional[multiprocessing.Process] = None
+        self._commands = self._ctx.Queue()
+        self.warmup_queue = self._ctx.Queue()
+        self.warmup_complete = False
+        self._stop_event = self._ctx.Event()
+        self._stopped_event = self._ctx.Event()
+        self._watcher: Optional[threading.Thread] = None
+        # Process and shared memory block are freed when simulator is closed
+        # or garbage collected
+        self._finalizer = weakref.finalize(
+            self, _shutdown_worker, None, self._commands, self.channel)
+        self.crashed = False
+
+        # Handlers are initialized in the EnergyPlus process
+        self.var_handlers: Optional[Dict[str, int]] = None
+        self.meter_handlers: Optional[Dict[str, int]] = None
+        self.actuator_handlers: Optional[Dict[str, int]] = None
+        self.available_data: Optional[str] = None
+
+        # Progress counter (updated from channel header when it is read)
+        self._progress = SimulationProgress(
+            episode_length=simulator_kwargs.get('episode_length'))
+        self.progress_bar = None
+
+        # Set by the environment (EnergyPlus callbacks run in other process,
+        # so they are not measured)
+        self.timer: Optional[PhaseTimer] = None
+        self.tracer: Optional[TraceRecorder] = None
+
+        self._running = False
+
+        # Paths
+        self._building_path: Optional[str] = None
+        self._weather_path: Optional[str] = None
+        self._output_path: Optional[str] = None
+
+        self.logger.debug('Energyplus process simulator initialized.')
+
+    # ---------------------------------------------------------------------------- #
+    #                                 Main methods                                 #
+    # ---------------------------------------------------------------------------- #
+    def start(self,
+              building_path: str,
+              weather_path: str,
+              output_path: str,
+              episode: int,
+              data_dir: Optional[str] = None) -> None:
+        """Start running a simulation in the EnergyPlus process (the process is started if it is not alive).
+
+        Args:
+            building_path (str): EnergyPlus input description file path.
+            weather_path (str): EnergyPlus weather path.
+            output_path (str): Path where EnergyPlus process is going to allocate its output files.
+            episode (int): Number of the episode to run (useful to show in progress bar).
+            data_dir (Optional[str], optional): Directory where data_available.txt is written (experiment directory). Defaults to the parent of the episode directory of output_path.
+        """
+        self._building_path = building_path
+        self._weather_path = weather_path
+        self._output_path = output_path
+
+        if self.process is None or not self.process.is_alive():
+            self._start_process()
+
+        self.channel.clear()
+        self._progress.reset(episode)
+        self.warmup_complete = False
+        self.crashed = False
+        self._running = True
+        self._commands.put({'building_path': building_path,
+                            'weather_path': weather_path,
+                            'output_path': output_path,
+                            'episode': episode,
+                            'data_dir': data_dir})
+        self.logger.debug(
+            'Energyplus simulation started in process {}.'.format(
+                self.process.pid))
+
+    def stop(self) -> None:
+        """Stop current simulation and wait for the EnergyPlus process to be ready for the next one. If the
+           process does not stop in STOP_TIMEOUT seconds, it is killed (a new one is started in next start).
+        """
+        if self._running:
+            self._stop_event.set()
+            stopped = False
+            waited = 0.0
+            while not stopped and waited < self.STOP_TIMEOUT and self.process.is_alive():
+                stopped = self._stopped_event.wait(timeout=0.1)
+                waited += 0.1
+            if not stopped and self.process.is_alive():
+                self.logger.warning(
+                    'EnergyPlus process did not stop in {} seconds, it is killed.'.format(
+                        self.STOP_TIMEOUT))
+                self.process.kill()
+                self.process.join()
+            if not self.process.is_alive():
+                # Crash already published
+                self._watcher.join()
+            self._stopped_event.clear()
+            self._stop_event.clear()
+            self.channel.clear()
+            while not self.warmup_queue.empty():
+                self.warmup_queue.get()
+            self.warmup_complete = False
+            self.crashed = False
+            self._running = False
+            self.logger.debug('Energyplus simulation stopped.')
+
+    def close(self) -> None:
+        """Stop current simulation and finish the EnergyPlus process (a new one is started in next start).
+           Shared memory block is freed when the simulator is garbage collected.
+        """
+        self.stop()
+        _finish_process(self.process, self._commands)
+        self.process = None
+        self._finalizer.detach()
+        self._finalizer = weakref.finalize(
+            self, _shutdown_worker, None, self._commands, self.channel)
+        self.logger.debug('Energyplus process closed.')
+
+    def failed(self) -> bool:
+        """Method to determine if simulation has failed (EnergyPlus error or process crash).
+
+        Returns:
+            bool: Flag to describe this state
+        """
+        return self.crashed or (self.channel.exit_code or 0) > 0
+
+    # ---------------------------------------------------------------------------- #
+    #                              Auxiliary methods                               #
+    # ---------------------------------------------------------------------------- #
+
+    def _start_process(self) -> None:
+        """Start the EnergyPlus process and a thread watching it, which publishes end of simulation if it crashes.
+        """
+        # Channel is kept if there is a previous (dead or closed) process
+        self._finalizer.detach()
+        self.process = self._ctx.Process(
+            target=_simulator_worker,
+            name='{}-energyplus'.format(self.name),
+            args=(self.simulator_kwargs,
+                  self.channel,
+                  self._commands,
+                  self.warmup_queue,
+                  self._stop_event,
+                  self._stopped_event),
+            daemon=True)
+        self.process.start()
+        self._finalizer = weakref.finalize(
+            self, _shutdown_worker, self.process, self._commands, self.channel)
+
+        # Watcher only references process elements (not the simulator)
+        def _watch(process, channel, warmup_queue, on_crash):
+            process.join()
+            # Closed process (exit code 0) or channel already released
+            if process.exitcode == 0 or channel.header is None:
+                return
+            channel.header[channel.EXIT_CODE] = process.exitcode
+            channel.close()
+            warmup_queue.put(False)
+            method = on_crash()
+            if method is not None:
+                method(process.exitcode)
+
+        self._watcher = threading.Thread(
+            target=_watch,
+            args=(self.process, self.channel, self.warmup_queue,
+                  weakref.WeakMethod(self._on_crash)),
+            daemon=True)
+        self._watcher.start()
+        self.logger.info(
+            'EnergyPlus process started [{}].'.format(self.process.pid))
+
+    def _on_crash(self, exitcode: int) -> None:
+        self.crashed = True
+        self.logger.critical(
+            'EnergyPlus process finished unexpectedly with exit code {}.'.format(exitcode))
+
+    # ---------------------------------------------------------------------------- #
+    #                                  Properties                                  #
+    # ---------------------------------------------------------------------------- #
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def simulation_complete(self) -> bool:
+        return self._running and self.channel.closed
+
+    @property
+    def energyplus_state(self) -> Optional[int]:
+        """Process identifier while a simulation is running (None otherwise)."""
+        return self.process.pid if self._running else None
+
+    @property
+    def sim_results(self) -> Dict[str, Any]:
+        exit_code = self.channel.exit_code
+        return {} if exit_code is None else {'exit_code': exit_code}
+
+    @property
+    def progress(self) -> SimulationProgress:
+        header = self.channel.header
+        if header[self.channel.PERCENT] > 0:
+            self._progress.percent = int(header[self.channel.PERCENT])
+            self._progress.update_time = float(
+                header[self.channel.PROGRESS_TIME])
+        return self._progress
+
+    @property
+    def building_path(self) -> Optional[str]:
+        return self._building_path
+
+    @property
+    def output_path(self) -> Optional[str]:
+        return self._output_path
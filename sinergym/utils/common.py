@@ -1,8 +1,9 @@
 """Common utilities."""
 
+from collections.abc import Mapping
 from copy import deepcopy
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, Union
 
 import gymnasium as gym
 import numpy as np
@@ -49,6 +50,39 @@ def unwrap_wrapper(env: gym.Env,
         env_tmp = env_tmp.env
     return None
 
+# -------------------------------- Observations ------------------------------- #
+
+
+class ObservationView(Mapping):
+    """Read-only dictionary view over an observation array. Values are looked up by
+       variable name without building a new dictionary in each timestep.
+    """
+
+    __slots__ = ('_index', '_values')
+
+    def __init__(self, index: Dict[str, int], values: np.ndarray):
+        """Constructor.
+
+        Args:
+            index (Dict[str, int]): Position of each observation variable in values.
+            values (np.ndarray): Observation values in observation_variables order.
+        """
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> float:
+        return float(self._values[self._index[key]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 # ----------------------------- Building modeling ---------------------------- #
 
 
@@ -187,12 +221,14 @@ def export_schedulers_to_excel(
 
 def ornstein_uhlenbeck_process(
         data: pd.DataFrame,
-        variability_config: Dict[str, Tuple[float, float, float]]) -> pd.DataFrame:
+        variability_config: Dict[str, Tuple[float, float, float]],
+        np_random: Optional[np.random.Generator] = None) -> pd.DataFrame:
     """Add noise to the data using the Ornstein-Uhlenbeck process.
 
     Args:
         data (pd.DataFrame): Data to be modified.
         variability_config (Dict[str, Tuple[float, float, float]]): Dictionary with the variability configuration for each variable (sigma, mu and tau constants).
+        np_random (Optional[np.random.Generator], optional): Random generator used for the noise (e.g. environment np_random, seeded in reset). Defaults to None (numpy global random state).
 
     Returns:
         pd.DataFrame: Data with noise added.
@@ -209,6 +245,8 @@ def ornstein_uhlenbeck_process(
     dt = T / 1.0  # tau defined as epw rows (hours)
     # t = np.linspace(0., T, n)  # Vector of times.
 
+    standard_normal = np.random.randn if np_random is None else np_random.standard_normal
+
     for variable, variation in variability_config.items():
 
         sigma = variation[0]  # Standard deviation.
@@ -222,7 +260,7 @@ def ornstein_uhlenbeck_process(
         noise = np.zeros(n)
         for i in range(n - 1):
             noise[i + 1] = noise[i] + dt * (-(noise[i] - mu) / tau) + \
-                sigma_bis * sqrtdt * np.random.randn()
+                sigma_bis * sqrtdt * standard_normal()
 
         # Add noise
         data_mod[variable] += noise
@@ -18,6 +18,27 @@ WEEKDAY_ENCODING = {'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
 YEAR = 1991
 # cwd
 CWD = os.getcwd()
+# Default sizing cache directory (hard-sized building models)
+SIZING_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'sinergym', 'sizing')
+# Default handle cache directory (EnergyPlus API catalog and handles)
+HANDLE_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'sinergym', 'handles')
+
+# Simulator waiting timeouts in seconds (adaptive mode): timeout used until
+# enough latencies are measured, and minimum adaptive timeout
+STEP_TIMEOUT_INITIAL = 30.0
+STEP_TIMEOUT_MIN = 5.0
+RESET_TIMEOUT_INITIAL = 900.0
+RESET_TIMEOUT_MIN = 60.0
+
+# Maximum number of trace events kept per episode (ring buffer)
+TRACE_BUFFER_SIZE = 200000
+
+# Environment server (sinergym.serve): default TCP port and seconds a client
+# retries the connection while the server starts
+SERVE_PORT = 7878
+SERVE_CONNECT_TIMEOUT = 60.0
 
 # Logger values (environment layer, simulator layer and modeling layer)
 LOG_ENV_LEVEL = 'INFO'
@@ -27,6 +48,7 @@ LOG_WRAPPERS_LEVEL = 'INFO'
 LOG_REWARD_LEVEL = 'INFO'
 LOG_COMMON_LEVEL = 'INFO'
 LOG_CALLBACK_LEVEL = 'INFO'
+LOG_SERVE_LEVEL = 'INFO'
 # LOG_FORMAT = "[%(asctime)s] %(name)s %(levelname)s:%(message)s"
 LOG_FORMAT = "[%(name)s] (%(levelname)s) : %(message)s"
 
@@ -0,0 +1,317 @@
+"""Utilities to measure simulator latencies and derive waiting timeouts from them."""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from sinergym.utils.constants import TRACE_BUFFER_SIZE
+
+
+class LatencyTracker(object):
+    """Running latency distribution, as exponentially weighted moving average (EWMA) of mean and variance.
+       It derives an adaptive timeout from the measured latencies, which follows the load of the node.
+
+        :param initial_timeout: Timeout used until warmup_samples latencies have been recorded.
+        :param min_timeout: Lower bound of the adaptive timeout.
+        :param multiplier: Margin applied over the latency upper estimate (mean + 4 standard deviations).
+        :param alpha: EWMA smoothing factor.
+        :param warmup_samples: Number of latencies required to use the adaptive timeout.
+    """
+
+    def __init__(
+            self,
+            initial_timeout: float,
+            min_timeout: float,
+            multiplier: float = 10.0,
+            alpha: float = 0.05,
+            warmup_samples: int = 10):
+        """Constructor.
+
+        Args:
+            initial_timeout (float): Timeout in seconds used until warmup_samples latencies have been recorded.
+            min_timeout (float): Lower bound of the adaptive timeout in seconds.
+            multiplier (float, optional): Margin applied over the latency upper estimate (mean + 4 standard deviations). Defaults to 10.0.
+            alpha (float, optional): EWMA smoothing factor. Defaults to 0.05.
+            warmup_samples (int, optional): Number of latencies required to use the adaptive timeout. Defaults to 10.
+        """
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.multiplier = multiplier
+        self.alpha = alpha
+        self.warmup_samples = warmup_samples
+
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+        self.max = 0.0
+
+    def record(self, latency: float) -> None:
+        """Add a latency to the distribution.
+
+        Args:
+            latency (float): Latency in seconds.
+        """
+        self.count += 1
+        if self.count == 1:
+            self.mean = latency
+        else:
+            diff = latency - self.mean
+            increment = self.alpha * diff
+            self.mean += increment
+            self.var = (1 - self.alpha) * (self.var + diff * increment)
+        if latency > self.max:
+            self.max = latency
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
+
+    @property
+    def timeout(self) -> float:
+        """Timeout in seconds derived from the latency distribution (initial timeout until warmup is completed)."""
+        if self.count < self.warmup_samples:
+            return self.initial_timeout
+        return max(self.min_timeout, self.multiplier *
+                   (self.mean + 4 * self.std))
+
+
+class PhaseTimer(object):
+    """Preallocated duration counters of named phases (count, total, maximum and a log-spaced histogram
+       with BINS_PER_DECADE bins per decade between 10^MIN_EXPONENT and 10^MAX_EXPONENT seconds).
+       Recording a duration only updates fixed positions of plain lists, so it can be called in each timestep.
+
+        :param phases: Names of the phases measured.
+    """
+
+    BINS_PER_DECADE = 5
+    MIN_EXPONENT = -7
+    MAX_EXPONENT = 3
+
+    def __init__(self, phases: List[str]):
+        """Constructor.
+
+        Args:
+            phases (List[str]): Names of the phases measured.
+        """
+        self.phases: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.n_bins = (self.MAX_EXPONENT - self.MIN_EXPONENT) * \
+            self.BINS_PER_DECADE
+        # Upper edge of each histogram bin
+        self.bin_edges = np.logspace(
+            self.MIN_EXPONENT,
+            self.MAX_EXPONENT,
+            self.n_bins + 1)[1:]
+        self.counts: List[int] = []
+        self.totals: List[float] = []
+        self.maxs: List[float] = []
+        self.histograms: List[List[int]] = []
+        for phase in phases:
+            self.add_phase(phase)
+
+    def add_phase(self, phase: str) -> int:
+        """Add a phase (if it does not exist yet).
+
+        Args:
+            phase (str): Phase name.
+
+        Returns:
+            int: Index of the phase, used to record its durations.
+        """
+        if phase not in self.index:
+            self.index[phase] = len(self.phases)
+            self.phases.append(phase)
+            self.counts.append(0)
+            self.totals.append(0.0)
+            self.maxs.append(0.0)
+            self.histograms.append([0] * self.n_bins)
+        return self.index[phase]
+
+    def record(self, phase: int, duration: float) -> None:
+        """Record a duration of a phase.
+
+        Args:
+            phase (int): Index of the phase.
+            duration (float): Duration in seconds.
+        """
+        self.counts[phase] += 1
+        self.totals[phase] += duration
+        if duration > self.maxs[phase]:
+            self.maxs[phase] = duration
+        bin_index = int((math.log10(duration) - self.MIN_EXPONENT) *
+                        self.BINS_PER_DECADE) if duration > 0 else 0
+        self.histograms[phase][min(
+            max(bin_index, 0), self.n_bins - 1)] += 1
+
+    def reset(self) -> None:
+        """Set all counters to zero.
+        """
+        for i in range(len(self.phases)):
+            self.counts[i] = 0
+            self.totals[i] = 0.0
+            self.maxs[i] = 0.0
+            self.histograms[i] = [0] * self.n_bins
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Statistics of each phase. Percentiles are upper edges of histogram bins (bounded by the maximum).
+
+        Returns:
+            Dict[str, Dict[str, float]]: Count, total, mean, max, p50 and p99 (seconds) of each phase.
+        """
+        stats = {}
+        for phase, i in self.index.items():
+            count = self.counts[i]
+            stats[phase] = {
+                'count': count,
+                'total': self.totals[i],
+                'mean': self.totals[i] / count if count > 0 else 0.0,
+                'max': self.maxs[i],
+                'p50': self._percentile(i, 0.5),
+                'p99': self._percentile(i, 0.99)}
+        return stats
+
+    def _percentile(self, phase: int, q: float) -> float:
+        count = self.counts[phase]
+        if count == 0:
+            return 0.0
+        bin_index = int(np.searchsorted(
+            np.cumsum(self.histograms[phase]), q * count))
+        if bin_index >= self.n_bins - 1:
+            return self.maxs[phase]
+        return float(min(self.bin_edges[bin_index], self.maxs[phase]))
+
+
+class TraceRecorder(object):
+    """Bounded ring buffer of trace events (complete events with begin time and duration), exported in Chrome
+       Trace Event Format (JSON), which can be opened in Perfetto or chrome://tracing. Each thread recording
+       events has its own track. When the buffer is full, oldest events are overwritten.
+
+        :param capacity: Maximum number of events kept.
+    """
+
+    def __init__(self, capacity: int = TRACE_BUFFER_SIZE):
+        """Constructor.
+
+        Args:
+            capacity (int, optional): Maximum number of events kept. Defaults to TRACE_BUFFER_SIZE.
+        """
+        self.capacity = capacity
+        self.pid = os.getpid()
+        # Timestamps are exported relative to this origin
+        self.origin = time.perf_counter()
+        self._events: List[Optional[tuple]] = [None] * capacity
+        self._counter = count()
+        self._recorded = 0
+        self._threads: Dict[int, str] = {}
+
+    def complete(
+            self,
+            name: str,
+            category: str,
+            begin: float,
+            end: float,
+            args: Optional[Dict[str, Any]] = None) -> None:
+        """Record an event of the calling thread.
+
+        Args:
+            name (str): Event name.
+            category (str): Event category (env, model, energyplus or wrapper).
+            begin (float): Begin time (time.perf_counter).
+            end (float): End time (time.perf_counter).
+            args (Optional[Dict[str, Any]], optional): Extra data shown with the event. Defaults to None.
+        """
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        # Counter is thread-safe, each event has its own slot
+        i = next(self._counter)
+        self._events[i % self.capacity] = (
+            name, category, begin, end - begin, tid, args)
+        if i >= self._recorded:
+            self._recorded = i + 1
+
+    @contextmanager
+    def span(self, name: str, category: str,
+             args: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+        """Context manager recording its body as an event.
+
+        Args:
+            name (str): Event name.
+            category (str): Event category.
+            args (Optional[Dict[str, Any]], optional): Extra data shown with the event. Defaults to None.
+        """
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, category, begin, time.perf_counter(), args)
+
+    def clear(self) -> None:
+        """Remove all events.
+        """
+        self._events = [None] * self.capacity
+        self._counter = count()
+        self._recorded = 0
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Events in Trace Event Format (thread name metadata events first, then events in recording order).
+
+        Returns:
+            List[Dict[str, Any]]: Trace events (timestamps and durations in microseconds).
+        """
+        recorded = self._recorded
+        if recorded > self.capacity:
+            start = recorded % self.capacity
+            slots = self._events[start:] + self._events[:start]
+        else:
+            slots = self._events[:recorded]
+        trace_events = [{'name': 'thread_name',
+                         'ph': 'M',
+                         'pid': self.pid,
+                         'tid': tid,
+                         'args': {'name': thread_name}}
+                        for tid, thread_name in list(self._threads.items())]
+        for event in slots:
+            if event is None:
+                continue
+            name, category, begin, duration, tid, args = event
+            trace_event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (begin - self.origin) * 1e6,
+                'dur': duration * 1e6,
+                'pid': self.pid,
+                'tid': tid}
+            if args is not None:
+                trace_event['args'] = args
+            trace_events.append(trace_event)
+        return trace_events
+
+    def dump(self, path: str) -> None:
+        """Write events in a Trace Event Format JSON file.
+
+        Args:
+            path (str): File path.
+        """
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': self.events(),
+                       'displayTimeUnit': 'ms',
+                       'otherData': {'dropped_events': self.dropped}},
+                      trace_file)
+
+    @property
+    def size(self) -> int:
+        return min(self._recorded, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Number of events overwritten because the buffer was full."""
+        return max(0, self._recorded - self.capacity)
@@ -0,0 +1,108 @@
+"""Stable Baselines 3 interface of Sinergym vector environments."""
+
+from typing import Any, List, Optional, Sequence, Type, Union
+
+import gymnasium as gym
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import (VecEnvObs,
+                                                           VecEnvStepReturn)
+
+from sinergym.envs.vector_env import SinergymSubprocVectorEnv
+
+
+class SinergymVecEnv(VecEnv):
+    """SB3 VecEnv driving a SinergymSubprocVectorEnv. The vector environment must be created with same step autoreset
+       (final observation of finished sub-environments is returned as terminal_observation info).
+
+        :param vector_env: Sinergym vector environment.
+    """
+
+    def __init__(self, vector_env: SinergymSubprocVectorEnv):
+        """Constructor.
+
+        Args:
+            vector_env (SinergymSubprocVectorEnv): Sinergym vector environment (with SAME_STEP autoreset mode).
+        """
+        self.vector_env = vector_env
+        self.actions: Optional[np.ndarray] = None
+        super().__init__(
+            vector_env.num_envs,
+            vector_env.single_observation_space,
+            vector_env.single_action_space)
+
+    def reset(self) -> VecEnvObs:
+        obs, _ = self.vector_env.reset(seed=self._seeds)
+        self._reset_seeds()
+        self._reset_options()
+        return obs
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self.actions = actions
+
+    def step_wait(self) -> VecEnvStepReturn:
+        obs, rewards, terminated, truncated, infos = self.vector_env.step(
+            self.actions)
+        dones = np.logical_or(terminated, truncated)
+        env_infos = [{} for _ in range(self.num_envs)]
+        for key, values in infos.items():
+            if key.startswith('_') or key in ['final_obs', 'final_info']:
+                continue
+            for i in np.flatnonzero(infos['_' + key]):
+                env_infos[i][key] = values[i]
+        for i in np.flatnonzero(dones):
+            env_infos[i]['terminal_observation'] = infos['final_obs'][i]
+            env_infos[i]['TimeLimit.truncated'] = bool(
+                truncated[i] and not terminated[i])
+        return obs, rewards, dones, env_infos
+
+    def close(self) -> None:
+        self.vector_env.close()
+
+    def get_attr(self,
+                 attr_name: str,
+                 indices: Optional[Union[int,
+                                         Sequence[int]]] = None) -> List[Any]:
+        values = self.vector_env.get_attr(attr_name)
+        return [values[i] for i in self._get_indices(indices)]
+
+    def set_attr(self,
+                 attr_name: str,
+                 value: Any,
+                 indices: Optional[Union[int,
+                                         Sequence[int]]] = None) -> None:
+        # Attribute is set in all sub-environments
+        self.vector_env.call('set_wrapper_attr', attr_name, value)
+
+    def env_method(
+            self,
+            method_name: str,
+            *method_args: Any,
+            indices: Optional[Union[int, Sequence[int]]] = None,
+            **method_kwargs: Any) -> List[Any]:
+        # Method is called in all sub-environments
+        results = self.vector_env.call(
+            method_name, *method_args, **method_kwargs)
+        return [results[i] for i in self._get_indices(indices)]
+
+    def get_wrapper_attr(self, name: str) -> Any:
+        """Get an attribute of the Sinergym vector environment (e.g. workspace_path, its experiment directory) or, if
+           it does not have it, of the first sub-environment (like gym.Env.get_wrapper_attr).
+
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Any: Attribute value.
+        """
+        if hasattr(self.vector_env, name):
+            return getattr(self.vector_env, name)
+        return self.vector_env.get_attr(name)[0]
+
+    def env_is_wrapped(self,
+                       wrapper_class: Type[gym.Wrapper],
+                       indices: Optional[Union[int,
+                                               Sequence[int]]] = None) -> List[bool]:
+        # Wrapper chain of each sub-environment is checked in its worker
+        wrapped = self.vector_env.env_is_wrapped(wrapper_class)
+        return [wrapped[i] for i in self._get_indices(indices)]
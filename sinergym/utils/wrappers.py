@@ -3,6 +3,7 @@
 import csv
 import os
 import random
+import time
 from abc import ABC, abstractmethod
 from collections import deque
 from copy import deepcopy
@@ -21,6 +22,7 @@ from sinergym.utils.common import is_wrapped, ornstein_uhlenbeck_process
 from sinergym.utils.constants import LOG_WRAPPERS_LEVEL, YEAR
 from sinergym.utils.logger import LoggerStorage, TerminalLogger
 from sinergym.utils.rewards import EnergyCostLinearReward
+from sinergym.utils.timing import PhaseTimer, TraceRecorder
 
 # ---------------------------------------------------------------------------- #
 #                             Observation wrappers                             #
@@ -1379,7 +1381,8 @@ class LoggerWrapper(BaseLoggerWrapper):
                                 'length(timesteps)',
                                 'time_elapsed(hours)',
                                 'terminated',
-                                'truncated']
+                                'truncated',
+                                'timeout_truncated']
         self.logger.info('Wrapper initialized.')
 
     def calculate_custom_metrics(self,
@@ -1436,7 +1439,17 @@ class LoggerWrapper(BaseLoggerWrapper):
             'time_elapsed(hours)': self.data_logger.infos[-1]['time_elapsed(hours)'],
             'terminated': self.data_logger.terminateds[-1],
             'truncated': self.data_logger.truncateds[-1],
+            'timeout_truncated': self.get_wrapper_attr('timeout_truncated'),
         }
+
+        # Phases timing (if it is enabled)
+        for phase, phase_stats in self.get_wrapper_attr(
+                'timing_stats')().items():
+            data_summary['{}_mean(ms)'.format(
+                phase)] = phase_stats['mean'] * 1000
+            data_summary['{}_p99(ms)'.format(
+                phase)] = phase_stats['p99'] * 1000
+
         return data_summary
 
 
@@ -1603,6 +1616,75 @@ class CSVLogger(gym.Wrapper):
                 writer.writerow(list(episode_summary.values()))
 
 
+# ---------------------------------------------------------------------------- #
+
+class TimingWrapper(gym.Wrapper):
+
+    logger = TerminalLogger().getLogger(name='WRAPPER TimingWrapper',
+                                        level=LOG_WRAPPERS_LEVEL)
+
+    def __init__(self, env: Env):
+        """Wrapper to measure the step time of each wrapper layer, in addition to environment step and reset phases
+           (timing is enabled in the environment if it was not). It must be the last wrapper applied, only inner layers
+           are measured. Statistics are available with env.get_wrapper_attr('timing_stats')(). If tracing is enabled
+           in the environment, wrapper layers steps are recorded as trace events too.
+
+        Args:
+            env (Env): Original Sinergym environment (wrapped).
+        """
+        super(TimingWrapper, self).__init__(env)
+
+        timer = self.get_wrapper_attr('timer')
+        if timer is None:
+            timer = PhaseTimer(list(self.get_wrapper_attr('TIMING_PHASES')))
+            self.env.unwrapped.timer = timer
+        tracer = self.get_wrapper_attr('tracer')
+
+        # Instrument step method of each layer (from outer to inner)
+        layer = self.env
+        while isinstance(layer, gym.Wrapper):
+            phase_name = layer_name = 'wrapper:{}'.format(
+                type(layer).__name__)
+            repetition = 1
+            while phase_name in timer.index:
+                repetition += 1
+                phase_name = '{}#{}'.format(layer_name, repetition)
+            layer.step = self._timed_step(
+                layer.step, timer, timer.add_phase(phase_name), tracer,
+                phase_name)
+            layer = layer.env
+
+        self.logger.info('Wrapper initialized.')
+
+    @staticmethod
+    def _timed_step(step: Callable,
+                    timer: PhaseTimer,
+                    phase: int,
+                    tracer: Optional[TraceRecorder] = None,
+                    phase_name: str = '') -> Callable:
+        """Step method which records its duration (inner layers included) in the phases timer.
+
+        Args:
+            step (Callable): Original step method.
+            timer (PhaseTimer): Phases timer of the environment.
+            phase (int): Index of the layer phase.
+            tracer (Optional[TraceRecorder], optional): Trace events recorder of the environment, if tracing is enabled. Defaults to None.
+            phase_name (str, optional): Name of the layer phase (trace event name). Defaults to empty string.
+
+        Returns:
+            Callable: Timed step method.
+        """
+        def timed_step(action):
+            begin = time.perf_counter()
+            result = step(action)
+            end = time.perf_counter()
+            timer.record(phase, end - begin)
+            if tracer is not None:
+                tracer.complete(phase_name, 'wrapper', begin, end)
+            return result
+        return timed_step
+
+
 # ---------------------------------------------------------------------------- #
 
 class WandBLogger(gym.Wrapper):  # pragma: no cover
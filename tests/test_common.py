@@ -1,6 +1,7 @@
 import json
 
 import gymnasium as gym
+import numpy as np
 import pytest
 
 import sinergym.utils.common as common
@@ -31,6 +32,22 @@ def test_get_delta_seconds(
     assert delta_sec == expected
 
 
+def test_observation_view():
+    values = np.array([1.0, 2.5, 3.0])
+    view = common.ObservationView(
+        {'month': 0, 'air_temperature': 1, 'power': 2}, values)
+    assert len(view) == 3
+    assert list(view.keys()) == ['month', 'air_temperature', 'power']
+    assert view['air_temperature'] == 2.5
+    assert view.get('unknown') is None
+    assert dict(view) == {'month': 1.0, 'air_temperature': 2.5, 'power': 3.0}
+    # It is a view, changes in values are reflected
+    values[1] = 21.0
+    assert view['air_temperature'] == 21.0
+    with pytest.raises(TypeError):
+        view['air_temperature'] = 0.0
+
+
 def test_is_wrapped(
         env_5zone,
         env_all_wrappers):
@@ -1,15 +1,22 @@
+import asyncio
+import json
 import os
 from queue import Queue
 from random import sample
 
 import gymnasium as gym
+import numpy as np
 import pytest
 from gymnasium.spaces import Dict, Discrete
 
+from sinergym.envs.eplus_env import EplusEnv
+from sinergym.envs.vector_env import (SinergymSubprocVectorEnv,
+                                      SinergymThreadedVectorEnv)
+from sinergym.simulators import EnergyPlusProcess, SimulatorPool
 from sinergym.utils.constants import *
 from sinergym.utils.constants import DEFAULT_5ZONE_DISCRETE_FUNCTION
 from sinergym.utils.env_checker import check_env
-from sinergym.utils.wrappers import DiscretizeEnv
+from sinergym.utils.wrappers import DiscretizeEnv, NormalizeObservation
 
 
 @pytest.mark.parametrize('env_name',
@@ -94,6 +101,410 @@ def test_step(env_5zone):
     #     env.step(action)
 
 
+def test_observation_buffer(env_5zone):
+    obs, _ = env_5zone.reset()
+    buffer = env_5zone.energyplus_simulator.obs_buffer
+    # Observation returned is a float32 copy of simulator buffer
+    assert obs.dtype == np.float32
+    assert not np.shares_memory(obs, buffer)
+    assert np.allclose(obs, buffer.astype(np.float32))
+    obs, _, _, _, _ = env_5zone.step(env_5zone.action_space.sample())
+    # Buffer is reused (written in place) in each timestep
+    assert env_5zone.energyplus_simulator.obs_buffer is buffer
+    assert np.allclose(obs, buffer.astype(np.float32))
+    env_5zone.close()
+
+
+def test_action_repeat(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE):
+    env_kwargs = dict(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        config_params={'runperiod': (1, 1, 1991, 31, 1, 1991)})
+    # Unknown aggregation method or variable
+    with pytest.raises(AssertionError):
+        EplusEnv(action_repeat=4, observation_aggregation={
+                 'air_temperature': 'median'}, **env_kwargs)
+    with pytest.raises(AssertionError):
+        EplusEnv(action_repeat=4, observation_aggregation={
+                 'unknown_variable': 'mean'}, **env_kwargs)
+
+    # 4 timesteps per hour, agent decides every hour
+    env = EplusEnv(
+        action_repeat=4,
+        observation_aggregation={'HVAC_electricity_demand_rate': 'max'},
+        **env_kwargs)
+    assert env.timestep_per_episode == env.model.timestep_per_episode // 4
+    assert env.step_size == 3600
+    obs, info = env.reset()
+    simulator = env.energyplus_simulator
+    # Record simulator timestep values with the sample buffer
+    samples = []
+    aggregate = simulator._aggregate_sample
+
+    def _aggregate_sample():
+        samples.append(simulator._sample_buffer.copy())
+        aggregate()
+
+    simulator._aggregate_sample = _aggregate_sample
+    energy_index = env.observation_index['HVAC_electricity_demand_rate']
+    for _ in range(3):
+        last_elapsed = info['time_elapsed(hours)']
+        obs, reward, _, _, info = env.step(env.action_space.sample())
+        assert info['time_elapsed(hours)'] - last_elapsed == pytest.approx(1.0)
+        interval = np.array(samples[-4:])
+        # Aggregated values (max and last) are observed by agent and reward
+        assert obs[energy_index] == pytest.approx(
+            interval[:, energy_index].max())
+        assert obs[0] == interval[-1, 0]
+        assert simulator.obs_buffer[energy_index] == interval[:,
+                                                              energy_index].max()
+    assert len(samples) == 12
+    env.close()
+
+
+def test_data_available_ram_workspace(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE,
+        tmp_path):
+    env = EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        config_params={'ram_workspace': {'path': str(tmp_path)}})
+    env.reset()
+    # data_available.txt is written in experiment directory, not in RAM
+    # workspace
+    assert os.path.isfile(
+        os.path.join(env.workspace_path, 'data_available.txt'))
+    assert not os.path.isfile(
+        os.path.join(env.model.episode_workspace_path, 'data_available.txt'))
+    env.close()
+
+
+def test_prefetch(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE):
+    env = EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        config_params={'runperiod': (1, 1, 1991, 2, 1, 1991)},
+        prefetch_threshold=0.5)
+    env.reset()
+    episode_path = env.episode_path
+    prefetch_simulator = env.prefetch_simulator
+    assert not prefetch_simulator.is_running
+    for _ in range(env.timestep_per_episode // 2):
+        env.step(env.action_space.sample())
+    # Next episode is running in background, current episode context is kept
+    assert prefetch_simulator.is_running
+    assert env.episode_path == episode_path
+    assert env.energyplus_simulator.is_running
+    # Reset swaps prefetched simulator in
+    obs, info = env.reset()
+    assert env.energyplus_simulator is prefetch_simulator
+    # Only cold starts are recorded in reset latency
+    assert env.reset_latency.count == 1
+    assert not env.prefetch_simulator.is_running
+    assert env.episode_path != episode_path
+    assert os.path.isfile(env.building_path)
+    assert env.observation_space.contains(obs)
+    env.step(env.action_space.sample())
+    # Specific reset options discard prefetch
+    episode_id = int(env.episode_path.split('-sub_run')[-1])
+    for _ in range(env.timestep_per_episode // 2):
+        env.step(env.action_space.sample())
+    assert env.prefetch_simulator.is_running
+    env.reset(options={})
+    assert env.energyplus_simulator is prefetch_simulator
+    assert not env.prefetch_simulator.is_running
+    # Discarded episode directory is removed (numbering is not advanced)
+    assert int(env.episode_path.split('-sub_run')[-1]) == episode_id + 1
+    env.close()
+    assert not env.energyplus_simulator.is_running
+
+
+def test_prefetch_seed(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE):
+    # A seeded reset gives the same episode (weather file and noise) with and
+    # without prefetch (prefetched episode is drawn before the seed is known)
+    episodes = []
+    for prefetch_threshold in [None, 0.5]:
+        env = EplusEnv(
+            building_file='5ZoneAutoDXVAV.epJSON',
+            weather_files=[
+                'USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+                'USA_AZ_Davis-Monthan.AFB.722745_TMY3.epw'],
+            action_space=ACTION_SPACE_5ZONE,
+            time_variables=TIME_VARIABLES,
+            variables=VARIABLES_5ZONE,
+            meters=METERS_5ZONE,
+            actuators=ACTUATORS_5ZONE,
+            weather_variability={'Dry Bulb Temperature': (1.0, 0.0, 0.001)},
+            reward_kwargs={
+                'temperature_variables': ['air_temperature'],
+                'energy_variables': ['HVAC_electricity_demand_rate'],
+                'range_comfort_winter': (20.0, 23.5),
+                'range_comfort_summer': (23.0, 26.0)},
+            env_name='TESTGYM',
+            config_params={'runperiod': (1, 1, 1991, 2, 1, 1991)},
+            prefetch_threshold=prefetch_threshold)
+        env.reset()
+        for _ in range(env.timestep_per_episode // 2):
+            env.step(env.action_space.sample())
+        obs, _ = env.reset(seed=0)
+        weather_file = os.path.basename(env.weather_path)
+        with open(env.episode_path + '/' + weather_file[:-4] + '_OU_Noise.epw') as weather_f:
+            weather = weather_f.read()
+        episodes.append((weather_file, weather, obs))
+        env.close()
+    without_prefetch, with_prefetch = episodes
+    assert without_prefetch[0] == with_prefetch[0]
+    assert without_prefetch[1] == with_prefetch[1]
+    assert np.array_equal(without_prefetch[2], with_prefetch[2])
+
+
+def test_simulator_pool(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE):
+    pool = SimulatorPool(max_size=2)
+    envs = [EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name=env_name,
+        config_params={'runperiod': (1, 1, 1991, 2, 1, 1991)},
+        simulator_pool=pool) for env_name in ['TESTGYM', 'TESTGYMEVAL']]
+    train_env, eval_env = envs
+    # First reset is a miss, pool is refilled for next reset (in background,
+    # after reset returns)
+    train_env.reset()
+    assert pool.stats['misses'] == 1
+    assert train_env._refill_thread is not None
+    train_env._join_refill()
+    assert pool.size == 1
+    train_env.step(train_env.action_space.sample())
+    # Other environment with the same simulation borrows it
+    simulator = pool._entries[next(iter(pool._entries))][1]
+    obs, _ = eval_env.reset()
+    assert eval_env.energyplus_simulator is simulator
+    assert pool.stats['hits'] == 1
+    assert eval_env.reset_latency.count == 0
+    assert eval_env.observation_space.contains(obs)
+    assert os.path.dirname(eval_env.episode_path) == eval_env.workspace_path
+    eval_env.step(eval_env.action_space.sample())
+    train_env.reset()
+    for env in envs:
+        env._join_refill()
+    assert pool.stats['hits'] == 2 and pool.size == 2
+    for env in envs:
+        env.close()
+    pool.clear()
+    assert pool.size == 0
+
+
+def test_simulator_pool_rotation(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE):
+    pool = SimulatorPool(max_size=4)
+    # Two weather files (two pool keys) and two episode directories stored
+    env = EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files=[
+            'USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+            'USA_AZ_Davis-Monthan.AFB.722745_TMY3.epw'],
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        config_params={'runperiod': (1, 1, 1991, 2, 1, 1991)},
+        max_ep_data_store_num=2,
+        simulator_pool=pool)
+    env.reset(seed=0)
+    for _ in range(8):
+        env.step(env.action_space.sample())
+        env.reset()
+        env._join_refill()
+        # Directories of running and parked simulators are not rotated
+        assert os.path.isdir(env.episode_path)
+        for _, _, context, _ in pool._entries.values():
+            assert os.path.isdir(context['episode_path'])
+    assert pool.stats['hits'] >= 6
+    env.close()
+    pool.clear()
+    assert env.model.protected_episode_paths == set()
+
+
+@pytest.mark.parametrize('progress', ['throttled', 'structured', 'off'])
+def test_progress(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE,
+        progress):
+    env = EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        config_params={'runperiod': (1, 1, 1991, 2, 1, 1991)},
+        progress=progress)
+    env.reset()
+    assert env.progress.episode == 1
+    truncated = False
+    while not truncated:
+        _, _, _, truncated, _ = env.step(env.action_space.sample())
+    progress_counter = env.progress.as_dict()
+    if progress == 'off':
+        # Progress callback is not registered
+        assert progress_counter['percent'] == 0
+        assert progress_counter['sim_time_ratio'] is None
+    else:
+        assert progress_counter['percent'] > 0
+        assert progress_counter['sim_time_ratio'] > 0
+    # Structured mode does not draw progress bars
+    assert (env.energyplus_simulator.progress_bar is None) == (
+        progress != 'throttled')
+    env.close()
+
+    env.energyplus_simulator.progress_mode = 'silent'
+    with pytest.raises(AssertionError):
+        env._check_eplus_env()
+
+
+@pytest.mark.parametrize('episode_split', [10, 'monthly'])
+def test_episode_split(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE,
+        episode_split):
+    env = EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        max_ep_data_store_num=1,
+        config_params={'runperiod': (31, 1, 1991, 1, 2, 1991)},
+        episode_split=episode_split)
+    _, info = env.reset()
+    simulator = env.energyplus_simulator
+    first_episode_path = env.episode_path
+    truncated = False
+    while not truncated:
+        obs, _, _, truncated, info = env.step(env.action_space.sample())
+    if episode_split == 'monthly':
+        assert info['month'] == 2
+    else:
+        assert env.timestep == episode_split
+    # Simulation continues in next episode
+    next_obs, next_info = env.reset()
+    assert env.episode == 2 and env.timestep == 0
+    assert env.energyplus_simulator is simulator and simulator.is_running
+    assert (next_obs == obs).all()
+    assert next_info['month'] == info['month']
+    assert env.episode_path != first_episode_path
+    # Simulation output directory is not rotated while it is running
+    assert os.path.isdir(first_episode_path)
+    env.step(env.action_space.sample())
+    # Reset options restart the simulation
+    env.reset(options={})
+    assert not os.path.isdir(first_episode_path)
+    env.close()
+
+    env.episode_split = 'yearly'
+    with pytest.raises(AssertionError):
+        env._check_eplus_env()
+
+
 def test_close(env_5zone):
     env_5zone.reset()
     assert env_5zone.is_running
@@ -101,6 +512,303 @@ def test_close(env_5zone):
     assert not env_5zone.is_running
 
 
+def test_reset_aborts_simulation(env_5zone):
+    # Truncated episodes must abort EnergyPlus at the next timestep, instead
+    # of simulating the rest of the run period
+    for n_steps in [1, 4000]:
+        env_5zone.reset()
+        for _ in range(n_steps):
+            env_5zone.step(env_5zone.action_space.sample())
+        simulator = env_5zone.energyplus_simulator
+        thread = simulator.energyplus_thread
+        env_5zone.close()
+        assert not thread.is_alive()
+        assert simulator.progress.percent < 100
+
+
+def test_timeouts(env_5zone):
+    # Reset waits indefinitely by default (adaptive reset timeout is opt-in)
+    assert env_5zone.reset_timeout is None
+    assert env_5zone._get_timeout(
+        env_5zone.reset_timeout, env_5zone.reset_latency) is None
+    # Adaptive timeouts use initial values until latencies are measured
+    assert env_5zone._get_timeout(
+        'adaptive',
+        env_5zone.step_latency) == env_5zone.step_latency.initial_timeout
+    env_5zone.reset()
+    assert env_5zone.reset_latency.count == 1
+    for _ in range(env_5zone.step_latency.warmup_samples):
+        env_5zone.step(env_5zone.action_space.sample())
+    # Timeout derived from measured latency
+    assert env_5zone.step_latency.count == env_5zone.step_latency.warmup_samples
+    assert env_5zone.step_latency.timeout == env_5zone.step_latency.min_timeout
+
+    # A stalled simulator truncates the episode by timeout
+    def stalled_simulator(timeout=None):
+        raise TimeoutError
+
+    env_5zone.step_timeout = 0.5
+    env_5zone.energyplus_simulator.channel.get_observation = stalled_simulator
+    _, _, terminated, truncated, _ = env_5zone.step(
+        env_5zone.action_space.sample())
+    assert truncated and not terminated
+    assert env_5zone.timeout_truncated and env_5zone.timeout_truncations == 1
+    # Next steps do not wait for the simulator
+    _, _, _, truncated, _ = env_5zone.step(env_5zone.action_space.sample())
+    assert truncated and env_5zone.timeout_truncations == 1
+    del env_5zone.energyplus_simulator.channel.get_observation
+    env_5zone.reset()
+    assert not env_5zone.timeout_truncated
+    env_5zone.close()
+
+
+def test_trace(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE):
+    env = EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        trace=True,
+        trace_buffer_size=50)
+    env.reset()
+    episode_dir = env.episode_dir
+    for _ in range(20):
+        env.step(env.action_space.sample())
+    # Oldest events are dropped when the ring buffer is full
+    assert env.tracer.size == 50
+    assert env.tracer.dropped > 0
+    env.reset()
+    # Trace of previous episode written and buffer cleared
+    with open(episode_dir + '/monitor/trace.json', 'r') as trace_file:
+        trace = json.load(trace_file)
+    assert trace['otherData']['dropped_events'] > 0
+    events = trace['traceEvents']
+    names = {event['name'] for event in events}
+    assert {'thread_name', 'step', 'simulator_wait',
+            'callback_observation', 'callback_action', 'action_wait'} <= names
+    # Agent and EnergyPlus threads in their own tracks
+    threads = {event['args']['name']
+               for event in events if event['ph'] == 'M'}
+    assert 'MainThread' in threads and 'TESTGYM' in threads
+    # New episode: reset preparation and warmup events
+    names = {event[0] for event in env.tracer._events if event is not None}
+    assert {'set_episode_working_dir', 'adapt_building_to_epw',
+            'save_building_model', 'apply_weather_variability',
+            'simulator_start', 'warmup', 'reset_wait', 'reset'} <= names
+    env.close()
+
+
+def test_async_step(env_demo):
+    async def run_steps():
+        obs, info = await env_demo.async_reset(seed=0)
+        assert len(obs) == env_demo.observation_space.shape[0]
+        assert info['timestep'] == 0
+        old_time_elapsed = info['time_elapsed(hours)']
+        for timestep in [1, 2]:
+            obs, reward, terminated, truncated, info = await env_demo.async_step(
+                env_demo.action_space.sample())
+            assert len(obs) == env_demo.observation_space.shape[0]
+            assert not terminated and not truncated
+            assert info['timestep'] == timestep
+            assert info['time_elapsed(hours)'] > old_time_elapsed
+            old_time_elapsed = info['time_elapsed(hours)']
+
+    asyncio.run(run_steps())
+    # Blocking interface continues the same episode
+    _, _, _, _, info = env_demo.step(env_demo.action_space.sample())
+    assert info['timestep'] == 3
+
+    # Several environments multiplexed in the same loop until end of episode
+    envs = [gym.make('Eplus-demo-v1', config_params={'runperiod': (
+        1, 1, 1991, 1, 1, 1991)}).unwrapped for _ in range(2)]
+
+    async def run_episode(env):
+        await env.async_reset()
+        truncated = False
+        while not truncated:
+            _, _, _, truncated, info = await env.async_step(env.action_space.sample())
+        return info['timestep']
+
+    async def run_episodes():
+        return await asyncio.gather(*[run_episode(env) for env in envs])
+
+    timesteps = asyncio.run(run_episodes())
+    assert timesteps[0] == timesteps[1] >= envs[0].timestep_per_episode
+    for env in envs:
+        env.close()
+
+
+def test_process_backend(
+        ACTION_SPACE_5ZONE,
+        TIME_VARIABLES,
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE):
+    env = EplusEnv(
+        building_file='5ZoneAutoDXVAV.epJSON',
+        weather_files='USA_PA_Pittsburgh-Allegheny.County.AP.725205_TMY3.epw',
+        action_space=ACTION_SPACE_5ZONE,
+        time_variables=TIME_VARIABLES,
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        reward_kwargs={
+            'temperature_variables': ['air_temperature'],
+            'energy_variables': ['HVAC_electricity_demand_rate'],
+            'range_comfort_winter': (20.0, 23.5),
+            'range_comfort_summer': (23.0, 26.0)},
+        env_name='TESTGYM',
+        simulator_backend='process')
+    assert isinstance(env.energyplus_simulator, EnergyPlusProcess)
+    obs, info = env.reset()
+    process = env.energyplus_simulator.process
+    assert process.is_alive() and process.pid != os.getpid()
+    assert env.energyplus_simulator.energyplus_state == process.pid
+    assert obs.shape == env.observation_space.shape
+    for i in range(5):
+        obs, reward, terminated, truncated, info = env.step(
+            env.action_space.sample())
+        assert not truncated
+        assert info['timestep'] == i + 1
+        assert isinstance(info['month'], int)
+    # Same process is reused in next episode
+    env.reset()
+    assert env.energyplus_simulator.process is process
+
+    # A crash of EnergyPlus process does not finish this process
+    process.kill()
+    env.energyplus_simulator._watcher.join()
+    with pytest.raises(AssertionError):
+        env.step(env.action_space.sample())
+    assert env.energyplus_simulator.failed()
+    # A new process is started in next reset
+    env.reset()
+    assert env.energyplus_simulator.process is not process
+    assert not env.energyplus_simulator.failed()
+    env.step(env.action_space.sample())
+
+    # Simulators evicted from a full pool (or cleared) finish their process
+    pool = SimulatorPool(max_size=1)
+    simulators = [env._make_simulator() for _ in range(2)]
+    for simulator in simulators:
+        context = env._start_in_background(simulator, env.default_options)
+        pool.release('key', simulator, context, model=env.model)
+    assert simulators[0].process is None
+    assert simulators[1].process.is_alive()
+    pool.clear()
+    assert simulators[1].process is None
+
+    env.close()
+    assert env.energyplus_simulator.process is None
+
+
+def test_threaded_vector_env():
+    num_envs = 3
+
+    def make_env():
+        return gym.make('Eplus-demo-v1',
+                        config_params={'runperiod': (1, 1, 1991, 1, 1, 1991)})
+
+    envs = SinergymThreadedVectorEnv([make_env] * num_envs)
+    obs_dim = envs.single_observation_space.shape[0]
+    assert envs.observation_space.shape == (num_envs, obs_dim)
+    assert envs.action_space.shape == (num_envs,) + \
+        envs.single_action_space.shape
+
+    obs, infos = envs.reset(seed=0)
+    assert obs.shape == (num_envs, obs_dim) and obs.dtype == np.float32
+    assert list(infos['timestep']) == [0] * num_envs
+    # Each environment has its own simulation (and workspace)
+    assert len(set(envs.get_attr('workspace_path'))) == num_envs
+    assert envs.env_is_wrapped(DiscretizeEnv) == (False,) * num_envs
+
+    truncated = np.zeros(num_envs, dtype=bool)
+    steps = 0
+    while not truncated.all():
+        obs, rewards, terminated, truncated, infos = envs.step(
+            envs.action_space.sample())
+        steps += 1
+        assert obs.shape == (num_envs, obs_dim)
+        assert rewards.shape == (num_envs,) and not terminated.any()
+        assert list(infos['timestep']) == [steps] * num_envs
+    # Next step resets finished environments (next step autoreset)
+    obs, rewards, terminated, truncated, infos = envs.step(
+        envs.action_space.sample())
+    assert list(infos['timestep']) == [0] * num_envs
+    assert (rewards == 0).all()
+    assert envs.get_attr('episode') == (2,) * num_envs
+
+    # Preallocated observation buffer is returned without copy
+    envs.copy = False
+    obs, _, _, _, _ = envs.step(envs.action_space.sample())
+    assert obs is envs._observations
+    envs.close()
+
+
+def test_subproc_vector_env():
+    num_envs = 2
+    envs = SinergymSubprocVectorEnv(
+        'Eplus-demo-v1',
+        num_envs,
+        env_kwargs={'config_params': {'runperiod': (1, 1, 1991, 1, 1, 1991)}})
+    obs_dim = envs.single_observation_space.shape[0]
+    assert envs.observation_space.shape == (num_envs, obs_dim)
+    # Deterministic workspace of each sub-environment
+    assert list(envs.get_attr('workspace_path')) == [os.path.join(
+        envs.workspace_path, 'worker-{}'.format(i)) for i in range(num_envs)]
+
+    obs, infos = envs.reset(seed=0)
+    assert obs.shape == (num_envs, obs_dim) and obs.dtype == np.float32
+    assert list(infos['timestep']) == [0] * num_envs
+
+    actions = envs.action_space.sample()
+    obs, rewards, terminated, truncated, infos = envs.step(actions)
+    assert rewards.shape == (num_envs,) and not terminated.any()
+    assert list(infos['timestep']) == [1] * num_envs
+    # Observations are read from the shared array
+    envs.copy = False
+    obs, _, _, _, _ = envs.step(actions)
+    assert obs is envs._observations
+    assert envs.get_attr('timestep') == (2,) * num_envs
+    envs.close()
+
+    # Without infos, only shared arrays are returned
+    envs = SinergymSubprocVectorEnv(
+        'Eplus-demo-v1',
+        num_envs,
+        env_kwargs={'config_params': {'runperiod': (1, 1, 1991, 1, 1, 1991)}},
+        wrappers=lambda env: NormalizeObservation(env),
+        infos=False)
+    # Wrapper chain is checked in each worker
+    assert envs.env_is_wrapped(NormalizeObservation) == (True,) * num_envs
+    assert envs.env_is_wrapped(DiscretizeEnv) == (False,) * num_envs
+    _, infos = envs.reset(seed=0)
+    assert infos == {}
+    _, _, _, _, infos = envs.step(envs.action_space.sample())
+    assert infos == {}
+    envs.close()
+
+    # workspace_path is set by the vector environment
+    with pytest.raises(AssertionError):
+        SinergymSubprocVectorEnv(
+            'Eplus-demo-v1', num_envs, env_kwargs={
+                'workspace_path': 'Eplus-env-TEST'})
+
+
 def test_render(env_5zone):
     env_5zone.render()
 
@@ -157,6 +865,9 @@ def test_step_in_completed_episode(env_demo):
     # Terminated should be false, and truncated true
     assert not terminated
     assert truncated
+    # End of simulation is signalled explicitly (not detected by a timeout)
+    assert env_demo.energyplus_simulator.simulation_complete
+    assert not env_demo.timeout_truncated
 
     # Trying to step in a completed episode
     for _ in range(2):
@@ -1,9 +1,12 @@
 import json
 import os
 
+import numpy as np
 import pytest
 from epw.weather import Weather
 
+from sinergym.config.modeling import ModelJSON
+from sinergym.config.sizing import SizingCache
 from sinergym.utils.constants import WEEKDAY_ENCODING
 
 # ---------------------------------------------------------------------------- #
@@ -111,6 +114,17 @@ def test_adapt_building_to_meters(model_5zone, building_5zone):
         assert output_meter['key_name'] in original_meter_names
 
 
+def test_adapt_building_to_request_variables(model_5zone):
+    assert len(model_5zone.building['Output:Variable']) > 0
+    assert len(model_5zone.building['Output:Meter']) > 0
+    # Variables requested through API, they are not reported in output files
+    model_5zone.config['request_variables'] = True
+    model_5zone.adapt_building_to_variables()
+    model_5zone.adapt_building_to_meters()
+    assert 'Output:Variable' not in model_5zone.building
+    assert 'Output:Meter' not in model_5zone.building
+
+
 def test_adapt_building_to_config(model_5zone, building_5zone):
     # Check default config
     assert list(building_5zone['Timestep'].values())[
@@ -128,6 +142,29 @@ def test_adapt_building_to_config(model_5zone, building_5zone):
         assert config_runperiod[i] == runperiod[key]
 
 
+def test_adapt_building_to_lean_output(model_5zone, building_5zone):
+    # Report objects in default building model
+    assert 'Output:Table:SummaryReports' in model_5zone.building
+    assert 'OutputControl:Table:Style' in model_5zone.building
+    model_5zone.config['lean_output'] = True
+    model_5zone.adapt_building_to_config()
+    for obj_type in ['Output:Table:SummaryReports',
+                     'OutputControl:Table:Style',
+                     'Output:VariableDictionary',
+                     'Output:Surfaces:Drawing']:
+        assert obj_type in building_5zone
+        assert obj_type not in model_5zone.building
+    # Variables and meters required by simulator are kept
+    assert len(model_5zone.building['Output:Variable']) == len(
+        model_5zone._variables)
+    assert len(model_5zone.building['Output:Meter']) == len(
+        model_5zone._meters)
+    output_files = model_5zone.building['OutputControl:Files']['OutputControl:Files 1']
+    assert output_files['output_eso'] == 'No'
+    assert output_files['output_sqlite'] == 'No'
+    assert 'output_eio' not in output_files
+
+
 def test_save_building_model(model_5zone):
     assert model_5zone.episode_path is None
     # Create episode path before save (else a exception will happen)
@@ -145,6 +182,114 @@ def test_save_building_model(model_5zone):
     with pytest.raises(RuntimeError):
         model_5zone.save_building_model()
 
+
+def test_sizing_cache(tmp_path):
+    cache = SizingCache(path=str(tmp_path / 'sizing'))
+    building = {
+        'SimulationControl': {
+            'SimulationControl 1': {
+                'do_zone_sizing_calculation': 'Yes',
+                'do_system_sizing_calculation': 'Yes'}},
+        'AirTerminal:SingleDuct:VAV:Reheat': {
+            'SPACE1-1 VAV Reheat': {
+                'maximum_air_flow_rate': 'Autosize',
+                'maximum_hot_water_or_steam_flow_rate': 'autosize',
+                'zone_minimum_air_flow_input_method': 'Constant'}},
+        'Coil:Heating:Water': {
+            'SPACE1-1 Zone Coil': {
+                'u_factor_times_area_value': 'Autocalculate'}}}
+    eio_path = str(tmp_path / 'eplusout.eio')
+    with open(eio_path, 'w') as eio_f:
+        eio_f.write(
+            '! <Component Sizing Information>, Component Type, Component Name, Input Field Description, Value\n'
+            ' Component Sizing Information, AirTerminal:SingleDuct:VAV:Reheat, SPACE1-1 VAV REHEAT, Design Size Maximum Air Flow Rate [m3/s], 0.22\n'
+            ' Component Sizing Information, AirTerminal:SingleDuct:VAV:Reheat, SPACE1-1 VAV REHEAT, User-Specified Maximum Air Flow Rate [m3/s], 0.3\n')
+
+    key = cache.get_key(building, '/path/to/weather.epw')
+    # Key depends on building model and weather file
+    assert key == cache.get_key(building, 'weather.epw')
+    assert key != cache.get_key(building, 'other_weather.epw')
+    assert not cache.contains(key) and cache.get(key) is None
+
+    # eio file without sizing results (partial output): nothing captured
+    empty_eio_path = str(tmp_path / 'empty.eio')
+    with open(empty_eio_path, 'w') as eio_f:
+        eio_f.write('Program Version,EnergyPlus, Version 24.1.0\n')
+    assert not cache.capture(key, building, empty_eio_path)
+    assert not cache.contains(key)
+
+    # Unresolved autosized fields: building keeps sizing calculations
+    assert not cache.capture(key, building, eio_path)
+    assert cache.contains(key) and cache.get(key) is None
+
+    # All autosized fields resolved: hard-sized building model
+    with open(eio_path, 'a') as eio_f:
+        eio_f.write(
+            ' Component Sizing Information, AirTerminal:SingleDuct:VAV:Reheat, SPACE1-1 VAV REHEAT, Design Size Maximum Hot Water or Steam Flow Rate [m3/s], 1.5E-004\n')
+    # Autocalculated field still unresolved
+    cache.clear()
+    assert not cache.capture(key, building, eio_path)
+    assert cache.get(key) is None
+
+    # All autosized and autocalculated fields resolved
+    with open(eio_path, 'a') as eio_f:
+        eio_f.write(
+            ' Component Sizing Information, Coil:Heating:Water, SPACE1-1 ZONE COIL, Design Size U-Factor Times Area Value [W/K], 66.3\n')
+    cache.clear()
+    assert not cache.contains(key)
+    assert cache.capture(key, building, eio_path)
+    sized_building = cache.get(key)
+    terminal = sized_building['AirTerminal:SingleDuct:VAV:Reheat']['SPACE1-1 VAV Reheat']
+    assert terminal['maximum_air_flow_rate'] == 0.22
+    assert terminal['maximum_hot_water_or_steam_flow_rate'] == 1.5e-4
+    assert terminal['zone_minimum_air_flow_input_method'] == 'Constant'
+    assert sized_building['Coil:Heating:Water']['SPACE1-1 Zone Coil']['u_factor_times_area_value'] == 66.3
+    assert all(value == 'No' for value in sized_building['SimulationControl']
+               ['SimulationControl 1'].values())
+    # Original building model is not modified
+    assert building['AirTerminal:SingleDuct:VAV:Reheat']['SPACE1-1 VAV Reheat']['maximum_air_flow_rate'] == 'Autosize'
+
+    # Design data read during the run (EMS): building keeps sizing calculations
+    building['EnergyManagementSystem:InternalVariable'] = {
+        'Coil UA': {
+            'internal_data_index_key_name': 'SPACE1-1 Zone Coil',
+            'internal_data_type': 'Heating Coil Design UA'}}
+    key = cache.get_key(building, 'weather.epw')
+    assert not cache.capture(key, building, eio_path)
+    assert cache.contains(key) and cache.get(key) is None
+
+
+def test_save_building_model_sizing_cache(model_5zone, tmp_path):
+    # Sizing cache disabled by default
+    assert model_5zone.sizing_cache is None
+    model_5zone.sizing_cache = SizingCache(path=str(tmp_path))
+    model_5zone.set_episode_working_dir()
+    path_save = model_5zone.save_building_model()
+    # Sizing capture pending until simulation ends
+    assert path_save in model_5zone._pending_sizing
+    key = model_5zone._pending_sizing[path_save]
+    # Hard-sized building model is used when it is cached
+    with open(os.path.join(str(tmp_path), key + '.epJSON'), 'w') as outfile:
+        json.dump(
+            {'Version': {'Version 1': {'version_identifier': 'hard-sized'}}}, outfile)
+    model_5zone.set_episode_working_dir()
+    path_save = model_5zone.save_building_model()
+    with open(path_save) as json_f:
+        version = json.load(json_f)['Version']['Version 1']
+    assert version['version_identifier'] == 'hard-sized'
+    assert path_save not in model_5zone._pending_sizing
+
+    # Sizing results of a simulation not completed are not captured
+    model_5zone.set_episode_working_dir()
+    model_5zone.sizing_cache.clear()
+    path_save = model_5zone.save_building_model()
+    key = model_5zone._pending_sizing[path_save]
+    model_5zone.capture_sizing(
+        path_save, model_5zone.episode_path, completed=False)
+    assert path_save not in model_5zone._pending_sizing
+    assert not model_5zone.sizing_cache.contains(key)
+
+
 # ---------------------------------------------------------------------------- #
 #                        EPW and Weather Data management                       #
 # ---------------------------------------------------------------------------- #
@@ -175,6 +320,39 @@ def test_check_model_wrong_config(model_5zone_several_weathers):
             model_5zone_several_weathers._check_eplus_config()
         model_5zone_several_weathers.config['runperiod'] = (
             1, 2, 1993, 2, 3, 1993)
+    model_5zone_several_weathers.config['always_write_actuators'] = [
+        'Unknown_actuator']
+    with pytest.raises(AssertionError):
+        model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['always_write_actuators'] = True
+    model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['sizing_cache'] = 10
+    with pytest.raises(AssertionError):
+        model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['sizing_cache'] = False
+    model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['handle_cache'] = ['/tmp']
+    with pytest.raises(AssertionError):
+        model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['handle_cache'] = False
+    model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['step_timeout'] = -1
+    with pytest.raises(AssertionError):
+        model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['step_timeout'] = 'adaptive'
+    model_5zone_several_weathers.config['reset_timeout'] = None
+    model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['ram_workspace'] = {
+        'persist': 'episodes'}
+    with pytest.raises(AssertionError):
+        model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['ram_workspace'] = {
+        'persist_on': 'never'}
+    with pytest.raises(AssertionError):
+        model_5zone_several_weathers._check_eplus_config()
+    model_5zone_several_weathers.config['ram_workspace'] = {
+        'persist': 'all', 'persist_on': 'close'}
+    model_5zone_several_weathers._check_eplus_config()
     model_5zone_several_weathers.config['Unknown_option'] = 100
     # It will be ignored by sinergym
     model_5zone_several_weathers._check_eplus_config()
@@ -187,6 +365,17 @@ def test_update_weather_path(model_5zone_several_weathers):
     assert model_5zone_several_weathers._weather_path is not None
     model_5zone_several_weathers.update_weather_path()
     assert model_5zone_several_weathers._weather_path is not None
+    # Weather choice with a seeded generator is reproducible
+    weather_paths = []
+    for _ in range(2):
+        np_random = np.random.default_rng(0)
+        paths = []
+        for _ in range(5):
+            model_5zone_several_weathers.update_weather_path(
+                np_random=np_random)
+            paths.append(model_5zone_several_weathers._weather_path)
+        weather_paths.append(paths)
+    assert weather_paths[0] == weather_paths[1]
 
 
 def test_apply_weather_variability(model_5zone):
@@ -229,6 +418,16 @@ def test_apply_weather_variability(model_5zone):
             noise.dataframe['Relative Humidity']).all()
     assert (original.dataframe['Wind Direction'] ==
             noise.dataframe['Wind Direction']).all()
+    # Noise with seeded generators is reproducible
+    noises = []
+    for _ in range(2):
+        path_result = model_5zone.apply_weather_variability(
+            weather_variability=weather_variability,
+            np_random=np.random.default_rng(0))
+        noise = Weather()
+        noise.read(path_result)
+        noises.append(noise.dataframe['Dry Bulb Temperature'])
+    assert (noises[0] == noises[1]).all()
 
 # ---------------------------------------------------------------------------- #
 #                          Schedulers info extraction                          #
@@ -293,6 +492,63 @@ def test_set_episode_working_dir(model_5zone):
         model_5zone.set_episode_working_dir()
 
 
+@pytest.mark.parametrize('persist,persist_on',
+                         [('none', 'episode_end'),
+                          ('monitor', 'episode_end'),
+                          ('all', 'close'),
+                          ])
+def test_ram_workspace(
+        VARIABLES_5ZONE,
+        METERS_5ZONE,
+        ACTUATORS_5ZONE,
+        tmp_path,
+        persist,
+        persist_on):
+    model = ModelJSON(
+        env_name='TESTCONFIG',
+        json_file='5ZoneAutoDXVAV.epJSON',
+        weather_files=['USA_AZ_Davis-Monthan.AFB.722745_TMY3.epw'],
+        variables=VARIABLES_5ZONE,
+        meters=METERS_5ZONE,
+        actuators=ACTUATORS_5ZONE,
+        max_ep_store=2,
+        extra_config={
+            'ram_workspace': {
+                'path': str(tmp_path),
+                'persist': persist,
+                'persist_on': persist_on}})
+    # Episode directories are created in RAM workspace path
+    assert model.episode_workspace_path.startswith(str(tmp_path))
+    assert model.episode_workspace_path != model.experiment_path
+    episode_path = model.set_episode_working_dir()
+    assert os.path.dirname(episode_path) == model.episode_workspace_path
+    os.makedirs(episode_path + '/monitor')
+    open(episode_path + '/monitor/rewards.csv', 'w').close()
+    open(episode_path + '/model.epJSON', 'w').close()
+
+    persistent_path = os.path.join(
+        model.experiment_path,
+        os.path.basename(episode_path))
+    model.persist_episode()
+    assert os.path.isfile(
+        persistent_path + '/monitor/rewards.csv') == (persist != 'none')
+    assert os.path.isfile(
+        persistent_path + '/model.epJSON') == (persist == 'all')
+
+    # Persisted copies follow max_ep_store too
+    for _ in range(2):
+        model.set_episode_working_dir()
+    assert not os.path.isdir(episode_path)
+    assert not os.path.isdir(persistent_path)
+
+    # Close persists pending episodes and frees RAM workspace
+    model.close_workspace()
+    assert not os.path.isdir(model.episode_workspace_path)
+    assert os.path.isdir(os.path.join(
+        model.experiment_path,
+        os.path.basename(model.episode_path))) == (persist == 'all')
+
+
 def test_set_experiment_working_dir(model_5zone):
     # Check current config experiment working dir and if exists
     current_experiment_path = model_5zone.experiment_path
@@ -328,3 +584,17 @@ def test_rm_past_history_dir(model_5zone):
     n_dir = len([i for i in os.listdir(model_5zone.experiment_path)
                 if os.path.isdir(os.path.join(model_5zone.experiment_path, i))])
     assert n_dir == 10
+
+
+def test_discard_episode_dir(model_5zone):
+    for _ in range(12):
+        model_5zone.set_episode_working_dir()
+    # Episode directory prepared in advance and not used
+    discarded_path = model_5zone.set_episode_working_dir()
+    model_5zone.discard_episode_dir(discarded_path)
+    assert not os.path.isdir(discarded_path)
+    # Next episode takes its number (rotation of the same directory again)
+    assert model_5zone.set_episode_working_dir() == discarded_path
+    n_dir = len([i for i in os.listdir(model_5zone.experiment_path)
+                if os.path.isdir(os.path.join(model_5zone.experiment_path, i))])
+    assert n_dir == 10
@@ -0,0 +1,116 @@
+import os
+import threading
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+from sinergym.serve import EnvClient, EnvServer, RemoteEnv
+
+
+@pytest.mark.parametrize('unix', [False, True])
+def test_remote_env(env_demo, unix, tmp_path):
+    # Localhost server (free TCP port) or Unix socket
+    server = EnvServer(
+        [env_demo],
+        port=0,
+        unix_path=str(tmp_path / 'sinergym.sock') if unix else None)
+    address = server.start()
+    assert address == server.address
+
+    env = RemoteEnv(address)
+    assert env.observation_space == env_demo.observation_space
+    assert env.action_space == env_demo.action_space
+    assert env.observation_variables == env_demo.get_wrapper_attr(
+        'observation_variables')
+    assert env.workspace_path == env_demo.get_wrapper_attr('workspace_path')
+
+    obs, info = env.reset(seed=0)
+    assert obs.dtype == np.float32
+    assert obs.shape == env.observation_space.shape
+    assert info['timestep'] == 0
+    obs, reward, terminated, truncated, info = env.step(
+        env.action_space.sample())
+    assert obs.shape == env.observation_space.shape
+    assert isinstance(reward, float)
+    assert not terminated and not truncated
+    assert info['timestep'] == 1
+    assert env_demo.get_wrapper_attr('timestep') == 1
+
+    # Without infos
+    env_noinfo = RemoteEnv(address, infos=False)
+    _, _, _, _, info = env_noinfo.step(env.action_space.sample())
+    assert info == {}
+    assert env_demo.get_wrapper_attr('timestep') == 2
+
+    env.close()
+    env_noinfo.close()
+    server.close()
+    if unix:
+        assert not os.path.exists(address)
+
+
+def test_batched_client(env_demo):
+    env_second = gym.make(
+        'Eplus-demo-v1',
+        env_name='TESTSERVE',
+        config_params={'runperiod': (1, 1, 1991, 31, 1, 1991)})
+    server = EnvServer([env_demo, env_second], port=0)
+    client = EnvClient(server.start())
+    assert len(client.spec['envs']) == 2
+
+    obs, infos = client.reset([0, 1], seeds=[0, 1])
+    assert obs.shape == (2, env_demo.observation_space.shape[0])
+    assert [info['timestep'] for info in infos] == [0, 0]
+
+    actions = [client.action_space.sample() for _ in range(2)]
+    obs, rewards, terminated, truncated, infos = client.step([0, 1], actions)
+    assert obs.shape == (2, env_demo.observation_space.shape[0])
+    assert rewards.shape == terminated.shape == truncated.shape == (2,)
+    assert not terminated.any() and not truncated.any()
+    assert [info['timestep'] for info in infos] == [1, 1]
+
+    # Subset of environments, without infos
+    _, _, _, _, infos = client.step([1], actions[:1], infos=False)
+    assert infos is None
+    assert env_demo.get_wrapper_attr('timestep') == 1
+    assert env_second.get_wrapper_attr('timestep') == 2
+
+    # Errors of the server are raised in the client
+    with pytest.raises(RuntimeError):
+        client.step([2], actions[:1])
+    # Connection remains usable
+    _, _, _, _, infos = client.step([0], actions[:1])
+    assert infos[0]['timestep'] == 2
+
+    client.close()
+    server.close()
+
+
+def test_server_stop_connected(env_demo):
+    server = EnvServer([env_demo], port=0)
+    address = server.start()
+    env = RemoteEnv(address)
+    env.reset()
+
+    # Server stops although the client keeps its connection open
+    stopper = threading.Thread(target=server.stop)
+    stopper.start()
+    stopper.join(timeout=10)
+    assert not stopper.is_alive()
+    with pytest.raises(ConnectionError):
+        env.step(env.action_space.sample())
+
+    # Hosted environments are kept and can be served again
+    address = server.start()
+    env = RemoteEnv(address)
+    _, info = env.reset()
+    assert info['timestep'] == 0
+    env.close()
+    server.close()
+
+
+def test_server_exceptions(env_demo):
+    # Hosted environments must have the async interface
+    with pytest.raises(AssertionError):
+        EnvServer([env_demo, gym.make('CartPole-v1')], port=0)
@@ -1,7 +1,13 @@
 import os
+import threading
 
 import pytest
 
+from sinergym.simulators.eplus import EnergyPlus, ExchangeChannel
+from sinergym.simulators.handles import HandleCache
+from sinergym.simulators.pool import SimulatorPool
+from sinergym.simulators.process import SharedMemoryChannel
+
 # ---------------------------------------------------------------------------- #
 #                                 Main methods                                 #
 # ---------------------------------------------------------------------------- #
@@ -22,7 +28,7 @@ def test_simulator(simulator_5zone, pkg_data_path):
     assert simulator_5zone._building_path is None
     assert simulator_5zone._weather_path is None
     assert simulator_5zone._output_path is None
-    assert not hasattr(simulator_5zone, 'progress_bar')
+    assert simulator_5zone.progress_bar is None
 
     # simulation start
     simulator_5zone.start(
@@ -66,8 +72,7 @@ def test_simulator(simulator_5zone, pkg_data_path):
     # first observation
     obs = None
     info = None
-    obs = simulator_5zone.obs_queue.get()
-    info = simulator_5zone.info_queue.get()
+    obs, info = simulator_5zone.channel.get_observation()
     assert len(obs) > 0 and obs is not None
     assert len(info) > 0 and info is not None
 
@@ -83,9 +88,7 @@ def test_simulator(simulator_5zone, pkg_data_path):
 
     # first action
     setpoints = [15.0, 22.5]
-    assert simulator_5zone.act_queue.empty()
-    simulator_5zone.act_queue.put(setpoints, timeout=2)
-    assert not simulator_5zone.act_queue.empty()
+    simulator_5zone.channel.put_action(setpoints)
     setpoints = list(map(lambda x: x + 1, setpoints))
 
     # Check 4 more interactions
@@ -93,21 +96,19 @@ def test_simulator(simulator_5zone, pkg_data_path):
         # Observation and info
         obs = None
         info = None
-        obs = simulator_5zone.obs_queue.get()
-        info = simulator_5zone.info_queue.get()
+        obs, info = simulator_5zone.channel.get_observation()
         assert len(obs) > 0 and obs is not None
         assert len(info) > 0 and info is not None
         # Actions
-        simulator_5zone.act_queue.put(setpoints, timeout=2)
-        assert not simulator_5zone.act_queue.empty()
+        simulator_5zone.channel.put_action(setpoints)
         setpoints = list(map(lambda x: x + 1, setpoints))
 
     # Check early stop
     assert not simulator_5zone.simulation_complete
     simulator_5zone.stop()
-    assert simulator_5zone.obs_queue.empty()
-    assert simulator_5zone.info_queue.empty()
-    assert simulator_5zone.act_queue.empty()
+    assert not simulator_5zone.channel.closed
+    with pytest.raises(TimeoutError):
+        simulator_5zone.channel.get_observation(timeout=0.1)
     assert simulator_5zone.warmup_queue.empty()
     assert simulator_5zone.energyplus_thread is None
     assert not simulator_5zone.warmup_complete
@@ -157,8 +158,7 @@ def test_unknown_handlers(simulator_5zone, pkg_data_path):
     assert simulator_5zone.actuator_handlers is None
     assert simulator_5zone.available_data is None
     # We have false handlers after observation
-    obs = simulator_5zone.obs_queue.get()
-    info = simulator_5zone.info_queue.get()
+    obs, info = simulator_5zone.channel.get_observation()
     assert len(obs) > 0 and obs is not None
     assert len(info) > 0 and info is not None
     # Now system is initialized (and handlers)
@@ -171,3 +171,318 @@ def test_unknown_handlers(simulator_5zone, pkg_data_path):
     assert simulator_5zone.var_handlers['false_variable'] <= 0
     assert simulator_5zone.meter_handlers['false_meter'] <= 0
     assert simulator_5zone.actuator_handlers['false_actuator'] <= 0
+
+
+def test_unknown_time_variables():
+    # Time variables are resolved when simulator is created (fail fast)
+    simulator = EnergyPlus(
+        name='TESTSIMULATOR',
+        time_variables=['month', 'hour'])
+    assert len(simulator._time_accessors) == 2
+    assert all(callable(accessor) for accessor in simulator._time_accessors)
+    with pytest.raises(AssertionError):
+        EnergyPlus(
+            name='TESTSIMULATOR',
+            time_variables=['month', 'false_time_variable'])
+    with pytest.raises(AssertionError):
+        EnergyPlus(
+            name='TESTSIMULATOR',
+            time_variables=['__init__'])
+
+
+@pytest.mark.parametrize('fast_exchange', [True, False])
+def test_fast_exchange(simulator_5zone, pkg_data_path, fast_exchange):
+    simulator_5zone.fast_exchange = fast_exchange
+    simulator_5zone.start(
+        building_path=os.path.join(
+            pkg_data_path,
+            'buildings',
+            '5ZoneAutoDXVAV.epJSON'),
+        weather_path=os.path.join(
+            pkg_data_path,
+            'weather',
+            'USA_IL_Chicago-OHare.Intl.AP.725300_TMY3.epw'),
+        output_path='./Eplus-TESTSIMULATOR/',
+        episode=1)
+    assert simulator_5zone.fast_exchange_bound == fast_exchange
+    if not fast_exchange:
+        assert simulator_5zone._get_variable_value == simulator_5zone.exchange.get_variable_value
+        assert simulator_5zone._set_actuator_value == simulator_5zone.exchange.set_actuator_value
+
+    simulator_5zone.warmup_queue.get()
+    obs, _ = simulator_5zone.channel.get_observation()
+    # Bound functions read the same values than pyenergyplus wrappers
+    state = simulator_5zone.energyplus_state
+    offset = len(simulator_5zone.time_variables)
+    for i, handle in enumerate(simulator_5zone._var_handles):
+        assert obs[offset + i] == simulator_5zone.exchange.get_variable_value(
+            state, handle)
+    offset += len(simulator_5zone._var_handles)
+    for i, handle in enumerate(simulator_5zone._meter_handles):
+        assert obs[offset + i] == simulator_5zone.exchange.get_meter_value(
+            state, handle)
+    simulator_5zone.channel.put_action([15.0, 22.5])
+    obs, _ = simulator_5zone.channel.get_observation()
+    assert obs is not None
+    simulator_5zone.stop()
+
+
+def test_request_variables(simulator_5zone, pkg_data_path):
+    # Original building model has not Output:Variable objects
+    simulator_5zone.request_variables = True
+    simulator_5zone.start(
+        building_path=os.path.join(
+            pkg_data_path,
+            'buildings',
+            '5ZoneAutoDXVAV.epJSON'),
+        weather_path=os.path.join(
+            pkg_data_path,
+            'weather',
+            'USA_IL_Chicago-OHare.Intl.AP.725300_TMY3.epw'),
+        output_path='./Eplus-TESTSIMULATOR/',
+        episode=1)
+    simulator_5zone.warmup_queue.get()
+    obs, _ = simulator_5zone.channel.get_observation()
+    assert obs is not None
+    # Variable handles are available without Output:Variable objects
+    assert all(handle >= 0 for handle in simulator_5zone.var_handlers.values())
+    simulator_5zone.stop()
+
+
+def test_handle_cache(simulator_5zone, pkg_data_path, tmp_path):
+    building_path = os.path.join(
+        pkg_data_path, 'buildings', '5ZoneAutoDXVAV.epJSON')
+    # Handle cache disabled by default
+    assert simulator_5zone.handle_cache is None
+    cache = HandleCache(path=str(tmp_path / 'handles'))
+    # Cache directory is created on first write
+    assert not os.path.exists(cache.path)
+    spec = {'variables': simulator_5zone.variables}
+    key = cache.get_key(building_path, spec)
+    # Key changes with elements requested
+    assert key != cache.get_key(building_path, {})
+    assert cache.get(key) is None
+
+    # First simulation resolves handles and stores them
+    simulator_5zone.handle_cache = cache
+    simulator_5zone.start(
+        building_path=building_path,
+        weather_path=os.path.join(
+            pkg_data_path,
+            'weather',
+            'USA_IL_Chicago-OHare.Intl.AP.725300_TMY3.epw'),
+        output_path='./Eplus-TESTSIMULATOR/',
+        episode=1)
+    simulator_5zone.warmup_queue.get()
+    simulator_5zone.channel.get_observation()
+    simulator_5zone.stop()
+    assert len(os.listdir(cache.path)) == 1
+    data_path = os.path.join(
+        os.path.abspath('.'), 'data_available.txt')
+    data_mtime = os.path.getmtime(data_path)
+
+    # Other simulator (other process or run) reuses them
+    simulator = EnergyPlus(
+        name='TESTCACHE',
+        time_variables=simulator_5zone.time_variables,
+        variables=simulator_5zone.variables,
+        meters=simulator_5zone.meters,
+        actuators=simulator_5zone.actuators,
+        handle_cache=cache.path)
+    simulator.start(
+        building_path=building_path,
+        weather_path=os.path.join(
+            pkg_data_path,
+            'weather',
+            'USA_IL_Chicago-OHare.Intl.AP.725300_TMY3.epw'),
+        output_path='./Eplus-TESTSIMULATOR/',
+        episode=1)
+    simulator.warmup_queue.get()
+    obs, _ = simulator.channel.get_observation()
+    assert obs is not None
+    assert simulator.var_handlers == simulator_5zone.var_handlers
+    assert simulator.actuator_handlers == simulator_5zone.actuator_handlers
+    assert simulator.available_data == simulator_5zone.available_data
+    # data_available.txt is not written again with the same content
+    assert os.path.getmtime(data_path) == data_mtime
+    simulator.stop()
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_handle_cache_not_writable(tmp_path):
+    # Cache directory cannot be created (a file exists in its path)
+    path = tmp_path / 'handles'
+    path.write_text('')
+    cache = HandleCache(path=str(path))
+    cache.store('key', {'var_handlers': {}})
+    assert not cache.writable
+    assert cache.get('key') is None
+
+
+@pytest.mark.parametrize('always_write_actuators', [False, True])
+def test_actuator_writes(
+        simulator_5zone,
+        pkg_data_path,
+        always_write_actuators):
+    simulator_5zone._always_write_mask[:] = always_write_actuators
+    simulator_5zone.start(
+        building_path=os.path.join(
+            pkg_data_path,
+            'buildings',
+            '5ZoneAutoDXVAV.epJSON'),
+        weather_path=os.path.join(
+            pkg_data_path,
+            'weather',
+            'USA_IL_Chicago-OHare.Intl.AP.725300_TMY3.epw'),
+        output_path='./Eplus-TESTSIMULATOR/',
+        episode=1)
+    # Count actuator writes
+    writes = []
+    set_actuator_value = simulator_5zone._set_actuator_value
+
+    def _set_actuator_value(state, handle, value):
+        writes.append((handle, value))
+        set_actuator_value(state, handle, value)
+
+    simulator_5zone._set_actuator_value = _set_actuator_value
+
+    simulator_5zone.warmup_queue.get()
+    simulator_5zone.channel.get_observation()
+    # First action is always written
+    for action, expected_writes in [([15.0, 22.5], 2),
+                                    ([15.0, 22.5], 4 if always_write_actuators else 2),
+                                    ([16.0, 22.5], 6 if always_write_actuators else 3)]:
+        simulator_5zone.channel.put_action(action)
+        simulator_5zone.channel.get_observation()
+        assert len(writes) == expected_writes
+    assert all(isinstance(value, float) for _, value in writes)
+    simulator_5zone.stop()
+
+
+def test_exchange_channel():
+    channel = ExchangeChannel()
+    # Observation is not published yet
+    with pytest.raises(TimeoutError):
+        channel.get_observation(timeout=0.1)
+
+    # Handoff in a thread playing the simulator role
+    def _simulator():
+        for i in range(3):
+            channel.put_observation([i], {'timestep': i})
+            action = channel.get_action()
+            assert action == [i + 10]
+        channel.close()
+
+    thread = threading.Thread(target=_simulator)
+    thread.start()
+    for i in range(3):
+        obs, info = channel.get_observation(timeout=2)
+        assert obs == [i] and info == {'timestep': i}
+        channel.put_action([i + 10])
+    # End of simulation returns None observation and info
+    obs, info = channel.get_observation(timeout=2)
+    assert obs is None and info is None
+    thread.join()
+    assert channel.closed
+
+    # Clear prepares the channel for a new simulation
+    channel.clear()
+    assert not channel.closed
+    with pytest.raises(TimeoutError):
+        channel.get_observation(timeout=0.1)
+
+
+def test_shared_memory_channel():
+    channel = SharedMemoryChannel(obs_size=2, action_size=1)
+    # Observation is not published yet
+    with pytest.raises(TimeoutError):
+        channel.get_observation(timeout=0.1)
+
+    # Handoff in a thread playing the simulator role
+    def _simulator():
+        for i in range(3):
+            channel.put_observation([i, -i], {'time_elapsed(hours)': i * 0.25,
+                                              'month': 1,
+                                              'day': 1,
+                                              'hour': i,
+                                              'is_raining': False})
+            action = channel.get_action()
+            assert action[0] == i + 10
+        channel.header[channel.EXIT_CODE] = 0
+        channel.close()
+
+    thread = threading.Thread(target=_simulator)
+    thread.start()
+    for i in range(3):
+        obs, info = channel.get_observation(timeout=2)
+        assert list(obs) == [i, -i]
+        assert info == {'time_elapsed(hours)': i * 0.25,
+                        'month': 1,
+                        'day': 1,
+                        'hour': i,
+                        'is_raining': False}
+        channel.put_action([i + 10])
+    # End of simulation returns None observation and info
+    obs, info = channel.get_observation(timeout=2)
+    assert obs is None and info is None
+    thread.join()
+    assert channel.closed and channel.exit_code == 0
+
+    # Clear prepares the channel for a new simulation
+    channel.clear()
+    assert not channel.closed and channel.exit_code is None
+    with pytest.raises(TimeoutError):
+        channel.get_observation(timeout=0.1)
+    channel.release()
+
+
+def test_simulator_pool(model_5zone):
+    with pytest.raises(AssertionError):
+        SimulatorPool(max_size=0)
+    pool = SimulatorPool(max_size=2)
+    key_a = SimulatorPool.make_key(
+        '5ZoneAutoDXVAV.epJSON', 'weather_a.epw', None, {
+            'name': 'A', 'actuators': {}})
+    key_b = SimulatorPool.make_key(
+        '5ZoneAutoDXVAV.epJSON', 'weather_b.epw', None, {
+            'name': 'B', 'actuators': {}})
+    # Environment name is not part of the key
+    assert key_a == SimulatorPool.make_key(
+        '5ZoneAutoDXVAV.epJSON', 'weather_a.epw', None, {
+            'name': 'C', 'actuators': {}})
+    assert pool.acquire(key_a) is None
+    simulators = [EnergyPlus(name='TESTSIMULATOR') for _ in range(3)]
+    pool.release(key_a, simulators[0], {'episode_path': 'a'})
+    pool.release(key_b, simulators[1], {'episode_path': 'b'})
+    # Pool is full, least recently released simulator is evicted
+    pool.release(key_b, simulators[2], {'episode_path': 'b'})
+    assert pool.size == 2
+    assert pool.acquire(key_a) is None
+    simulator, context, model = pool.acquire(key_b)
+    assert simulator is simulators[1] and context == {'episode_path': 'b'}
+    assert model is None
+    assert pool.stats == {
+        'size': 1,
+        'max_size': 2,
+        'hits': 1,
+        'misses': 2,
+        'evictions': 1}
+    pool.clear()
+    assert pool.size == 0
+
+    # Episode directories of pooled simulators are protected from rotation
+    # until they are stopped
+    pool.release(key_a, simulators[0], {'episode_path': 'a'}, model_5zone)
+    pool.release(key_b, simulators[1], {'episode_path': 'b'}, model_5zone)
+    assert model_5zone.protected_episode_paths == {'a', 'b'}
+    pool.release(key_b, simulators[2], {'episode_path': 'c'}, model_5zone)
+    assert model_5zone.protected_episode_paths == {'b', 'c'}
+    # Borrowed simulator directory is still protected (borrower unprotects it)
+    _, context, model = pool.acquire(key_b)
+    assert model is model_5zone and context == {'episode_path': 'b'}
+    assert model_5zone.protected_episode_paths == {'b', 'c'}
+    model.unprotect_episode_dir(context['episode_path'])
+    pool.clear()
+    assert model_5zone.protected_episode_paths == set()
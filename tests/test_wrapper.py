@@ -924,6 +924,45 @@ def test_CSVlogger_custom_logger(env_demo, custom_logger_wrapper):
     env.close()
 
 
+def test_timing_wrapper(env_demo):
+    # Timing is disabled by default
+    assert env_demo.get_wrapper_attr('timing_stats')() == {}
+
+    env = TimingWrapper(env=CSVLogger(env=LoggerWrapper(
+        env=NormalizeObservation(env=env_demo))))
+    env.reset()
+    for _ in range(10):
+        env.step(env.action_space.sample())
+    stats = env.get_wrapper_attr('timing_stats')()
+    # Environment phases and wrapper layers (outer to inner)
+    phases = ['reset', 'step', 'action_enqueue', 'simulator_wait', 'reward',
+              'callback_observation', 'callback_action']
+    for phase in phases:
+        assert phase in stats
+    assert stats['reset']['count'] == 1
+    assert stats['step']['count'] == 10
+    assert stats['callback_action']['count'] == 10
+    layers = [phase for phase in stats if phase.startswith('wrapper:')]
+    assert layers == ['wrapper:CSVLogger',
+                      'wrapper:LoggerWrapper',
+                      'wrapper:NormalizeObservation']
+    for layer in layers:
+        assert stats[layer]['count'] == 10
+        assert stats[layer]['mean'] >= stats['step']['mean']
+        assert 'self_mean' in stats[layer]
+    assert stats['step']['p99'] <= stats['step']['max']
+
+    # Episode summary in progress.csv
+    env.reset()
+    with open(env.get_wrapper_attr('progress_file_path'), mode='r', newline='') as csvfile:
+        header = next(csv.reader(csvfile, delimiter=','))
+        assert 'simulator_wait_mean(ms)' in header
+        assert 'wrapper:LoggerWrapper_p99(ms)' in header
+    # Counters are per episode
+    assert env.get_wrapper_attr('timing_stats')()['step']['count'] == 0
+    env.close()
+
+
 def test_logger_exceptions(env_demo):
     # Use a Logger without previous BaseLoggerWrapper child class should raise
     # exception